@@ -1,13 +1,33 @@
 """Human-facing task scheduling layer powered by xnu_sched."""
 
-from human_sched.application.complete_task import CompleteTask
-from human_sched.application.create_life_area import CreateLifeArea
-from human_sched.application.create_task import CreateTask
-from human_sched.application.pause_task import PauseTask
-from human_sched.application.resume_task import ResumeTask
-from human_sched.application.runtime import Dispatch, HumanTaskScheduler
-from human_sched.application.what_next import WhatNext
-from human_sched.domain.urgency import UrgencyTier
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from human_sched.application.complete_task import CompleteTask
+    from human_sched.application.create_life_area import CreateLifeArea
+    from human_sched.application.create_task import CreateTask
+    from human_sched.application.pause_task import PauseTask
+    from human_sched.application.resume_task import ResumeTask
+    from human_sched.application.runtime import Dispatch, HumanTaskScheduler
+    from human_sched.application.what_next import WhatNext
+    from human_sched.domain.urgency import UrgencyTier
+
+# Exports resolve on first attribute access (PEP 562) so `import human_sched`
+# does not pull in the scheduler runtime.
+_LAZY_EXPORTS = {
+    "CompleteTask": "human_sched.application.complete_task",
+    "CreateLifeArea": "human_sched.application.create_life_area",
+    "CreateTask": "human_sched.application.create_task",
+    "Dispatch": "human_sched.application.runtime",
+    "HumanTaskScheduler": "human_sched.application.runtime",
+    "PauseTask": "human_sched.application.pause_task",
+    "ResumeTask": "human_sched.application.resume_task",
+    "UrgencyTier": "human_sched.domain.urgency",
+    "WhatNext": "human_sched.application.what_next",
+}
 
 __all__ = [
     "CompleteTask",
@@ -20,3 +40,16 @@ __all__ = [
     "UrgencyTier",
     "WhatNext",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
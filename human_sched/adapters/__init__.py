@@ -1,15 +1,44 @@
 """Infrastructure adapters for the human scheduler layer."""
 
-from human_sched.adapters.terminal_notifier import TerminalNotifier
-from human_sched.adapters.time_scale import (
-    TimeScaleAdapter,
-    TimeScaleConfig,
-    load_time_scale_config,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from human_sched.adapters.terminal_notifier import TerminalNotifier
+    from human_sched.adapters.time_scale import (
+        TimeScaleAdapter,
+        TimeScaleConfig,
+        load_time_scale_config,
+        read_env_file,
+    )
+
+_LAZY_EXPORTS = {
+    "TerminalNotifier": "human_sched.adapters.terminal_notifier",
+    "TimeScaleAdapter": "human_sched.adapters.time_scale",
+    "TimeScaleConfig": "human_sched.adapters.time_scale",
+    "load_time_scale_config": "human_sched.adapters.time_scale",
+    "read_env_file": "human_sched.adapters.time_scale",
+}
 
 __all__ = [
     "TerminalNotifier",
     "TimeScaleAdapter",
     "TimeScaleConfig",
     "load_time_scale_config",
+    "read_env_file",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,254 @@
+"""Hierarchical hashed timing wheel driven by a single worker thread.
+
+Follows the Varghese/Lauck scheme: level 0 holds timers due within one wheel
+revolution, higher levels hold coarser slots that cascade down as time
+advances. Every slot is a circular doubly-linked list so cancellation through
+the returned node handle is O(1).
+"""
+
+from __future__ import annotations
+
+import logging
+from threading import Condition
+import time
+from typing import Any, Callable
+
+_log = logging.getLogger(__name__)
+
+
+class WheelNode:
+    """Handle for one pending timer; doubles as its own list link."""
+
+    __slots__ = ("deadline_tick", "callback", "args", "prev", "next")
+
+    def __init__(
+        self,
+        deadline_tick: int = 0,
+        callback: Callable[..., Any] | None = None,
+        args: tuple[Any, ...] = (),
+    ) -> None:
+        self.deadline_tick = deadline_tick
+        self.callback = callback
+        self.args = args
+        self.prev: WheelNode | None = None
+        self.next: WheelNode | None = None
+
+    @property
+    def is_linked(self) -> bool:
+        return self.prev is not None
+
+
+def _new_slot() -> WheelNode:
+    sentinel = WheelNode()
+    sentinel.prev = sentinel
+    sentinel.next = sentinel
+    return sentinel
+
+
+class TimingWheel:
+    """Timer facility with O(1) schedule/cancel and one thread for all timers."""
+
+    __slots__ = (
+        "_tick_ns",
+        "_wheel_size",
+        "_levels",
+        "_slots",
+        "_start_ns",
+        "_current_tick",
+        "_pending",
+        "_running",
+        "_cond",
+    )
+
+    def __init__(self, tick_ms: int = 50, wheel_size: int = 512, levels: int = 4) -> None:
+        if tick_ms <= 0:
+            raise ValueError("tick_ms must be > 0")
+        if wheel_size < 2:
+            raise ValueError("wheel_size must be >= 2")
+        if levels < 1:
+            raise ValueError("levels must be >= 1")
+
+        self._tick_ns = tick_ms * 1_000_000
+        self._wheel_size = wheel_size
+        self._levels = levels
+        self._slots = [[_new_slot() for _ in range(wheel_size)] for _ in range(levels)]
+        self._start_ns = time.monotonic_ns()
+        self._current_tick = 0
+        self._pending = 0
+        self._running = True
+        self._cond = Condition()
+
+    @property
+    def pending_count(self) -> int:
+        with self._cond:
+            return self._pending
+
+    def schedule(self, delay_ns: int, callback: Callable[..., Any], *args: Any) -> WheelNode:
+        """Fire ``callback(*args)`` on the worker thread after ``delay_ns``."""
+        with self._cond:
+            now_ns = time.monotonic_ns() - self._start_ns
+            if self._pending == 0:
+                self._skip_idle_ticks(now_ns)
+            due_ns = now_ns + max(0, delay_ns)
+            # Round up so a timer never fires before its deadline.
+            deadline_tick = max(self._current_tick + 1, -(-due_ns // self._tick_ns))
+            node = WheelNode(deadline_tick, callback, args)
+            self._insert(node)
+            self._pending += 1
+            self._cond.notify()
+            return node
+
+    def cancel(self, node: WheelNode) -> bool:
+        """Unlink a pending timer. Returns False if it already fired or was cancelled."""
+        with self._cond:
+            if not node.is_linked:
+                return False
+            self._unlink(node)
+            self._pending -= 1
+            return True
+
+    def reschedule(self, node: WheelNode, delay_ns: int, *args: Any) -> bool:
+        """Move a pending timer to a new deadline (and args) in place.
+
+        Returns False, leaving the node untouched, if it already fired or was
+        cancelled; the caller should ``schedule`` a fresh timer instead.
+        """
+        with self._cond:
+            if not node.is_linked:
+                return False
+            self._unlink(node)
+            now_ns = time.monotonic_ns() - self._start_ns
+            if self._pending == 1:
+                # This node was the only timer; nothing else sits in the wheel.
+                self._skip_idle_ticks(now_ns)
+            due_ns = now_ns + max(0, delay_ns)
+            node.deadline_tick = max(self._current_tick + 1, -(-due_ns // self._tick_ns))
+            node.args = args
+            self._insert(node)
+            self._cond.notify()
+            return True
+
+    def stop(self) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+
+    def run(self) -> None:
+        """Worker loop: sleep until the next possible deadline and fire due timers."""
+        while True:
+            with self._cond:
+                if not self._running:
+                    return
+                target_tick = (time.monotonic_ns() - self._start_ns) // self._tick_ns
+                if self._pending == 0:
+                    # Nothing to cascade or fire; jump straight to the present.
+                    self._current_tick = max(self._current_tick, target_tick)
+                    self._cond.wait()
+                    if self._pending == 0:
+                        self._skip_idle_ticks(time.monotonic_ns() - self._start_ns)
+                    continue
+                wake_tick = self._next_event_tick()
+                if target_tick < wake_tick:
+                    # schedule() notifies, so an earlier timer cuts this sleep short.
+                    wake_ns = self._start_ns + wake_tick * self._tick_ns
+                    self._cond.wait(max(0, wake_ns - time.monotonic_ns()) / 1e9)
+                    continue
+                due = self._advance_to(target_tick)
+
+            for node in due:
+                callback = node.callback
+                if callback is None:
+                    continue
+                try:
+                    callback(*node.args)
+                except Exception:
+                    # Every timer shares this thread; one failure must not stop the rest.
+                    _log.exception("Timer callback %r failed", callback)
+
+    # ------------------------------------------------------------------
+    # Wheel internals (caller holds the condition lock)
+    # ------------------------------------------------------------------
+    def _skip_idle_ticks(self, now_ns: int) -> None:
+        """Jump an empty wheel to the present so nothing walks the idle ticks."""
+        self._current_tick = max(self._current_tick, now_ns // self._tick_ns)
+
+    def _next_event_tick(self) -> int:
+        """Earliest tick that can fire a timer or needs a cascade.
+
+        Timers above level 0 cannot come due before the next level-0 wrap,
+        so idle revolutions cost one wakeup instead of one per tick.
+        """
+        size = self._wheel_size
+        level0 = self._slots[0]
+        tick = self._current_tick + 1
+        while tick % size:
+            sentinel = level0[tick % size]
+            if sentinel.next is not sentinel:
+                return tick
+            tick += 1
+        return tick
+
+    def _advance_to(self, target_tick: int) -> list[WheelNode]:
+        due: list[WheelNode] = []
+        size = self._wheel_size
+        while self._current_tick < target_tick and self._pending > 0:
+            tick = self._current_tick + 1
+            self._current_tick = tick
+            self._cascade(tick)
+
+            sentinel = self._slots[0][tick % size]
+            node = sentinel.next
+            while node is not sentinel:
+                following = node.next
+                self._unlink(node)
+                self._pending -= 1
+                due.append(node)
+                node = following
+        self._current_tick = max(self._current_tick, target_tick)
+        return due
+
+    def _cascade(self, tick: int) -> None:
+        size = self._wheel_size
+        for level in range(self._levels - 1, 0, -1):
+            span = size**level
+            if tick % span:
+                continue
+            sentinel = self._slots[level][(tick // span) % size]
+            node = sentinel.next
+            sentinel.next = sentinel
+            sentinel.prev = sentinel
+            while node is not sentinel:
+                following = node.next
+                node.prev = None
+                node.next = None
+                self._insert(node)
+                node = following
+
+    def _insert(self, node: WheelNode) -> None:
+        size = self._wheel_size
+        remaining = node.deadline_tick - self._current_tick
+        level = 0
+        span = 1
+        while level < self._levels - 1 and remaining >= span * size:
+            level += 1
+            span *= size
+        # Timers beyond the top level park in its farthest slot and re-cascade.
+        slot_tick = min(node.deadline_tick, self._current_tick + span * (size - 1))
+        sentinel = self._slots[level][(slot_tick // span) % size]
+
+        tail = sentinel.prev
+        assert tail is not None
+        node.prev = tail
+        node.next = sentinel
+        tail.next = node
+        sentinel.prev = node
+
+    @staticmethod
+    def _unlink(node: WheelNode) -> None:
+        prev = node.prev
+        following = node.next
+        assert prev is not None and following is not None
+        prev.next = following
+        following.prev = prev
+        node.prev = None
+        node.next = None
@@ -1,23 +1,45 @@
-"""Terminal notification adapter using timer threads + stdout/bell."""
+"""Terminal notification adapter using a timing wheel + stdout/bell."""
 
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from threading import Lock, Timer
-from uuid import uuid4
+from itertools import count
+import os
+import sys
+from threading import Lock, Thread
+import time
+from typing import Sequence
 
+from human_sched.adapters._timing_wheel import TimingWheel, WheelNode
 from human_sched.ports.notifications import NotificationEventType, NotificationPort
 
 
 class TerminalNotifier(NotificationPort):
     """Simple notification adapter for local terminal usage."""
 
-    __slots__ = ("_enable_bell", "_timers", "_lock")
+    __slots__ = (
+        "_enable_bell",
+        "_timers",
+        "_lock",
+        "_wheel",
+        "_wheel_thread",
+        "_counter",
+        "_id_prefix",
+    )
+
+    # ``_lock`` only pairs schedule's insert with cancel's pop; the fire path
+    # relies on the GIL making ``dict.pop`` atomic.
 
     def __init__(self, enable_bell: bool = False) -> None:
         self._enable_bell = enable_bell
-        self._timers: dict[str, Timer] = {}
+        self._timers: dict[str, WheelNode] = {}
         self._lock = Lock()
+        self._wheel = TimingWheel()
+        self._wheel_thread: Thread | None = None
+        # count.__next__ is atomic under the GIL; the pid keeps ids distinct
+        # across processes when reading interleaved logs.
+        self._counter = count()
+        self._id_prefix = f"n{os.getpid()}-"
 
     def schedule_notification(
         self,
@@ -25,26 +47,53 @@ class TerminalNotifier(NotificationPort):
         message: str,
         event_type: NotificationEventType,
     ) -> str:
-        if at.tzinfo is None:
-            at = at.replace(tzinfo=timezone.utc)
-
-        notification_id = str(uuid4())
-        delay = max(0.0, (at - datetime.now(timezone.utc)).total_seconds())
-
-        timer = Timer(delay, self._fire_scheduled, args=(notification_id, message, event_type))
-        timer.daemon = True
+        notification_id = f"{self._id_prefix}{next(self._counter):x}"
+        delay = max(0.0, self._timestamp(at) - time.time())
 
         with self._lock:
-            self._timers[notification_id] = timer
+            if self._wheel_thread is None:
+                self._wheel_thread = Thread(target=self._wheel.run, daemon=True)
+                self._wheel_thread.start()
+            node = self._wheel.schedule(
+                int(delay * 1_000_000_000),
+                self._fire_scheduled,
+                notification_id,
+                message,
+                event_type,
+            )
+            self._timers[notification_id] = node
+            if not node.is_linked:
+                # Already fired before the insert landed; don't leave it behind.
+                self._timers.pop(notification_id, None)
 
-        timer.start()
         return notification_id
 
+    def reschedule_notification(
+        self,
+        notification_id: str,
+        at: datetime,
+        message: str,
+        event_type: NotificationEventType,
+    ) -> str:
+        delay = max(0.0, self._timestamp(at) - time.time())
+        with self._lock:
+            node = self._timers.get(notification_id)
+            if node is not None and self._wheel.reschedule(
+                node,
+                int(delay * 1_000_000_000),
+                notification_id,
+                message,
+                event_type,
+            ):
+                return notification_id
+        # Already fired or unknown: fall back to a fresh timer.
+        return self.schedule_notification(at, message, event_type)
+
     def cancel_notification(self, notification_id: str) -> None:
         with self._lock:
-            timer = self._timers.pop(notification_id, None)
-        if timer is not None:
-            timer.cancel()
+            node = self._timers.pop(notification_id, None)
+        if node is not None:
+            self._wheel.cancel(node)
 
     def notify_immediately(self, message: str, event_type: NotificationEventType) -> None:
         now = datetime.now(timezone.utc).isoformat(timespec="seconds")
@@ -52,12 +101,32 @@ class TerminalNotifier(NotificationPort):
         if self._enable_bell:
             print("\a", end="")
 
+    def notify_batch(
+        self,
+        notifications: Sequence[tuple[str, NotificationEventType]],
+    ) -> None:
+        if not notifications:
+            return
+        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        lines = [f"[{now}] [{event_type.value}] {message}\n" for message, event_type in notifications]
+        if self._enable_bell:
+            lines.append("\a")
+        sys.stdout.write("".join(lines))
+
     def _fire_scheduled(
         self,
         notification_id: str,
         message: str,
         event_type: NotificationEventType,
     ) -> None:
-        with self._lock:
-            self._timers.pop(notification_id, None)
+        # Lock-free on the wheel thread: ids are never reused or re-inserted,
+        # and dict.pop is atomic under the GIL.
+        self._timers.pop(notification_id, None)
         self.notify_immediately(message, event_type)
+
+    @staticmethod
+    def _timestamp(at: datetime) -> float:
+        # Naive datetimes are UTC here; timestamp() alone would assume local time.
+        if at.tzinfo is None:
+            return at.replace(tzinfo=timezone.utc).timestamp()
+        return at.timestamp()
@@ -4,13 +4,32 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+import os
 from pathlib import Path
-from typing import Callable
+import re
+import time
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
 
 
 DEFAULT_TIME_SCALE_HOURS_PER_US = 0.00025
 DEFAULT_MAX_CATCHUP_TICKS = 4
 
+_POSIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+
+# One pass over the whole file: optional ``export``, KEY, ``=``, VALUE, with
+# surrounding whitespace trimmed and ``#`` comment lines skipped.
+_ENV_LINE_RE = re.compile(
+    rb"^[^\S\n]*+(?!#)(?:export [^\S\n]*)?([^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$",
+    re.MULTILINE,
+)
+
+# Parsed env files keyed by path -> (st_mtime_ns, st_size, parsed values).
+_ENV_CACHE: dict[str, tuple[int, int, dict[str, str]]] = {}
+
 
 @dataclass(frozen=True)
 class TimeScaleConfig:
@@ -23,7 +42,20 @@ class TimeScaleConfig:
 class TimeScaleAdapter:
     """Converts between scheduler microseconds and wall-clock time."""
 
-    __slots__ = ("_config", "_wall_epoch", "_now_provider")
+    __slots__ = (
+        "_config",
+        "_wall_epoch",
+        "_now_provider",
+        "_us_per_second",
+        "_epoch_ts_us",
+        "_mono_to_posix_us",
+        "_wall_us_per_scheduler_us",
+        "_scheduler_us_per_wall_us",
+        "_system_clock",
+        "_real_time",
+        "_hours_per_us",
+        "_us_per_hour",
+    )
 
     def __init__(
         self,
@@ -41,6 +73,8 @@ class TimeScaleAdapter:
         self._config = config
         self._wall_epoch = epoch
         self._now_provider = now_provider or (lambda: datetime.now(timezone.utc))
+        self._system_clock = now_provider is None
+        self._init_derived()
 
     @property
     def config(self) -> TimeScaleConfig:
@@ -59,42 +93,135 @@ class TimeScaleAdapter:
     def hours_to_us(self, hours: float) -> int:
         if hours < 0:
             raise ValueError("hours must be >= 0")
-        return int(round(hours / self._config.hours_per_us))
+        return int(hours * self._us_per_hour + 0.5)
 
     def us_to_hours(self, microseconds: int) -> float:
-        return microseconds * self._config.hours_per_us
+        return microseconds * self._hours_per_us
 
     def scheduler_us_for_wall(self, wall_time: datetime) -> int:
         if wall_time.tzinfo is None:
             wall_time = wall_time.replace(tzinfo=timezone.utc)
-        delta = wall_time - self._wall_epoch
-        hours = delta.total_seconds() / 3600.0
-        if hours <= 0:
-            return 0
-        return self.hours_to_us(hours)
+        return self._scheduler_us_for_aware_wall(wall_time)
 
     def now_scheduler_us(self) -> int:
-        return self.scheduler_us_for_wall(self.now_wallclock())
+        if self._system_clock:
+            # Default clock: integer epoch math, no datetime allocation.
+            wall_us = self._posix_now_us() - self._epoch_ts_us
+            if wall_us <= 0:
+                return 0
+            if self._real_time:
+                return wall_us
+            return int(wall_us * self._scheduler_us_per_wall_us + 0.5)
+        # now_wallclock() is always tz-aware, so skip the tzinfo check.
+        return self._scheduler_us_for_aware_wall(self.now_wallclock())
+
+    def _scheduler_us_for_aware_wall(self, wall_time: datetime) -> int:
+        delta = wall_time - self._wall_epoch
+        seconds = delta.days * 86400 + delta.seconds + delta.microseconds * 1e-6
+        if seconds <= 0:
+            return 0
+        return int(seconds * self._us_per_second + 0.5)
 
     def scheduler_us_to_wall(self, scheduler_us: int) -> datetime:
         if scheduler_us < 0:
             raise ValueError("scheduler_us must be >= 0")
-        hours = self.us_to_hours(scheduler_us)
-        return self._wall_epoch + timedelta(hours=hours)
-
-    def __getstate__(self) -> dict:
-        return {"_config": self._config, "_wall_epoch": self._wall_epoch}
-
-    def __setstate__(self, state: dict) -> None:
-        self._config = state["_config"]
-        self._wall_epoch = state["_wall_epoch"]
+        ts_us = self._epoch_ts_us + int(scheduler_us * self._wall_us_per_scheduler_us + 0.5)
+        return datetime.fromtimestamp(ts_us / 1_000_000, tz=self._wall_epoch.tzinfo)
+
+    def delay_us_from_scheduler_us(self, scheduler_us: int) -> int:
+        """Wall-clock microseconds from now until ``scheduler_us`` (negative once past)."""
+        if self._real_time:
+            due_ts_us = self._epoch_ts_us + scheduler_us
+        else:
+            due_ts_us = self._epoch_ts_us + int(scheduler_us * self._wall_us_per_scheduler_us + 0.5)
+        if self._system_clock:
+            return due_ts_us - self._delay_base_us()
+        return due_ts_us - (self.now_wallclock() - _POSIX_EPOCH) // _ONE_US
+
+    def _posix_now_us(self) -> int:
+        """Wall-clock POSIX microseconds; re-anchors the monotonic delay base."""
+        posix_us = time.time_ns() // 1000
+        self._mono_to_posix_us = posix_us - time.monotonic_ns() // 1000
+        return posix_us
+
+    def _delay_base_us(self) -> int:
+        """The last wall reading advanced by the monotonic clock.
+
+        Timer delays measured from here agree with scheduler time (which stays
+        on the wall clock, e.g. across a suspend) but ignore clock steps that
+        land between reading the clock and arming a timer.
+        """
+        return time.monotonic_ns() // 1000 + self._mono_to_posix_us
+
+    def scheduler_us_for_walls(self, walls: ArrayLike) -> NDArray[Any]:
+        """Vectorized ``scheduler_us_for_wall`` for UTC ``datetime64`` arrays.
+
+        Requires numpy; returns an ``int64`` array.
+        """
+        numpy = _require_numpy()
+        wall_us = numpy.asarray(walls, dtype="datetime64[us]").view("i8") - self._epoch_ts_us
+        scheduler_us = numpy.floor(wall_us * self._scheduler_us_per_wall_us + 0.5).astype("i8")
+        return numpy.where(wall_us > 0, scheduler_us, 0)
+
+    def scheduler_us_to_walls(self, scheduler_us: ArrayLike) -> NDArray[Any]:
+        """Vectorized ``scheduler_us_to_wall`` returning UTC ``datetime64[us]``.
+
+        Requires numpy.
+        """
+        numpy = _require_numpy()
+        values = numpy.asarray(scheduler_us, dtype="i8")
+        if (values < 0).any():
+            raise ValueError("scheduler_us must be >= 0")
+        wall_offsets = numpy.floor(values * self._wall_us_per_scheduler_us + 0.5).astype("i8")
+        return (self._epoch_ts_us + wall_offsets).view("datetime64[us]")
+
+    def __getstate__(self) -> tuple[float, int, int]:
+        # Flat primitives keep the pickle small and skip the dataclass walk.
+        return (self._config.hours_per_us, self._config.max_catchup_ticks, self._epoch_ts_us)
+
+    def __setstate__(self, state: tuple[float, int, int] | dict) -> None:
+        if isinstance(state, dict):
+            # Snapshots written before the tuple format.
+            self._config = state["_config"]
+            self._wall_epoch = state["_wall_epoch"]
+        else:
+            hours_per_us, max_catchup_ticks, epoch_ts_us = state
+            self._config = TimeScaleConfig(
+                hours_per_us=hours_per_us,
+                max_catchup_ticks=max_catchup_ticks,
+            )
+            self._wall_epoch = _POSIX_EPOCH + timedelta(microseconds=epoch_ts_us)
         self._now_provider = lambda: datetime.now(timezone.utc)
+        self._system_clock = True
+        self._init_derived()
+
+    def _init_derived(self) -> None:
+        """Precompute conversion factors and the epoch as POSIX microseconds."""
+        hours_per_us = self._config.hours_per_us
+        self._hours_per_us = hours_per_us
+        self._us_per_hour = 1.0 / hours_per_us
+        self._us_per_second = 1.0 / (hours_per_us * 3600.0)
+        self._wall_us_per_scheduler_us = hours_per_us * 3_600_000_000.0
+        self._scheduler_us_per_wall_us = 1.0 / self._wall_us_per_scheduler_us
+        # Unscaled configs keep scheduler and wall microseconds in lockstep.
+        self._real_time = abs(self._wall_us_per_scheduler_us - 1.0) < 1e-12
+        self._epoch_ts_us = (self._wall_epoch - _POSIX_EPOCH) // _ONE_US
+        self._mono_to_posix_us = time.time_ns() // 1000 - time.monotonic_ns() // 1000
+
+
+def _require_numpy() -> Any:
+    # Imported on first batch call so plain scheduler and GUI imports skip numpy.
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - numpy is an optional dependency
+        raise RuntimeError("Batch time-scale conversion requires numpy to be installed.") from None
+    return numpy
 
 
 def load_time_scale_config(env_file: str = ".env") -> TimeScaleConfig:
     """Load time-scale configuration from env file, with safe fallbacks."""
 
-    env = _parse_env_file(env_file)
+    env = read_env_file(env_file)
 
     hours_per_us = _env_float(
         env,
@@ -115,28 +242,36 @@ def load_time_scale_config(env_file: str = ".env") -> TimeScaleConfig:
     )
 
 
-def _parse_env_file(path: str) -> dict[str, str]:
-    env_path = Path(path)
-    if not env_path.exists():
+def read_env_file(path: str) -> dict[str, str]:
+    """Parse ``KEY=VALUE`` lines from ``path``; a missing file yields ``{}``.
+
+    Re-parsed only when the file's mtime or size changes; each caller gets its
+    own dict.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        _ENV_CACHE.pop(path, None)
         return {}
 
+    cached = _ENV_CACHE.get(path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        # Callers get their own copy so the cached parse cannot be mutated.
+        return dict(cached[2])
+
     env: dict[str, str] = {}
-    for line in env_path.read_text(encoding="utf-8").splitlines():
-        text = line.strip()
-        if not text or text.startswith("#"):
+    # Match on raw bytes; only the captured key/value get decoded.
+    data = Path(path).read_bytes()
+    for match in _ENV_LINE_RE.finditer(data):
+        key, value = match.groups()
+        if not key:
             continue
-        if text.startswith("export "):
-            text = text[7:].strip()
-        if "=" not in text:
-            continue
-        key, value = text.split("=", 1)
-        key = key.strip()
-        value = value.strip()
-        if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+        if len(value) >= 2 and value[:1] == value[-1:] and value[:1] in (b'"', b"'"):
             value = value[1:-1]
-        if key:
-            env[key] = value
-    return env
+        env[key.decode("utf-8")] = value.decode("utf-8")
+
+    _ENV_CACHE[path] = (stat.st_mtime_ns, stat.st_size, env)
+    return dict(env)
 
 
 def _env_float(env: dict[str, str], key: str, default: float, minimum: float) -> float:
@@ -9,6 +9,8 @@ from human_sched.domain.task import Task
 class CompleteTask:
     """Application use case for permanently completing tasks."""
 
+    __slots__ = ("_scheduler",)
+
     def __init__(self, scheduler: HumanTaskScheduler) -> None:
         self._scheduler = scheduler
 
@@ -9,6 +9,8 @@ from human_sched.domain.life_area import LifeArea
 class CreateLifeArea:
     """Application use case for creating a life area."""
 
+    __slots__ = ("_scheduler",)
+
     def __init__(self, scheduler: HumanTaskScheduler) -> None:
         self._scheduler = scheduler
 
@@ -11,6 +11,8 @@ from human_sched.domain.urgency import UrgencyTier
 class CreateTask:
     """Application use case for creating runnable tasks."""
 
+    __slots__ = ("_scheduler",)
+
     def __init__(self, scheduler: HumanTaskScheduler) -> None:
         self._scheduler = scheduler
 
@@ -9,6 +9,8 @@ from human_sched.domain.task import Task
 class PauseTask:
     """Application use case for pausing the current or specific task."""
 
+    __slots__ = ("_scheduler",)
+
     def __init__(self, scheduler: HumanTaskScheduler) -> None:
         self._scheduler = scheduler
 
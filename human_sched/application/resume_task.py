@@ -9,6 +9,8 @@ from human_sched.domain.task import Task
 class ResumeTask:
     """Application use case for waking a paused task."""
 
+    __slots__ = ("_scheduler",)
+
     def __init__(self, scheduler: HumanTaskScheduler) -> None:
         self._scheduler = scheduler
 
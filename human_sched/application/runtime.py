@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 import json
 import logging
+import os
 import pickle
+import sys
 from pathlib import Path
-from threading import RLock, Timer
-from typing import Any, Callable
+import threading
+from threading import Lock, RLock
+from typing import Any, Callable, Iterator, TypeVar
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    orjson = None
 
 from xnu_sched.clutch import SchedClutch
 from xnu_sched.constants import (
@@ -25,6 +35,7 @@ import xnu_sched.thread as _thread_mod
 from xnu_sched.thread import Thread, ThreadGroup, ThreadState
 from xnu_sched.timeshare import update_thread_cpu_usage
 
+from human_sched.adapters._timing_wheel import TimingWheel, WheelNode
 from human_sched.adapters.terminal_notifier import TerminalNotifier
 from human_sched.adapters.time_scale import (
     TimeScaleAdapter,
@@ -37,8 +48,22 @@ from human_sched.ports.notifications import NotificationEventType, NotificationP
 
 _log = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 _ENGINE_STATE_VERSION = 1
 _ENGINE_STATE_FILENAME = "engine_state.pkl"
+_LIFE_AREAS_FILENAME = "life_areas.json"
+_TASKS_FILENAME = "tasks.json"
+# Changed JSON rows are appended here between full-table compactions.
+_JOURNAL_FILENAME = "journal.ndjson"
+_JOURNAL_COMPACT_RATIO = 4
+_JOURNAL_COMPACT_MIN_BYTES = 64 * 1024
+# Focus-block and tick timers tolerate coarse resolution at human timescales.
+_TIMER_WHEEL_TICK_MS = 100
+# Long-lived sessions only ever read the tail of the engine's trace/switch logs.
+_SCHED_LOG_MAXLEN = 4096
+# With timers enabled, mutations within this window share one state write.
+_PERSIST_DEBOUNCE_US = 100_000
 
 
 @dataclass(slots=True)
@@ -51,10 +76,68 @@ class Dispatch:
     focus_block_hours: float
     reason: str
 
+    def snapshot(self) -> Dispatch:
+        """Detached copy, for keeping a result refilled by ``what_next_into``."""
+        return Dispatch(
+            self.task,
+            self.life_area,
+            self.urgency_tier,
+            self.focus_block_hours,
+            self.reason,
+        )
+
+
+@dataclass(slots=True)
+class DispatchSnapshot:
+    """Active dispatch state captured under the scheduler lock."""
+
+    now_us: int
+    quantum_end_us: int
+    active_task: Task | None
+    active_thread: Thread | None
+    last_switch_reason: str | None
+    last_switch_timestamp_us: int | None
+
+
+def _encode_json(payload: Any) -> bytes:
+    """Compact, key-sorted UTF-8 JSON; orjson when installed, else the stdlib."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(
+        payload,
+        separators=(",", ":"),
+        sort_keys=True,
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def _row_id(row: dict[str, Any]) -> int:
+    return row["id"]
+
+
+def _entry_generation(entry: dict[str, Any]) -> int:
+    # Journal lines written before generations existed count as generation 0.
+    generation = entry.get("gen")
+    return generation if isinstance(generation, int) else 0
+
+
+@dataclass(slots=True)
+class _PersistedState:
+    """Serialized state captured under the scheduler lock, written after it."""
+
+    generation: int
+    life_areas: list[dict[str, Any]]
+    tasks: list[dict[str, Any]]
+    engine_state: bytes | None
+
 
 class HumanTaskScheduler:
     """Single-CPU human task scheduler powered by the XNU Clutch engine."""
 
+    # fsync persisted files and their directory; harnesses that can afford to
+    # lose the last write on power loss may turn this off for throughput.
+    _DURABLE_WRITES = True
+
     __slots__ = (
         "scheduler",
         "pset",
@@ -64,16 +147,39 @@ class HumanTaskScheduler:
         "max_catchup_ticks",
         "life_areas_by_id",
         "_life_areas_by_name",
+        "_life_area_keys",
         "tasks_by_id",
+        "_live_tasks_by_id",
+        "_life_areas_snapshot",
+        "_tasks_snapshot",
+        "_tasks_by_tid",
+        "_thread_index",
         "_lock",
+        "_dispatch_seq",
+        "_pending_notifications",
+        "_has_windowed_tasks",
         "_enable_timers",
+        "_timer_wheel",
+        "_timer_thread",
         "_quantum_timer",
+        "_quantum_generation",
         "_tick_timer",
+        "_tick_generation",
         "_quantum_notification_id",
         "_tick_notification_id",
         "_last_tick_us",
+        "_next_tick_us",
         "_persistence_dir",
-        "_suspend_persistence",
+        "_persist_lock",
+        "_persist_dirty",
+        "_task_payloads",
+        "_persist_flush_timer",
+        "_persist_generation",
+        "_persisted_generation",
+        "_persisted_rows",
+        "_journal_bytes",
+        "_snapshot_bytes",
+        "_compaction_generation",
     )
 
     def __init__(
@@ -97,56 +203,187 @@ class HumanTaskScheduler:
 
         self.pset = ProcessorSet(pset_id=0, num_cpus=1)
         self.processor = self.pset.processors[0]
-        self.scheduler = Scheduler(self.pset, trace=True)
+        self.scheduler = Scheduler(self.pset, trace=True, log_maxlen=_SCHED_LOG_MAXLEN)
 
         self.life_areas_by_id: dict[int, LifeArea] = {}
         self._life_areas_by_name: dict[str, LifeArea] = {}
+        # life_area_id -> its key in _life_areas_by_name, so existing names
+        # are never re-normalized.
+        self._life_area_keys: dict[int, str] = {}
         self.tasks_by_id: dict[int, Task] = {}
+        # Subset of tasks_by_id whose thread has not terminated.
+        self._live_tasks_by_id: dict[int, Task] = {}
+        # Immutable list_* results; writers clear them, readers rebuild lazily.
+        self._life_areas_snapshot: tuple[LifeArea, ...] | None = None
+        self._tasks_snapshot: tuple[Task, ...] | None = None
+        # Dense tid-indexed mirror of tasks_by_id for dispatch-path lookups.
+        self._tasks_by_tid: list[Task | None] = []
+        # tid -> position in scheduler.all_threads, for O(1) swap-removal.
+        self._thread_index: dict[int, int] = {}
 
         self._lock = RLock()
+        # Seqlock counter: odd while a writer holds ``_lock``.
+        self._dispatch_seq = 0
+        # Notifier calls made under the lock, delivered once it is released.
+        self._pending_notifications: list[tuple[str, Any, Any]] = []
+        # Conservative until the first window sweep proves otherwise.
+        self._has_windowed_tasks = True
         self._enable_timers = enable_timers
-        self._quantum_timer: Timer | None = None
-        self._tick_timer: Timer | None = None
+        self._timer_wheel = TimingWheel(tick_ms=_TIMER_WHEEL_TICK_MS)
+        self._timer_thread: threading.Thread | None = None
+        self._quantum_timer: WheelNode | None = None
+        # Bumped on every quantum arm/cancel; a timer only fires for its own generation.
+        self._quantum_generation = 0
+        self._tick_timer: WheelNode | None = None
+        self._tick_generation = 0
         self._quantum_notification_id: str | None = None
         self._tick_notification_id: str | None = None
         self._last_tick_us = 0
+        # Always _last_tick_us + SCHED_TICK_INTERVAL_US; set via _set_last_tick_unlocked.
+        self._next_tick_us = SCHED_TICK_INTERVAL_US
         self._persistence_dir = (
             Path(persistence_dir).expanduser().resolve()
             if persistence_dir
             else None
         )
-        self._suspend_persistence = False
+        # File writes serialize here, not on the scheduler lock.
+        self._persist_lock = Lock()
+        self._persist_dirty = False
+        # task_id -> (field key, row); rows are shared with the journal diff, never mutated.
+        self._task_payloads: dict[int, tuple[tuple[Any, ...], dict[str, Any]]] = {}
+        self._persist_flush_timer: WheelNode | None = None
+        self._persist_generation = 0
+        self._persisted_generation = 0
+        # Rows last written per table; None until the first compaction.
+        self._persisted_rows: dict[str, dict[int, dict[str, Any]]] | None = None
+        self._journal_bytes = 0
+        self._snapshot_bytes = 0
+        # Stamped on the tables and every journal line; None until the first
+        # compaction reads the latest one back from disk.
+        self._compaction_generation: int | None = None
 
         if self._persistence_dir is not None:
             self._persistence_dir.mkdir(parents=True, exist_ok=True)
-            self._load_persisted_state_unlocked()
+            with self._write_locked():
+                self._load_persisted_state_unlocked()
 
-        self._arm_tick_timer()
+        with self._write_locked():
+            self._arm_tick_timer()
+
+    # ------------------------------------------------------------------
+    # Locking
+    # ------------------------------------------------------------------
+    @contextmanager
+    def _write_locked(self) -> Iterator[None]:
+        """Hold the scheduler lock and mark the dispatch sequence as in flight.
+
+        The outermost writer also snapshots dirty state for persistence and,
+        after the lock is released, writes it and hands queued notifier calls
+        to the notifier.
+        """
+        pending: list[tuple[str, Any, Any]] = []
+        persisted: _PersistedState | None = None
+        try:
+            with self._lock:
+                if self._dispatch_seq & 1:
+                    # Re-entered from an outer writer; it owns the sequence bump.
+                    yield
+                    return
+                self._dispatch_seq += 1
+                try:
+                    yield
+                finally:
+                    self._dispatch_seq += 1
+                    pending = self._pending_notifications
+                    self._pending_notifications = []
+                    persisted = self._take_persisted_state_unlocked()
+        finally:
+            try:
+                if persisted is not None:
+                    self._write_persisted_state(persisted)
+            finally:
+                if pending:
+                    self._flush_notifications(pending)
+
+    def _queue_notification(self, message: str, event_type: NotificationEventType) -> None:
+        self._pending_notifications.append(("immediate", message, event_type))
+
+    def _queue_notification_cancel(self, notification_id: str) -> None:
+        self._pending_notifications.append(("cancel", notification_id, None))
+
+    def _flush_notifications(self, pending: list[tuple[str, Any, Any]]) -> None:
+        """Deliver queued notifier calls, batching consecutive immediate messages."""
+        notify_batch = getattr(self.notifier, "notify_batch", None)
+        batch: list[tuple[str, NotificationEventType]] = []
+        for op, first, second in pending:
+            if op == "immediate":
+                batch.append((first, second))
+                continue
+            if batch:
+                self._deliver_immediate_batch(batch, notify_batch)
+                batch = []
+            self.notifier.cancel_notification(first)
+        if batch:
+            self._deliver_immediate_batch(batch, notify_batch)
+
+    def _deliver_immediate_batch(
+        self,
+        batch: list[tuple[str, NotificationEventType]],
+        notify_batch: Callable[[list[tuple[str, NotificationEventType]]], None] | None,
+    ) -> None:
+        if notify_batch is not None:
+            notify_batch(batch)
+            return
+        for message, event_type in batch:
+            self.notifier.notify_immediately(message, event_type)
 
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
     def close(self) -> None:
         """Stop any background timers and pending notifications."""
-        with self._lock:
+        with self._write_locked():
             self._cancel_quantum_artifacts(reset_quantum_end=True)
             self._cancel_tick_artifacts()
+            self._timer_wheel.stop()
+        self.flush_persistence()
+
+    def flush_persistence(self) -> None:
+        """Write any state changes still waiting on the debounce timer."""
+        with self._lock:
+            if self._persist_flush_timer is not None:
+                self._timer_wheel.cancel(self._persist_flush_timer)
+                self._persist_flush_timer = None
+            if not self._persist_dirty:
+                return
+            self._persist_dirty = False
+            persisted = self._snapshot_persisted_state_unlocked()
+        self._write_persisted_state(persisted)
 
     # ------------------------------------------------------------------
     # CRUD-style API
     # ------------------------------------------------------------------
     def create_life_area(self, name: str) -> LifeArea:
-        with self._lock:
-            key = self._normalize_name(name)
-            if key in self._life_areas_by_name:
-                return self._life_areas_by_name[key]
+        key = self._normalize_name(name)
+        # Existing names need no lock: a single dict read is atomic, and any
+        # insert of this key happens under the lock re-checked below.
+        existing = self._life_areas_by_name.get(key)
+        if existing is not None:
+            return existing
+
+        with self._write_locked():
+            existing = self._life_areas_by_name.get(key)
+            if existing is not None:
+                return existing
 
             tg = ThreadGroup(name)
             SchedClutch(tg, num_clusters=1)
             life_area = LifeArea(name=name, thread_group=tg)
 
             self.life_areas_by_id[life_area.life_area_id] = life_area
+            self._life_areas_snapshot = None
             self._life_areas_by_name[key] = life_area
+            self._life_area_keys[life_area.life_area_id] = key
             self.scheduler.all_thread_groups.append(tg)
             self._persist_state_unlocked()
             return life_area
@@ -158,13 +395,13 @@ class HumanTaskScheduler:
         name: str,
     ) -> LifeArea:
         """Rename an existing life area."""
-        with self._lock:
+        with self._write_locked():
             area = self._resolve_life_area(life_area)
             new_name = name.strip()
             if not new_name:
                 raise ValueError("Life area name is required")
 
-            old_key = self._normalize_name(area.name)
+            old_key = self._life_area_keys[area.life_area_id]
             new_key = self._normalize_name(new_name)
 
             if new_key != old_key and new_key in self._life_areas_by_name:
@@ -176,6 +413,7 @@ class HumanTaskScheduler:
             if new_key != old_key:
                 self._life_areas_by_name.pop(old_key, None)
                 self._life_areas_by_name[new_key] = area
+                self._life_area_keys[area.life_area_id] = new_key
 
             self._persist_state_unlocked()
             return area
@@ -191,7 +429,7 @@ class HumanTaskScheduler:
         notes: str = "",
         start_runnable: bool = True,
     ) -> Task:
-        with self._lock:
+        with self._write_locked():
             now_us = self._now_us()
             self._apply_lazy_catchup(now_us)
 
@@ -220,9 +458,11 @@ class HumanTaskScheduler:
                 notes=notes,
             )
 
-            self.tasks_by_id[task.task_id] = task
+            self._register_task_unlocked(task)
             area.task_ids.add(task.task_id)
-            self.scheduler.all_threads.append(thread)
+            if start_minute is not None:
+                self._has_windowed_tasks = True
+            self._track_thread_unlocked(thread)
 
             if start_runnable:
                 preempt_proc = self.scheduler.thread_setrun(
@@ -248,7 +488,7 @@ class HumanTaskScheduler:
         active_window_start_local: str | None = None,
         active_window_end_local: str | None = None,
     ) -> Task:
-        with self._lock:
+        with self._write_locked():
             now_us = self._now_us()
             self._apply_lazy_catchup(now_us)
 
@@ -261,6 +501,8 @@ class HumanTaskScheduler:
 
             task.active_window_start_minute = start_minute
             task.active_window_end_minute = end_minute
+            if start_minute is not None:
+                self._has_windowed_tasks = True
 
             self._enforce_task_windows_unlocked(now_us)
             self._persist_state_unlocked()
@@ -268,24 +510,23 @@ class HumanTaskScheduler:
 
     def delete_life_area(self, life_area: LifeArea | int | str) -> tuple[LifeArea, int]:
         """Delete a life area and all tasks currently assigned to it."""
-        with self._lock:
+        with self._write_locked():
             now_us = self._now_us()
             self._apply_lazy_catchup(now_us)
 
             area = self._resolve_life_area(life_area)
-            tasks = [
+            # The single CPU's active thread is the only candidate for RUNNING.
+            active = self.processor.active_thread
+            running_task = self._task_for_tid(active.tid) if active is not None else None
+            if running_task is not None and running_task.life_area is not area:
+                running_task = None
+
+            # Block the running task last so dispatch never picks a doomed sibling.
+            ordered_tasks = [
                 task
-                for task_id in list(area.task_ids)
-                if (task := self.tasks_by_id.get(task_id)) is not None
+                for task_id in area.task_ids
+                if (task := self._task_for_tid(task_id)) is not None and task is not running_task
             ]
-
-            running_task: Task | None = None
-            for task in tasks:
-                if task.thread.state == ThreadState.RUNNING:
-                    running_task = task
-                    break
-
-            ordered_tasks = [task for task in tasks if task is not running_task]
             if running_task is not None:
                 ordered_tasks.append(running_task)
 
@@ -306,21 +547,25 @@ class HumanTaskScheduler:
 
                 thread.state = ThreadState.TERMINATED
 
-                area.task_ids.discard(task.task_id)
-                self.tasks_by_id.pop(task.task_id, None)
-                if thread in self.scheduler.all_threads:
-                    self.scheduler.all_threads.remove(thread)
+                self._unregister_task_unlocked(task.task_id)
+                self._forget_thread_unlocked(thread)
 
+            area.task_ids.clear()
             self.life_areas_by_id.pop(area.life_area_id, None)
-            self._life_areas_by_name.pop(self._normalize_name(area.name), None)
-            if area.thread_group in self.scheduler.all_thread_groups:
+            self._life_areas_snapshot = None
+            key = self._life_area_keys.pop(area.life_area_id, None)
+            if key is not None:
+                self._life_areas_by_name.pop(key, None)
+            try:
                 self.scheduler.all_thread_groups.remove(area.thread_group)
+            except ValueError:
+                pass
 
             self._persist_state_unlocked()
             return area, len(ordered_tasks)
 
     def pause_task(self, task_id: int | None = None) -> Task | None:
-        with self._lock:
+        with self._write_locked():
             now_us = self._now_us()
             self._apply_lazy_catchup(now_us)
 
@@ -353,7 +598,7 @@ class HumanTaskScheduler:
             return task
 
     def resume_task(self, task_id: int) -> Task:
-        with self._lock:
+        with self._write_locked():
             now_us = self._now_us()
             self._apply_lazy_catchup(now_us)
 
@@ -364,17 +609,20 @@ class HumanTaskScheduler:
                 raise ValueError(f"Task {task_id} is completed and cannot be resumed")
 
             if thread.state == ThreadState.WAITING:
-                preempt_proc = self.scheduler.thread_wakeup(thread, now_us)
-                self._handle_preemption_request(
-                    preempt_proc,
-                    now_us,
-                    trigger_when_idle=False,
-                )
+                self._resume_task_unlocked(task, now_us)
                 self._persist_state_unlocked()
             return task
 
+    def _resume_task_unlocked(self, task: Task, now_us: int) -> None:
+        preempt_proc = self.scheduler.thread_wakeup(task.thread, now_us)
+        self._handle_preemption_request(
+            preempt_proc,
+            now_us,
+            trigger_when_idle=False,
+        )
+
     def complete_task(self, task_id: int | None = None) -> Task | None:
-        with self._lock:
+        with self._write_locked():
             now_us = self._now_us()
             self._apply_lazy_catchup(now_us)
 
@@ -382,23 +630,28 @@ class HumanTaskScheduler:
             if task is None:
                 return None
 
-            thread = task.thread
-            if thread.state == ThreadState.TERMINATED:
+            if task.thread.state == ThreadState.TERMINATED:
                 return task
 
-            if thread.state == ThreadState.RUNNING:
-                new_thread = self.scheduler.thread_block(thread, self.processor, now_us)
-                if new_thread is not None:
-                    self._arm_quantum_for_active(now_us)
-                else:
-                    self._cancel_quantum_artifacts(reset_quantum_end=True)
-            elif thread.state == ThreadState.RUNNABLE:
-                self.scheduler.thread_remove(thread, now_us)
-
-            thread.state = ThreadState.TERMINATED
+            self._complete_task_unlocked(task, now_us)
             self._persist_state_unlocked()
             return task
 
+    def _complete_task_unlocked(self, task: Task, now_us: int) -> None:
+        thread = task.thread
+        if thread.state == ThreadState.RUNNING:
+            new_thread = self.scheduler.thread_block(thread, self.processor, now_us)
+            if new_thread is not None:
+                self._arm_quantum_for_active(now_us)
+            else:
+                self._cancel_quantum_artifacts(reset_quantum_end=True)
+        elif thread.state == ThreadState.RUNNABLE:
+            self.scheduler.thread_remove(thread, now_us)
+
+        thread.state = ThreadState.TERMINATED
+        # Completed tasks stay listed, but the engine no longer tracks their thread.
+        self._retire_task_unlocked(task)
+
     def change_task_urgency(
         self,
         task_id: int,
@@ -411,7 +664,7 @@ class HumanTaskScheduler:
         the new priority, WAITING threads simply get updated params.
         Raises ``ValueError`` for TERMINATED (completed) tasks.
         """
-        with self._lock:
+        with self._write_locked():
             now_us = self._now_us()
             self._apply_lazy_catchup(now_us)
 
@@ -481,7 +734,7 @@ class HumanTaskScheduler:
 
     def rename_task(self, task_id: int, *, title: str) -> Task:
         """Rename an existing task."""
-        with self._lock:
+        with self._write_locked():
             task = self._require_task(task_id)
             new_title = title.strip()
             if not new_title:
@@ -519,7 +772,7 @@ class HumanTaskScheduler:
 
     def delete_task(self, task_id: int) -> Task:
         """Delete a task from scheduler state."""
-        with self._lock:
+        with self._write_locked():
             now_us = self._now_us()
             self._apply_lazy_catchup(now_us)
 
@@ -537,16 +790,15 @@ class HumanTaskScheduler:
 
             thread.state = ThreadState.TERMINATED
             task.life_area.task_ids.discard(task.task_id)
-            self.tasks_by_id.pop(task.task_id, None)
-            if thread in self.scheduler.all_threads:
-                self.scheduler.all_threads.remove(thread)
+            self._unregister_task_unlocked(task.task_id)
+            self._forget_thread_unlocked(thread)
 
             self._persist_state_unlocked()
             return task
 
     def reset_simulation(self) -> int:
         """Reset dispatch state and re-queue unfinished tasks from a clean baseline."""
-        with self._lock:
+        with self._write_locked():
             now_us = self._now_us()
             self._apply_tick_catchup(now_us)
             self._cancel_quantum_artifacts(reset_quantum_end=True)
@@ -559,7 +811,7 @@ class HumanTaskScheduler:
                 self.scheduler.thread_block(active, self.processor, now_us)
 
             reset_task_count = 0
-            for task in self.tasks_by_id.values():
+            for task in self._live_tasks_by_id.values():
                 thread = task.thread
 
                 if thread.state == ThreadState.TERMINATED:
@@ -585,7 +837,7 @@ class HumanTaskScheduler:
 
             self.processor.active_thread = None
             self.processor.quantum_end = 0
-            self._last_tick_us = now_us
+            self._set_last_tick_unlocked(now_us)
             self._persist_state_unlocked()
             return reset_task_count
 
@@ -594,49 +846,127 @@ class HumanTaskScheduler:
     # ------------------------------------------------------------------
     def what_next(self) -> Dispatch | None:
         """Atomic select+dispatch recommendation matching XNU semantics."""
-        with self._lock:
+        return self._what_next(None)
+
+    def what_next_into(self, out: Dispatch) -> Dispatch | None:
+        """Like ``what_next`` but refills ``out`` in place instead of allocating.
+
+        Meant for pollers that consume each answer before asking again; use
+        ``Dispatch.snapshot()`` to keep one across calls.
+        """
+        return self._what_next(out)
+
+    def _what_next(self, out: Dispatch | None) -> Dispatch | None:
+        dispatch = self._what_next_running_fast_path(out)
+        if dispatch is not None:
+            return dispatch
+
+        with self._write_locked():
             now_us = self._now_us()
             self._apply_lazy_catchup(now_us)
 
-            active = self.processor.active_thread
+            proc = self.processor
+            active = proc.active_thread
             reason: str
 
             if active is None:
-                trace_before = len(self.scheduler.trace_log)
-                switch_before = len(self.scheduler.processor_switch_log)
+                engine = self.scheduler
+                select_before = engine.select_trace_count
+                switch_before = engine.processor_switch_count
 
                 self._try_dispatch_idle(
-                    self.processor,
+                    proc,
                     now_us,
                     reason="what_next requested next runnable task",
                 )
-                active = self.processor.active_thread
+                active = proc.active_thread
                 if active is None:
-                    self._persist_state_unlocked()
                     return None
 
-                reason = self._derive_selection_reason(trace_before, switch_before)
+                reason = self._derive_selection_reason(select_before, switch_before)
+                # Starting a focus block is the only change what_next itself makes.
+                # Expiry and window catch-up persist themselves; skipped ticks are
+                # replayed from the saved _last_tick_us after a restart.
+                self._persist_state_unlocked()
             else:
                 reason = "Task already running; focus block still active."
 
-            task = self.tasks_by_id.get(active.tid)
+            task = self._task_for_tid(active.tid)
             if task is None:
-                self._persist_state_unlocked()
                 return None
 
-            remaining_us = max(0, self.processor.quantum_end - now_us)
+            remaining_us = max(0, proc.quantum_end - now_us)
             if remaining_us == 0:
                 remaining_us = active.quantum_remaining
 
-            self._persist_state_unlocked()
-            return Dispatch(
-                task=task,
-                life_area=task.life_area,
-                urgency_tier=task.urgency_tier,
-                focus_block_hours=self.time_scale.us_to_hours(remaining_us),
-                reason=reason,
+            return self._fill_dispatch(
+                out,
+                task,
+                task.life_area,
+                task.urgency_tier,
+                self.time_scale.us_to_hours(remaining_us),
+                reason,
             )
 
+    def _what_next_running_fast_path(self, out: Dispatch | None) -> Dispatch | None:
+        """Answer without the lock when a focus block is running and nothing is due.
+
+        Snapshots dispatch state between two reads of ``_dispatch_seq``; any
+        concurrent writer, due tick, expired quantum or window-managed task
+        sends the caller down the locked path instead.
+        """
+        seq = self._dispatch_seq
+        if seq & 1 or self._has_windowed_tasks:
+            return None
+
+        active = self.processor.active_thread
+        quantum_end = self.processor.quantum_end
+        next_tick_us = self._next_tick_us
+        if active is None or quantum_end <= 0:
+            return None
+
+        now_us = self._now_us()
+        if now_us > quantum_end or now_us >= next_tick_us:
+            return None
+
+        task = self._task_for_tid(active.tid)
+        if task is None:
+            return None
+        life_area = task.life_area
+        urgency_tier = task.urgency_tier
+        remaining_us = quantum_end - now_us
+        if remaining_us == 0:
+            remaining_us = active.quantum_remaining
+
+        if self._dispatch_seq != seq:
+            return None
+        return self._fill_dispatch(
+            out,
+            task,
+            life_area,
+            urgency_tier,
+            self.time_scale.us_to_hours(remaining_us),
+            "Task already running; focus block still active.",
+        )
+
+    @staticmethod
+    def _fill_dispatch(
+        out: Dispatch | None,
+        task: Task,
+        life_area: LifeArea,
+        urgency_tier: UrgencyTier,
+        focus_block_hours: float,
+        reason: str,
+    ) -> Dispatch:
+        if out is None:
+            return Dispatch(task, life_area, urgency_tier, focus_block_hours, reason)
+        out.task = task
+        out.life_area = life_area
+        out.urgency_tier = urgency_tier
+        out.focus_block_hours = focus_block_hours
+        out.reason = reason
+        return out
+
     # ------------------------------------------------------------------
     # Internal scheduler orchestration
     # ------------------------------------------------------------------
@@ -644,72 +974,77 @@ class HumanTaskScheduler:
         return self.time_scale.now_scheduler_us()
 
     def _apply_lazy_catchup(self, now_us: int) -> None:
-        self._apply_tick_catchup(now_us)
-        self._enforce_task_windows_unlocked(now_us)
+        if now_us >= self._next_tick_us:
+            self._apply_tick_catchup(now_us)
+        if self._has_windowed_tasks:
+            self._enforce_task_windows_unlocked(now_us)
 
+        # Common case: no focus block, or it has not ended yet.
+        quantum_end = self.processor.quantum_end
+        if quantum_end <= 0 or now_us <= quantum_end:
+            return
         active = self.processor.active_thread
         if active is None:
             return
-        if self.processor.quantum_end <= 0:
-            return
-        if now_us <= self.processor.quantum_end:
-            return
 
         # Missed focus-block expiration: catch up using quantum-expiry semantics
         # instead of force-blocking the active thread.
-        old_thread = active
-        new_thread = self.scheduler.thread_quantum_expire(self.processor, now_us)
+        self._expire_quantum(active, now_us)
+        self._persist_state_unlocked()
+
+    def _expire_quantum(self, old_thread: Thread, timestamp: int) -> None:
+        """Run quantum expiry for the active thread and tell the user the outcome."""
+        new_thread = self.scheduler.thread_quantum_expire(self.processor, timestamp)
 
         if self.processor.active_thread is not None:
-            self._arm_quantum_for_active(now_us)
+            self._arm_quantum_for_active(timestamp)
         else:
             self._cancel_quantum_artifacts(reset_quantum_end=True)
 
         if new_thread is None:
-            self.notifier.notify_immediately(
+            self._queue_notification(
                 "No runnable tasks remain after focus-block re-evaluation.",
                 NotificationEventType.QUANTUM_EXPIRE,
             )
-            self._persist_state_unlocked()
             return
 
-        new_task = self.tasks_by_id.get(new_thread.tid)
-        old_task = self.tasks_by_id.get(old_thread.tid)
+        new_task = self._task_for_tid(new_thread.tid)
+        old_task = self._task_for_tid(old_thread.tid)
 
         if new_thread is old_thread:
             label = new_task.title if new_task is not None else old_thread.name
-            self.notifier.notify_immediately(
+            self._queue_notification(
                 f"Keep going on '{label}' — still the best use of your time.",
                 NotificationEventType.QUANTUM_EXPIRE,
             )
-            self._persist_state_unlocked()
             return
 
         old_label = old_task.title if old_task is not None else old_thread.name
         new_label = new_task.title if new_task is not None else new_thread.name
-        self.notifier.notify_immediately(
+        self._queue_notification(
             f"Switch to '{new_label}' — focus block ended for '{old_label}'.",
             NotificationEventType.QUANTUM_EXPIRE,
         )
-        self._persist_state_unlocked()
 
     def _apply_tick_catchup(self, now_us: int) -> None:
-        if now_us <= self._last_tick_us:
-            return
-
-        elapsed = now_us - self._last_tick_us
-        due_ticks = elapsed // SCHED_TICK_INTERVAL_US
-        if due_ticks <= 0:
+        # Nearly every entry lands between ticks; settle that with one compare.
+        tick_us = self._next_tick_us
+        if now_us < tick_us:
             return
 
-        to_apply = min(due_ticks, self.max_catchup_ticks)
-        for _ in range(to_apply):
-            tick_us = self._last_tick_us + SCHED_TICK_INTERVAL_US
+        remaining = self.max_catchup_ticks
+        while remaining > 0 and now_us >= tick_us:
             self.scheduler.sched_tick(tick_us)
-            self._last_tick_us = tick_us
+            self._set_last_tick_unlocked(tick_us)
+            tick_us += SCHED_TICK_INTERVAL_US
+            remaining -= 1
 
         self._arm_tick_timer()
 
+    def _set_last_tick_unlocked(self, tick_us: int) -> None:
+        self._last_tick_us = tick_us
+        self._next_tick_us = tick_us + SCHED_TICK_INTERVAL_US
+
     def _handle_preemption_request(
         self,
         preempt_proc: Processor | None,
@@ -734,10 +1069,10 @@ class HumanTaskScheduler:
             and new_active is not None
             and new_active is not old_active
         ):
-            old_task = self.tasks_by_id.get(old_active.tid)
-            new_task = self.tasks_by_id.get(new_active.tid)
+            old_task = self._task_for_tid(old_active.tid)
+            new_task = self._task_for_tid(new_active.tid)
             if old_task is not None and new_task is not None:
-                self.notifier.notify_immediately(
+                self._queue_notification(
                     f"Urgent: '{new_task.title}' should preempt '{old_task.title}'.",
                     NotificationEventType.PREEMPTION,
                 )
@@ -763,15 +1098,15 @@ class HumanTaskScheduler:
             )
             return
 
-        if old_thread.computation_epoch > 0:
-            cpu_time = timestamp - old_thread.computation_epoch
+        computation_epoch = old_thread.computation_epoch
+        if computation_epoch > 0:
+            cpu_time = timestamp - computation_epoch
             old_thread.total_cpu_us += cpu_time
             old_thread.computation_epoch = 0
 
-            if old_thread.thread_group.sched_clutch is not None:
-                cbg = old_thread.thread_group.sched_clutch.sc_clutch_groups[
-                    old_thread.th_sched_bucket
-                ]
+            clutch = old_thread.thread_group.sched_clutch
+            if clutch is not None:
+                cbg = clutch.sc_clutch_groups[old_thread.th_sched_bucket]
                 update_thread_cpu_usage(old_thread, cpu_time, cbg)
 
         keep_quantum = (
@@ -799,7 +1134,7 @@ class HumanTaskScheduler:
         )
 
         if chose_prev and new_thread is old_thread:
-            self.scheduler.thread_dispatch(
+            self._dispatch_and_arm(
                 proc,
                 old_thread,
                 old_thread,
@@ -809,22 +1144,20 @@ class HumanTaskScheduler:
                     f"{old_thread.name} remained best eligible thread"
                 ),
             )
-            self._arm_quantum_for_active(timestamp)
             return
 
         if new_thread is not None:
             self.scheduler.thread_setrun(old_thread, timestamp, options=SCHED_HEADQ)
-            self.scheduler.thread_dispatch(
+            self._dispatch_and_arm(
                 proc,
                 old_thread,
                 new_thread,
                 timestamp,
                 reason=f"preemption: {preemption_reason}",
             )
-            self._arm_quantum_for_active(timestamp)
             return
 
-        self.scheduler.thread_dispatch(
+        self._dispatch_and_arm(
             proc,
             old_thread,
             old_thread,
@@ -834,7 +1167,6 @@ class HumanTaskScheduler:
                 "better runnable replacement was selected"
             ),
         )
-        self._arm_quantum_for_active(timestamp)
 
     def _try_dispatch_idle(self, proc: Processor, timestamp: int, *, reason: str) -> None:
         selected, _ = self.scheduler.thread_select(proc, timestamp)
@@ -842,158 +1174,216 @@ class HumanTaskScheduler:
             self._cancel_quantum_artifacts(reset_quantum_end=True)
             return
 
-        self.scheduler.thread_dispatch(
+        self._dispatch_and_arm(
             proc,
             None,
             selected,
             timestamp,
             reason=reason,
         )
-        self._arm_quantum_for_active(timestamp)
+
+    def _dispatch_and_arm(
+        self,
+        proc: Processor,
+        old_thread: Thread | None,
+        new_thread: Thread,
+        timestamp: int,
+        *,
+        reason: str,
+    ) -> None:
+        """Context-switch ``proc`` to ``new_thread`` and arm its focus block."""
+        self.scheduler.thread_dispatch(proc, old_thread, new_thread, timestamp, reason=reason)
+        self._arm_quantum(new_thread, timestamp)
 
     def _arm_quantum_for_active(self, dispatch_timestamp: int) -> None:
         active = self.processor.active_thread
         if active is None:
             self._cancel_quantum_artifacts(reset_quantum_end=True)
             return
+        self._arm_quantum(active, dispatch_timestamp)
 
-        if active.quantum_remaining <= 0:
+    def _arm_quantum(self, active: Thread, dispatch_timestamp: int) -> None:
+        quantum_remaining = active.quantum_remaining
+        if quantum_remaining <= 0:
             active.reset_quantum()
+            quantum_remaining = active.quantum_remaining
 
-        quantum_end = dispatch_timestamp + active.quantum_remaining
+        quantum_end = dispatch_timestamp + quantum_remaining
         self.processor.quantum_end = quantum_end
 
         if not self._enable_timers:
             return
 
-        self._cancel_quantum_artifacts(reset_quantum_end=False)
-        task = self.tasks_by_id.get(active.tid)
+        # Replace rather than cancel+schedule: the notification and wheel node are
+        # moved to the new deadline in place when the notifier supports it.
+        self._quantum_generation += 1
+        generation = self._quantum_generation
+        task = self._task_for_tid(active.tid)
         task_label = task.title if task is not None else active.name
 
         due_wall = self.time_scale.scheduler_us_to_wall(quantum_end)
-        self._quantum_notification_id = self.notifier.schedule_notification(
-            due_wall,
-            f"Focus block ended for '{task_label}'. Re-evaluating now.",
-            NotificationEventType.QUANTUM_EXPIRE,
-        )
+        message = f"Focus block ended for '{task_label}'. Re-evaluating now."
+        previous_id = self._quantum_notification_id
+        if previous_id is None:
+            self._quantum_notification_id = self.notifier.schedule_notification(
+                due_wall,
+                message,
+                NotificationEventType.QUANTUM_EXPIRE,
+            )
+        else:
+            self._quantum_notification_id = self._reschedule_notification(
+                previous_id,
+                due_wall,
+                message,
+                NotificationEventType.QUANTUM_EXPIRE,
+            )
 
-        delay_seconds = max(
-            0.0,
-            (due_wall - self.time_scale.now_wallclock()).total_seconds(),
-        )
-        self._quantum_timer = Timer(delay_seconds, self._on_quantum_timer, args=(active.tid, quantum_end))
-        self._quantum_timer.daemon = True
-        self._quantum_timer.start()
+        delay_us = self.time_scale.delay_us_from_scheduler_us(quantum_end)
+        timer = self._quantum_timer
+        if timer is not None and self._timer_wheel.reschedule(timer, max(0, delay_us) * 1000, generation):
+            return
+        self._quantum_timer = self._schedule_timer(delay_us, self._on_quantum_timer, generation)
+
+    def _reschedule_notification(
+        self,
+        notification_id: str,
+        at: datetime,
+        message: str,
+        event_type: NotificationEventType,
+    ) -> str:
+        reschedule = getattr(self.notifier, "reschedule_notification", None)
+        if reschedule is not None:
+            return reschedule(notification_id, at, message, event_type)
+        self._queue_notification_cancel(notification_id)
+        return self.notifier.schedule_notification(at, message, event_type)
+
+    def _on_quantum_timer(self, expected_generation: int) -> None:
+        with self._write_locked():
+            if self._quantum_generation != expected_generation:
+                return
 
-    def _on_quantum_timer(self, expected_tid: int, expected_quantum_end: int) -> None:
-        with self._lock:
             now_us = self._now_us()
             self._apply_tick_catchup(now_us)
 
             active = self.processor.active_thread
             if active is None:
                 return
-            if active.tid != expected_tid:
-                return
-            if self.processor.quantum_end != expected_quantum_end:
-                return
-
-            old_thread = active
-            new_thread = self.scheduler.thread_quantum_expire(self.processor, expected_quantum_end)
-
-            if self.processor.active_thread is not None:
-                self._arm_quantum_for_active(expected_quantum_end)
-            else:
-                self._cancel_quantum_artifacts(reset_quantum_end=True)
-
-            if new_thread is None:
-                self.notifier.notify_immediately(
-                    "No runnable tasks remain after focus-block re-evaluation.",
-                    NotificationEventType.QUANTUM_EXPIRE,
-                )
-                return
-
-            new_task = self.tasks_by_id.get(new_thread.tid)
-            old_task = self.tasks_by_id.get(old_thread.tid)
-
-            if new_thread is old_thread:
-                label = new_task.title if new_task is not None else old_thread.name
-                self.notifier.notify_immediately(
-                    f"Keep going on '{label}' — still the best use of your time.",
-                    NotificationEventType.QUANTUM_EXPIRE,
-                )
-                return
-
-            old_label = old_task.title if old_task is not None else old_thread.name
-            new_label = new_task.title if new_task is not None else new_thread.name
-            self.notifier.notify_immediately(
-                f"Switch to '{new_label}' — focus block ended for '{old_label}'.",
-                NotificationEventType.QUANTUM_EXPIRE,
-            )
+            self._expire_quantum(active, self.processor.quantum_end)
 
     def _arm_tick_timer(self) -> None:
-        if not self._enable_timers:
+        next_tick_us = self._prepare_tick_arm_unlocked()
+        if next_tick_us is None:
             return
+        self._tick_notification_id, self._tick_timer = self._start_tick_artifacts(next_tick_us)
 
+    def _prepare_tick_arm_unlocked(self) -> int | None:
+        """Drop the current tick artifacts and return the next tick to arm, if any."""
+        if not self._enable_timers:
+            return None
         self._cancel_tick_artifacts()
-        next_tick_us = self._last_tick_us + SCHED_TICK_INTERVAL_US
+        return self._next_tick_us
 
-        due_wall = self.time_scale.scheduler_us_to_wall(next_tick_us)
-        self._tick_notification_id = self.notifier.schedule_notification(
-            due_wall,
+    def _start_tick_artifacts(self, next_tick_us: int) -> tuple[str, WheelNode]:
+        notification_id = self.notifier.schedule_notification(
+            self.time_scale.scheduler_us_to_wall(next_tick_us),
             "Scheduler maintenance tick executed.",
             NotificationEventType.SCHED_TICK,
         )
-
-        delay_seconds = max(
-            0.0,
-            (due_wall - self.time_scale.now_wallclock()).total_seconds(),
+        timer = self._schedule_timer(
+            self.time_scale.delay_us_from_scheduler_us(next_tick_us),
+            self._on_tick_timer,
+            next_tick_us,
         )
-        self._tick_timer = Timer(delay_seconds, self._on_tick_timer, args=(next_tick_us,))
-        self._tick_timer.daemon = True
-        self._tick_timer.start()
+        return notification_id, timer
 
-    def _on_tick_timer(self, expected_tick_us: int) -> None:
+    def _install_tick_artifacts(self, next_tick_us: int, generation: int) -> None:
+        """Arm the next tick outside the lock, keeping it only if nothing re-armed meanwhile."""
+        notification_id, timer = self._start_tick_artifacts(next_tick_us)
         with self._lock:
+            if self._tick_generation == generation:
+                self._tick_notification_id = notification_id
+                self._tick_timer = timer
+                return
+        self._timer_wheel.cancel(timer)
+        self.notifier.cancel_notification(notification_id)
+
+    def _schedule_timer(
+        self,
+        delay_us: int,
+        callback: Callable[..., None],
+        *args: Any,
+    ) -> WheelNode:
+        """Arm a one-shot timer on the shared wheel, starting its worker lazily."""
+        if self._timer_thread is None:
+            self._timer_thread = threading.Thread(
+                target=self._timer_wheel.run,
+                name="human-sched-timers",
+                daemon=True,
+            )
+            self._timer_thread.start()
+        return self._timer_wheel.schedule(max(0, delay_us) * 1000, callback, *args)
+
+    def _on_tick_timer(self, expected_tick_us: int) -> None:
+        next_tick_us: int | None = None
+        with self._write_locked():
             now_us = self._now_us()
             if expected_tick_us <= self._last_tick_us:
                 return
             if now_us + 1 < expected_tick_us:
-                self._arm_tick_timer()
-                return
+                next_tick_us = self._prepare_tick_arm_unlocked()
+            else:
+                self.scheduler.sched_tick(expected_tick_us)
+                self._set_last_tick_unlocked(expected_tick_us)
+                self._enforce_task_windows_unlocked(now_us)
+                next_tick_us = self._prepare_tick_arm_unlocked()
+            generation = self._tick_generation
 
-            self.scheduler.sched_tick(expected_tick_us)
-            self._last_tick_us = expected_tick_us
-            self._enforce_task_windows_unlocked(now_us)
-            self._arm_tick_timer()
+        # The notifier call and wheel insert run outside the scheduler lock.
+        if next_tick_us is not None:
+            self._install_tick_artifacts(next_tick_us, generation)
 
     def _cancel_quantum_artifacts(self, *, reset_quantum_end: bool) -> None:
+        self._quantum_generation += 1
         if self._quantum_timer is not None:
-            self._quantum_timer.cancel()
+            self._timer_wheel.cancel(self._quantum_timer)
             self._quantum_timer = None
 
         if self._quantum_notification_id is not None:
-            self.notifier.cancel_notification(self._quantum_notification_id)
+            self._queue_notification_cancel(self._quantum_notification_id)
             self._quantum_notification_id = None
 
         if reset_quantum_end:
             self.processor.quantum_end = 0
 
     def _cancel_tick_artifacts(self) -> None:
+        self._tick_generation += 1
         if self._tick_timer is not None:
-            self._tick_timer.cancel()
+            self._timer_wheel.cancel(self._tick_timer)
             self._tick_timer = None
 
         if self._tick_notification_id is not None:
-            self.notifier.cancel_notification(self._tick_notification_id)
+            self._queue_notification_cancel(self._tick_notification_id)
             self._tick_notification_id = None
 
     def _enforce_task_windows_unlocked(self, now_us: int) -> None:
         """Auto-manage FIXPRI tasks that declare a wall-clock active window."""
+        if not self._has_windowed_tasks:
+            # Skip the local-time lookup and task sweep; window setters re-arm this.
+            return
+
         now_local_minute = self._current_local_minute_of_day_unlocked()
         changed = False
+        has_windowed_tasks = False
 
-        for task in self.tasks_by_id.values():
+        # Enum members bound once for the per-task comparisons below.
+        running = ThreadState.RUNNING
+        runnable = ThreadState.RUNNABLE
+        waiting = ThreadState.WAITING
+
+        for task in self._live_tasks_by_id.values():
+            if task.active_window_start_minute is None:
+                continue
+            has_windowed_tasks = True
             window_bounds = self._task_active_window_bounds(task)
             if window_bounds is None:
                 continue
@@ -1006,11 +1396,12 @@ class HumanTaskScheduler:
             )
 
             thread = task.thread
-            if thread.state == ThreadState.TERMINATED:
+            state = thread.state
+            if state == ThreadState.TERMINATED:
                 continue
 
             if window_active:
-                if thread.state == ThreadState.WAITING:
+                if state == waiting:
                     preempt_proc = self.scheduler.thread_wakeup(thread, now_us)
                     self._handle_preemption_request(
                         preempt_proc,
@@ -1018,7 +1409,7 @@ class HumanTaskScheduler:
                         trigger_when_idle=True,
                     )
                     changed = True
-                elif thread.state == ThreadState.RUNNABLE and self.processor.active_thread is None:
+                elif state == runnable and self.processor.active_thread is None:
                     previous = self.processor.active_thread
                     window_label = (
                         f"{self._format_clock_time(start_minute)}-"
@@ -1035,19 +1426,20 @@ class HumanTaskScheduler:
                     changed = changed or self.processor.active_thread is not previous
                 continue
 
-            if thread.state == ThreadState.RUNNING:
+            if state == running:
                 new_thread = self.scheduler.thread_block(thread, self.processor, now_us)
                 if new_thread is not None:
                     self._arm_quantum_for_active(now_us)
                 else:
                     self._cancel_quantum_artifacts(reset_quantum_end=True)
                 changed = True
-            elif thread.state == ThreadState.RUNNABLE:
+            elif state == runnable:
                 self.scheduler.thread_remove(thread, now_us)
-                thread.state = ThreadState.WAITING
+                thread.state = waiting
                 thread.last_run_time = now_us
                 changed = True
 
+        self._has_windowed_tasks = has_windowed_tasks
         if changed:
             self._persist_state_unlocked()
 
@@ -1056,58 +1448,88 @@ class HumanTaskScheduler:
         return (now_local.hour * 60) + now_local.minute
 
     def _persist_state_unlocked(self) -> None:
-        if self._persistence_dir is None or self._suspend_persistence:
+        """Mark state dirty; it is written once per writer, or per debounce window."""
+        if self._persistence_dir is None:
             return
+        self._persist_dirty = True
 
-        life_areas_path = self._persistence_dir / "life_areas.json"
-        tasks_path = self._persistence_dir / "tasks.json"
-
-        life_areas_payload: list[dict[str, Any]] = []
-        for area in sorted(
-            self.life_areas_by_id.values(),
-            key=lambda item: item.life_area_id,
-        ):
-            life_areas_payload.append(
-                {
-                    "id": area.life_area_id,
-                    "name": area.name,
-                }
-            )
-
-        tasks_payload: list[dict[str, Any]] = []
-        for task in sorted(self.tasks_by_id.values(), key=lambda item: item.task_id):
-            tasks_payload.append(
-                {
-                    "id": task.task_id,
-                    "title": task.title,
-                    "life_area_id": task.life_area.life_area_id,
-                    "life_area_name": task.life_area.name,
-                    "urgency_tier": task.urgency_tier.value,
-                    "active_window_start_local": (
-                        self._format_clock_time(task.active_window_start_minute)
-                        if task.active_window_start_minute is not None
-                        else None
-                    ),
-                    "active_window_end_local": (
-                        self._format_clock_time(task.active_window_end_minute)
-                        if task.active_window_end_minute is not None
-                        else None
-                    ),
-                    "notes": task.notes,
-                    "created_at": task.created_at.isoformat(),
-                    "state": task.state.name.lower(),
-                }
-            )
-
-        self._write_json_atomic(life_areas_path, life_areas_payload)
-        self._write_json_atomic(tasks_path, tasks_payload)
-        self._persist_engine_state_unlocked()
+    def _take_persisted_state_unlocked(self) -> _PersistedState | None:
+        """Snapshot dirty state for an immediate write, or leave it to the flush timer."""
+        if not self._persist_dirty:
+            return None
+        if self._enable_timers:
+            if self._persist_flush_timer is None:
+                self._persist_flush_timer = self._schedule_timer(
+                    _PERSIST_DEBOUNCE_US,
+                    self.flush_persistence,
+                )
+            return None
+        self._persist_dirty = False
+        return self._snapshot_persisted_state_unlocked()
+
+    def _snapshot_persisted_state_unlocked(self) -> _PersistedState:
+        # Rows are captured in registry order; compaction sorts them off the lock.
+        life_areas_payload = [
+            {
+                "id": area.life_area_id,
+                "name": area.name,
+            }
+            for area in self.life_areas_by_id.values()
+        ]
+        tasks_payload = [self._task_payload_unlocked(task) for task in self.tasks_by_id.values()]
+
+        self._persist_generation += 1
+        return _PersistedState(
+            generation=self._persist_generation,
+            life_areas=life_areas_payload,
+            tasks=tasks_payload,
+            engine_state=self._pickle_engine_state_unlocked(),
+        )
 
-    def _persist_engine_state_unlocked(self) -> None:
+    def _task_payload_unlocked(self, task: Task) -> dict[str, Any]:
+        """Persisted row for ``task``, reused while none of its fields change."""
+        thread = task.thread
+        life_area = task.life_area
+        key = (
+            task.title,
+            life_area.life_area_id,
+            life_area.name,
+            task.urgency_tier,
+            task.active_window_start_minute,
+            task.active_window_end_minute,
+            task.notes,
+            task.created_at,
+            thread.state,
+        )
+        cached = self._task_payloads.get(thread.tid)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        payload = {
+            "id": task.task_id,
+            "title": task.title,
+            "life_area_id": life_area.life_area_id,
+            "life_area_name": life_area.name,
+            "urgency_tier": task.urgency_tier.value,
+            "active_window_start_local": (
+                self._format_clock_time(task.active_window_start_minute)
+                if task.active_window_start_minute is not None
+                else None
+            ),
+            "active_window_end_local": (
+                self._format_clock_time(task.active_window_end_minute)
+                if task.active_window_end_minute is not None
+                else None
+            ),
+            "notes": task.notes,
+            "created_at": task.created_at.isoformat(),
+            "state": task.state.name.lower(),
+        }
+        self._task_payloads[thread.tid] = (key, payload)
+        return payload
+
+    def _pickle_engine_state_unlocked(self) -> bytes | None:
         """Pickle the full engine object graph for restart recovery."""
-        if self._persistence_dir is None:
-            return
-
         snapshot = (
             _ENGINE_STATE_VERSION,
             self.scheduler,
@@ -1123,17 +1545,177 @@ class HumanTaskScheduler:
             _thread_mod._next_tid,
             ThreadGroup._next_id,
         )
-
-        pkl_path = self._persistence_dir / _ENGINE_STATE_FILENAME
-        tmp_path = pkl_path.with_suffix(".pkl.tmp")
         try:
-            with tmp_path.open("wb") as fh:
-                pickle.dump(snapshot, fh, protocol=pickle.HIGHEST_PROTOCOL)
-            tmp_path.replace(pkl_path)
+            return pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL)
         except Exception:
             _log.warning("Failed to persist engine state", exc_info=True)
-            if tmp_path.exists():
-                tmp_path.unlink()
+            return None
+
+    def _write_persisted_state(self, persisted: _PersistedState) -> None:
+        """Write a snapshot to disk; runs without the scheduler lock held."""
+        persistence_dir = self._persistence_dir
+        if persistence_dir is None:
+            return
+
+        with self._persist_lock:
+            # A writer that snapshotted later may have reached the disk first.
+            if persisted.generation <= self._persisted_generation:
+                return
+            self._persisted_generation = persisted.generation
+
+            tables = {
+                "life_areas": {row["id"]: row for row in persisted.life_areas},
+                "tasks": {row["id"]: row for row in persisted.tasks},
+            }
+            if (
+                self._persisted_rows is None
+                or self._journal_bytes
+                > max(_JOURNAL_COMPACT_MIN_BYTES, _JOURNAL_COMPACT_RATIO * self._snapshot_bytes)
+            ):
+                self._compact_journal(persistence_dir, persisted)
+            else:
+                self._append_journal(persistence_dir, self._persisted_rows, tables)
+            self._persisted_rows = tables
+
+            if persisted.engine_state is not None:
+                pkl_path = persistence_dir / _ENGINE_STATE_FILENAME
+                try:
+                    self._write_bytes_atomic(pkl_path, persisted.engine_state)
+                except Exception:
+                    _log.warning("Failed to persist engine state", exc_info=True)
+                    self._temp_path(pkl_path).unlink(missing_ok=True)
+
+            if self._DURABLE_WRITES:
+                # One directory sync covers every rename and unlink above.
+                self._fsync_directory(persistence_dir)
+
+    def _compact_journal(self, persistence_dir: Path, persisted: _PersistedState) -> None:
+        """Rewrite both JSON tables in full and drop the journal they supersede.
+
+        The tables carry a new generation, so journal lines from before this
+        compaction are skipped on replay even if a crash leaves them behind.
+        """
+        generation = self._compaction_generation
+        if generation is None:
+            generation = self._read_compaction_generation(persistence_dir)
+        generation += 1
+        # Bumped before any table lands: later appends must never be older
+        # than a table that did get written.
+        self._compaction_generation = generation
+
+        life_areas_path = persistence_dir / _LIFE_AREAS_FILENAME
+        tasks_path = persistence_dir / _TASKS_FILENAME
+        snapshot_bytes = self._write_json_atomic(
+            life_areas_path,
+            {"generation": generation, "rows": sorted(persisted.life_areas, key=_row_id)},
+        )
+        snapshot_bytes += self._write_json_atomic(
+            tasks_path,
+            {"generation": generation, "rows": sorted(persisted.tasks, key=_row_id)},
+        )
+        (persistence_dir / _JOURNAL_FILENAME).unlink(missing_ok=True)
+        self._journal_bytes = 0
+        self._snapshot_bytes = snapshot_bytes
+
+    def _append_journal(
+        self,
+        persistence_dir: Path,
+        previous: dict[str, dict[int, dict[str, Any]]],
+        tables: dict[str, dict[int, dict[str, Any]]],
+    ) -> None:
+        """Append one line per row that changed since the last write."""
+        generation = self._compaction_generation
+        lines: list[bytes] = []
+        for table, rows in tables.items():
+            previous_rows = previous[table]
+            for row_id, row in rows.items():
+                previous_row = previous_rows.get(row_id)
+                # Unchanged tasks hand back the identical cached row.
+                if previous_row is not row and previous_row != row:
+                    lines.append(
+                        _encode_json({"op": "upsert", "table": table, "row": row, "gen": generation})
+                    )
+            for row_id in previous_rows.keys() - rows.keys():
+                lines.append(
+                    _encode_json({"op": "delete", "table": table, "id": row_id, "gen": generation})
+                )
+        if not lines:
+            return
+
+        data = b"\n".join(lines) + b"\n"
+        fd = os.open(
+            persistence_dir / _JOURNAL_FILENAME,
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+            0o644,
+        )
+        try:
+            self._write_all(fd, data)
+            if self._DURABLE_WRITES:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        self._journal_bytes += len(data)
+
+    @classmethod
+    def _read_persisted_rows(
+        cls,
+        persistence_dir: Path,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Read the life-area and task tables with the journal replayed over them."""
+        life_areas_generation, life_areas = cls._read_table(persistence_dir / _LIFE_AREAS_FILENAME)
+        tasks_generation, tasks = cls._read_table(persistence_dir / _TASKS_FILENAME)
+        journal = cls._read_journal(persistence_dir)
+        if not journal:
+            return life_areas, tasks
+
+        tables: dict[str, tuple[int, dict[Any, dict[str, Any]]]] = {
+            "life_areas": (life_areas_generation, {row.get("id"): row for row in life_areas}),
+            "tasks": (tasks_generation, {row.get("id"): row for row in tasks}),
+        }
+        for entry in journal:
+            table = tables.get(entry.get("table"))
+            if table is None:
+                continue
+            table_generation, rows = table
+            if _entry_generation(entry) < table_generation:
+                # Written before the table's compaction, which already holds it.
+                continue
+            op = entry.get("op")
+            if op == "upsert" and isinstance(entry.get("row"), dict):
+                rows[entry["row"].get("id")] = entry["row"]
+            elif op == "delete":
+                rows.pop(entry.get("id"), None)
+
+        return list(tables["life_areas"][1].values()), list(tables["tasks"][1].values())
+
+    @classmethod
+    def _read_compaction_generation(cls, persistence_dir: Path) -> int:
+        """Newest generation on disk, from either table or any journal line."""
+        generation = max(
+            cls._read_table(persistence_dir / _LIFE_AREAS_FILENAME)[0],
+            cls._read_table(persistence_dir / _TASKS_FILENAME)[0],
+        )
+        for entry in cls._read_journal(persistence_dir):
+            generation = max(generation, _entry_generation(entry))
+        return generation
+
+    @staticmethod
+    def _read_journal(persistence_dir: Path) -> list[dict[str, Any]]:
+        try:
+            journal_lines = (persistence_dir / _JOURNAL_FILENAME).read_bytes().splitlines()
+        except OSError:
+            # Usually FileNotFoundError: nothing has changed since the last compaction.
+            return []
+        entries: list[dict[str, Any]] = []
+        for line in journal_lines:
+            try:
+                entry = json.loads(line)
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                # A torn final line from an interrupted append.
+                continue
+            if isinstance(entry, dict):
+                entries.append(entry)
+        return entries
 
     def _load_engine_state_unlocked(self) -> bool:
         """Try to restore the full engine from a pickle snapshot.
@@ -1146,11 +1728,13 @@ class HumanTaskScheduler:
             return False
 
         pkl_path = self._persistence_dir / _ENGINE_STATE_FILENAME
-        if not pkl_path.exists():
+        try:
+            fh = pkl_path.open("rb")
+        except FileNotFoundError:
             return False
 
         try:
-            with pkl_path.open("rb") as fh:
+            with fh:
                 snapshot = pickle.load(fh)  # noqa: S301
 
             if not isinstance(snapshot, tuple) or len(snapshot) < 13:
@@ -1186,15 +1770,35 @@ class HumanTaskScheduler:
             _thread_mod._next_tid = next_tid
             ThreadGroup._next_id = next_tg_id
 
+            # Snapshots from before the logs were bounded carry plain lists.
+            scheduler.set_log_maxlen(_SCHED_LOG_MAXLEN)
+            # Older snapshots also kept completed threads in all_threads.
+            scheduler.all_threads = [
+                thread
+                for thread in scheduler.all_threads
+                if thread.state != ThreadState.TERMINATED
+            ]
             self.scheduler = scheduler
             self.pset = pset
             self.processor = pset.processors[0]
             self.life_areas_by_id = life_areas_by_id
+            self._life_areas_snapshot = None
             self._life_areas_by_name = life_areas_by_name
+            self._life_area_keys = {
+                area.life_area_id: key for key, area in life_areas_by_name.items()
+            }
+            self._thread_index = {
+                thread.tid: index for index, thread in enumerate(scheduler.all_threads)
+            }
             self.tasks_by_id = tasks_by_id
+            self._tasks_snapshot = None
+            self._live_tasks_by_id = {}
+            self._tasks_by_tid = []
+            for task in tasks_by_id.values():
+                self._register_task_unlocked(task)
             self.time_scale = time_scale
             self.max_catchup_ticks = max_catchup_ticks
-            self._last_tick_us = last_tick_us
+            self._set_last_tick_unlocked(last_tick_us)
             self._quantum_notification_id = quantum_notification_id
             self._tick_notification_id = tick_notification_id
 
@@ -1219,126 +1823,193 @@ class HumanTaskScheduler:
             return
 
         # Fall back to JSON domain reconstruction.
-        life_areas_path = self._persistence_dir / "life_areas.json"
-        tasks_path = self._persistence_dir / "tasks.json"
-        if not life_areas_path.exists() and not tasks_path.exists():
+        raw_life_areas, raw_tasks = self._read_persisted_rows(self._persistence_dir)
+        if not raw_life_areas and not raw_tasks:
             return
+        id_to_area: dict[int, LifeArea] = {}
+        # Many tasks share an area; resolve each distinct saved name once.
+        areas_by_saved_name: dict[str, LifeArea] = {}
+        # Batch-created tasks share timestamps; parse each distinct string once.
+        parsed_created_at: dict[str, datetime | None] = {}
+        # Saved run states are applied after every row exists, in row order.
+        to_resume: list[Task] = []
+        to_complete: list[Task] = []
+
+        for row in raw_life_areas:
+            name = str(row.get("name", "")).strip()
+            if not name:
+                continue
+            # Legacy files may still include "description"; it is ignored.
+            area = self.create_life_area(name=name)
+            saved_id = row.get("id")
+            if isinstance(saved_id, int):
+                id_to_area[saved_id] = area
+            elif isinstance(saved_id, str) and saved_id.isdigit():
+                id_to_area[int(saved_id)] = area
+
+        for row in raw_tasks:
+            title = str(row.get("title", "")).strip()
+            if not title:
+                continue
 
-        raw_life_areas = self._read_json_list(life_areas_path)
-        raw_tasks = self._read_json_list(tasks_path)
-        id_to_name: dict[int, str] = {}
-
-        self._suspend_persistence = True
-        try:
-            for row in raw_life_areas:
-                name = str(row.get("name", "")).strip()
-                if not name:
-                    continue
-                # Legacy files may still include "description"; it is ignored.
-                area = self.create_life_area(name=name)
-                saved_id = row.get("id")
-                if isinstance(saved_id, int):
-                    id_to_name[saved_id] = area.name
-                elif isinstance(saved_id, str) and saved_id.isdigit():
-                    id_to_name[int(saved_id)] = area.name
-
-            for row in raw_tasks:
-                title = str(row.get("title", "")).strip()
-                if not title:
-                    continue
-
-                life_area_name = str(row.get("life_area_name", "")).strip()
-                if not life_area_name:
-                    saved_life_area_id = row.get("life_area_id")
-                    if isinstance(saved_life_area_id, int):
-                        life_area_name = id_to_name.get(saved_life_area_id, "")
-                    elif (
-                        isinstance(saved_life_area_id, str)
-                        and saved_life_area_id.isdigit()
-                    ):
-                        life_area_name = id_to_name.get(int(saved_life_area_id), "")
-                if not life_area_name:
-                    continue
+            life_area: LifeArea | None = None
+            life_area_name = str(row.get("life_area_name", "")).strip()
+            if life_area_name:
+                life_area = areas_by_saved_name.get(life_area_name)
+                if life_area is None:
+                    life_area = self._life_area_by_name(life_area_name)
+                    areas_by_saved_name[life_area_name] = life_area
+            else:
+                saved_life_area_id = row.get("life_area_id")
+                if isinstance(saved_life_area_id, int):
+                    life_area = id_to_area.get(saved_life_area_id)
+                elif (
+                    isinstance(saved_life_area_id, str)
+                    and saved_life_area_id.isdigit()
+                ):
+                    life_area = id_to_area.get(int(saved_life_area_id))
+            if life_area is None:
+                continue
 
-                urgency_tier = str(row.get("urgency_tier", UrgencyTier.NORMAL.value))
-                active_window_start_local = self._optional_string(
-                    row.get("active_window_start_local"),
+            urgency_tier = str(row.get("urgency_tier", UrgencyTier.NORMAL.value))
+            active_window_start_local = self._optional_string(
+                row.get("active_window_start_local"),
+            )
+            active_window_end_local = self._optional_string(
+                row.get("active_window_end_local"),
+            )
+            notes = str(row.get("notes", ""))
+
+            try:
+                task = self.create_task(
+                    life_area=life_area,
+                    title=title,
+                    urgency_tier=urgency_tier,
+                    active_window_start_local=active_window_start_local,
+                    active_window_end_local=active_window_end_local,
+                    notes=notes,
+                    start_runnable=False,
                 )
-                active_window_end_local = self._optional_string(
-                    row.get("active_window_end_local"),
+            except ValueError:
+                # Be tolerant of legacy/invalid saved window values.
+                task = self.create_task(
+                    life_area=life_area,
+                    title=title,
+                    urgency_tier=urgency_tier,
+                    notes=notes,
+                    start_runnable=False,
                 )
-                notes = str(row.get("notes", ""))
 
-                try:
-                    task = self.create_task(
-                        life_area=life_area_name,
-                        title=title,
-                        urgency_tier=urgency_tier,
-                        active_window_start_local=active_window_start_local,
-                        active_window_end_local=active_window_end_local,
-                        notes=notes,
-                        start_runnable=False,
-                    )
-                except ValueError:
-                    # Be tolerant of legacy/invalid saved window values.
-                    task = self.create_task(
-                        life_area=life_area_name,
-                        title=title,
-                        urgency_tier=urgency_tier,
-                        notes=notes,
-                        start_runnable=False,
-                    )
+            raw_created_at = row.get("created_at")
+            if isinstance(raw_created_at, str):
+                if raw_created_at in parsed_created_at:
+                    created_at = parsed_created_at[raw_created_at]
+                else:
+                    created_at = self._parse_iso_datetime(raw_created_at)
+                    parsed_created_at[raw_created_at] = created_at
+            else:
+                created_at = None
+            if created_at is not None:
+                task.created_at = created_at
+
+            state = str(row.get("state", "waiting")).strip().lower()
+            if state in {"runnable", "running"}:
+                to_resume.append(task)
+            elif state == "terminated":
+                to_complete.append(task)
+
+        # The loader already holds the write lock, so one timestamp serves
+        # every transition and no per-row catch-up or persist is needed.
+        now_us = self._now_us()
+        for task in to_complete:
+            if task.thread.state != ThreadState.TERMINATED:
+                self._complete_task_unlocked(task, now_us)
+        for task in to_resume:
+            if task.thread.state == ThreadState.WAITING:
+                self._resume_task_unlocked(task, now_us)
+        self._persist_state_unlocked()
+
+    @classmethod
+    def _write_json_atomic(cls, path: Path, payload: Any) -> int:
+        """Encode ``payload`` compactly and atomically replace ``path``; returns the size."""
+        data = _encode_json(payload)
+        cls._write_bytes_atomic(path, data)
+        return len(data)
 
-                created_at = self._parse_iso_datetime(row.get("created_at"))
-                if created_at is not None:
-                    task.created_at = created_at
+    @classmethod
+    def _write_bytes_atomic(cls, path: Path, data: bytes) -> None:
+        """Write ``data`` to a temp file, sync it, and rename it over ``path``.
 
-                state = str(row.get("state", "waiting")).strip().lower()
-                if state in {"runnable", "running"}:
-                    self.resume_task(task.task_id)
-                elif state == "terminated":
-                    self.complete_task(task.task_id)
+        Callers sync the parent directory once after their last rename.
+        """
+        temp_path = cls._temp_path(path)
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            cls._write_all(fd, data)
+            if cls._DURABLE_WRITES:
+                os.fsync(fd)
         finally:
-            self._suspend_persistence = False
+            os.close(fd)
+        os.replace(temp_path, path)
 
-        self._persist_state_unlocked()
+    @staticmethod
+    def _write_all(fd: int, data: bytes) -> None:
+        # Unbuffered: the whole payload goes to the kernel in one write call,
+        # looping only if the kernel accepts a partial write.
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
 
     @staticmethod
-    def _write_json_atomic(path: Path, payload: Any) -> None:
-        serialized = json.dumps(payload, indent=2, sort_keys=True)
-        temp_path = path.with_suffix(f"{path.suffix}.tmp")
-        temp_path.write_text(serialized, encoding="utf-8")
-        temp_path.replace(path)
+    def _temp_path(path: Path) -> Path:
+        return path.with_suffix(f"{path.suffix}.tmp")
 
     @staticmethod
-    def _read_json_list(path: Path) -> list[dict[str, Any]]:
-        if not path.exists():
-            return []
+    def _fsync_directory(directory: Path) -> None:
+        if os.name == "nt":
+            # Windows cannot open directories for fsync; NTFS journals renames.
+            return
+        fd = os.open(directory, os.O_RDONLY)
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
-            return []
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _read_table(path: Path) -> tuple[int, list[dict[str, Any]]]:
+        """Return a table's compaction generation and rows.
+
+        Plain lists (tables written before generations) read as generation 0.
+        """
+        try:
+            # json.loads detects UTF-8 in bytes itself; skip the text-mode wrapper.
+            # A missing file lands in OSError, saving a separate exists() stat.
+            data = json.loads(path.read_bytes())
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            return 0, []
+        generation = 0
+        if isinstance(data, dict):
+            saved_generation = data.get("generation")
+            if isinstance(saved_generation, int):
+                generation = saved_generation
+            data = data.get("rows")
         if not isinstance(data, list):
-            return []
-        rows: list[dict[str, Any]] = []
-        for item in data:
-            if isinstance(item, dict):
-                rows.append(item)
-        return rows
+            return generation, []
+        return generation, [item for item in data if isinstance(item, dict)]
 
     @staticmethod
     def _parse_iso_datetime(value: object) -> datetime | None:
-        if not isinstance(value, str):
+        if not isinstance(value, str) or not value:
             return None
-        text = value.strip()
-        if not text:
-            return None
-        if text.endswith("Z"):
-            text = f"{text[:-1]}+00:00"
         try:
-            parsed = datetime.fromisoformat(text)
+            # Python 3.11+ parses a trailing "Z" natively; blank input raises.
+            parsed = datetime.fromisoformat(value)
         except ValueError:
-            return None
+            # Saved rows are never padded; only hand-edited files pay for strip().
+            stripped = value.strip()
+            if stripped == value:
+                return None
+            return HumanTaskScheduler._parse_iso_datetime(stripped)
         if parsed.tzinfo is None:
             parsed = parsed.replace(tzinfo=timezone.utc)
         return parsed
@@ -1355,15 +2026,56 @@ class HumanTaskScheduler:
     # ------------------------------------------------------------------
     def list_life_areas(self) -> list[LifeArea]:
         """Return all life areas as a snapshot list."""
-        with self._lock:
-            return list(self.life_areas_by_id.values())
-
-    def list_tasks(self) -> list[Task]:
-        """Return all tasks as a snapshot list."""
-        with self._lock:
+        # Reading a slot is atomic; only a cleared snapshot needs the lock.
+        snapshot = self._life_areas_snapshot
+        if snapshot is None:
+            with self._lock:
+                snapshot = self._life_areas_snapshot
+                if snapshot is None:
+                    snapshot = tuple(self.life_areas_by_id.values())
+                    self._life_areas_snapshot = snapshot
+        return list(snapshot)
+
+    def list_tasks(self, *, life_area_id: int | None = None) -> list[Task]:
+        """Return all tasks, or one life area's, as a snapshot list."""
+        if life_area_id is None:
+            snapshot = self._current_tasks_snapshot()
+            if snapshot is not None:
+                return list(snapshot)
+
+        with self._write_locked():
             now_us = self._now_us()
             self._apply_lazy_catchup(now_us)
-            return list(self.tasks_by_id.values())
+            if life_area_id is not None:
+                # The area's own id set avoids scanning every task.
+                area = self.life_areas_by_id.get(life_area_id)
+                if area is None:
+                    return []
+                tasks_by_id = self.tasks_by_id
+                return [tasks_by_id[task_id] for task_id in sorted(area.task_ids)]
+            snapshot = self._tasks_snapshot
+            if snapshot is None:
+                snapshot = tuple(self.tasks_by_id.values())
+                self._tasks_snapshot = snapshot
+            return list(snapshot)
+
+    def _current_tasks_snapshot(self) -> tuple[Task, ...] | None:
+        """The cached task tuple, read without the lock, if no catch-up is due.
+
+        Like ``_what_next_running_fast_path``, anything a lazy catch-up would
+        act on, or a concurrent writer, sends the caller to the locked path.
+        """
+        seq = self._dispatch_seq
+        snapshot = self._tasks_snapshot
+        if seq & 1 or snapshot is None or self._has_windowed_tasks:
+            return None
+        now_us = self._now_us()
+        quantum_end = self.processor.quantum_end
+        if now_us >= self._next_tick_us or (quantum_end > 0 and now_us > quantum_end):
+            return None
+        if self._dispatch_seq != seq:
+            return None
+        return snapshot
 
     def get_task(self, task_id: int) -> Task | None:
         """Look up a single task by id."""
@@ -1376,85 +2088,133 @@ class HumanTaskScheduler:
             active = self.processor.active_thread
             if active is None:
                 return None
-            return self.tasks_by_id.get(active.tid)
+            return self._task_for_tid(active.tid)
+
+    def catch_up_and_snapshot(self, build: Callable[[int], _T]) -> _T:
+        """Catch the engine up to now, then return ``build(now_us)`` under the lock.
 
-    def get_dispatch_snapshot(self) -> dict[str, object]:
+        Runs as a writer: notifications and persistence queued by the catch-up
+        are flushed on release, and lock-free readers see the sequence move.
+        """
+        with self._write_locked():
+            now_us = self._now_us()
+            self._apply_lazy_catchup(now_us)
+            return build(now_us)
+
+    def get_dispatch_snapshot(self) -> DispatchSnapshot:
         """Expose active dispatch state for GUI/status queries."""
         with self._lock:
             now_us = self._now_us()
             active = self.processor.active_thread
             task: Task | None = None
             if active is not None:
-                task = self.tasks_by_id.get(active.tid)
-
-            return {
-                "now_us": now_us,
-                "quantum_end_us": self.processor.quantum_end,
-                "active_task": task,
-                "active_thread": active,
-                "last_switch_reason": self._last_switch_reason_unlocked(),
-                "last_switch_timestamp_us": self._last_switch_timestamp_us_unlocked(),
-            }
+                task = self._task_for_tid(active.tid)
+
+            return DispatchSnapshot(
+                now_us,
+                self.processor.quantum_end,
+                task,
+                active,
+                self._last_switch_reason_unlocked(),
+                self._last_switch_timestamp_us_unlocked(),
+            )
 
-    def _derive_selection_reason(self, trace_before: int, switch_before: int) -> str:
+    def _derive_selection_reason(self, select_before: int, switch_before: int) -> str:
         # Prefer thread_select trace because it reflects the internal comparator path.
-        if len(self.scheduler.trace_log) > trace_before:
-            for line in reversed(self.scheduler.trace_log[trace_before:]):
-                if "Select " in line:
-                    return line
+        scheduler = self.scheduler
+        if scheduler.select_trace_count > select_before and scheduler.last_select_trace:
+            return scheduler.last_select_trace
 
-        if len(self.scheduler.processor_switch_log) > switch_before:
-            last = self.scheduler.processor_switch_log[-1]
-            marker = "| reason: "
-            if marker in last:
-                return last.split(marker, 1)[1]
+        if scheduler.processor_switch_count > switch_before and scheduler.last_switch_reason:
+            return scheduler.last_switch_reason
 
         return "Selected highest-ranked runnable task."
 
     def _last_switch_reason_unlocked(self) -> str | None:
-        if not self.scheduler.processor_switch_log:
-            return None
-        last = self.scheduler.processor_switch_log[-1]
-        marker = "| reason: "
-        if marker not in last:
-            return None
-        return last.split(marker, 1)[1]
+        return self.scheduler.last_switch_reason
 
     def _last_switch_timestamp_us_unlocked(self) -> int | None:
-        if not self.scheduler.processor_switch_log:
-            return None
-        last = self.scheduler.processor_switch_log[-1]
-        if not last.startswith("["):
-            return None
-        end = last.find("us]")
-        if end <= 1:
-            return None
-        raw = last[1:end].strip()
-        try:
-            return int(raw)
-        except ValueError:
-            return None
+        return self.scheduler.last_switch_timestamp
 
     def _resolve_life_area(self, life_area: LifeArea | int | str) -> LifeArea:
+        # Exact-type checks first: plain ids and names are the common inputs.
+        kind = type(life_area)
+        if kind is int:
+            return self._life_area_by_id(life_area)
+        if kind is str:
+            return self._life_area_by_name(life_area)
         if isinstance(life_area, LifeArea):
             return life_area
-
         if isinstance(life_area, int):
-            if life_area not in self.life_areas_by_id:
-                raise KeyError(f"Unknown life_area id: {life_area}")
-            return self.life_areas_by_id[life_area]
+            return self._life_area_by_id(life_area)
+        return self._life_area_by_name(life_area)
+
+    def _life_area_by_id(self, life_area_id: int) -> LifeArea:
+        area = self.life_areas_by_id.get(life_area_id)
+        if area is None:
+            raise KeyError(f"Unknown life_area id: {life_area_id}")
+        return area
+
+    def _life_area_by_name(self, name: str) -> LifeArea:
+        # Registered keys are already normalized, so an exact hit is authoritative.
+        area = self._life_areas_by_name.get(name)
+        if area is not None:
+            return area
+
+        area = self._life_areas_by_name.get(self._normalize_name(name))
+        if area is None:
+            raise KeyError(f"Unknown life_area name: {name!r}")
+        return area
 
-        key = self._normalize_name(life_area)
-        if key not in self._life_areas_by_name:
-            raise KeyError(f"Unknown life_area name: {life_area!r}")
-        return self._life_areas_by_name[key]
+    def _track_thread_unlocked(self, thread: Thread) -> None:
+        all_threads = self.scheduler.all_threads
+        self._thread_index[thread.tid] = len(all_threads)
+        all_threads.append(thread)
+
+    def _forget_thread_unlocked(self, thread: Thread) -> None:
+        index = self._thread_index.pop(thread.tid, None)
+        if index is None:
+            return
+        # Order in all_threads is not meaningful; fill the hole with the tail.
+        all_threads = self.scheduler.all_threads
+        last = all_threads.pop()
+        if index < len(all_threads):
+            all_threads[index] = last
+            self._thread_index[last.tid] = index
+
+    def _retire_task_unlocked(self, task: Task) -> None:
+        self._live_tasks_by_id.pop(task.task_id, None)
+        self._forget_thread_unlocked(task.thread)
+
+    def _task_for_tid(self, tid: int) -> Task | None:
+        slots = self._tasks_by_tid
+        return slots[tid] if tid < len(slots) else None
+
+    def _register_task_unlocked(self, task: Task) -> None:
+        task_id = task.task_id
+        self.tasks_by_id[task_id] = task
+        self._tasks_snapshot = None
+        if task.thread.state != ThreadState.TERMINATED:
+            self._live_tasks_by_id[task_id] = task
+        slots = self._tasks_by_tid
+        if task_id >= len(slots):
+            slots.extend([None] * (task_id + 1 - len(slots)))
+        slots[task_id] = task
+
+    def _unregister_task_unlocked(self, task_id: int) -> None:
+        self.tasks_by_id.pop(task_id, None)
+        self._tasks_snapshot = None
+        self._live_tasks_by_id.pop(task_id, None)
+        self._task_payloads.pop(task_id, None)
+        if 0 <= task_id < len(self._tasks_by_tid):
+            self._tasks_by_tid[task_id] = None
 
     def _resolve_task(self, task_id: int | None) -> Task | None:
         if task_id is None:
             active = self.processor.active_thread
             if active is None:
                 return None
-            return self.tasks_by_id.get(active.tid)
+            return self._task_for_tid(active.tid)
         return self.tasks_by_id.get(task_id)
 
     def _require_task(self, task_id: int) -> Task:
@@ -1464,10 +2224,13 @@ class HumanTaskScheduler:
         return task
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _normalize_name(name: str) -> str:
-        return name.strip().lower()
+        # Interned so registry keys and lookup keys share one object.
+        return sys.intern(name.strip().lower())
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _thread_name_from_title(title: str) -> str:
         stem = "-".join(title.strip().split())
         return stem.lower()[:48] or "task"
@@ -8,6 +8,8 @@ from human_sched.application.runtime import Dispatch, HumanTaskScheduler
 class WhatNext:
     """Application use case returning the currently dispatched task recommendation."""
 
+    __slots__ = ("_scheduler",)
+
     def __init__(self, scheduler: HumanTaskScheduler) -> None:
         self._scheduler = scheduler
 
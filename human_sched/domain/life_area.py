@@ -15,6 +15,13 @@ class LifeArea:
     name: str
     thread_group: ThreadGroup
     task_ids: set[int] = field(default_factory=set)
+    # (raw scores, named scores) from the last interactivity_scores() call.
+    _scores_cache: tuple[tuple[int, ...], dict[str, int]] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     @property
     def life_area_id(self) -> int:
@@ -26,8 +33,15 @@ class LifeArea:
         if clutch is None:
             return {}
 
-        scores: dict[str, int] = {}
-        for bucket, group in enumerate(clutch.sc_clutch_groups):
-            bucket_name = BUCKET_NAMES.get(bucket, str(bucket))
-            scores[bucket_name] = group.scbg_interactivity_score
-        return scores
+        raw = tuple(group.scbg_interactivity_score for group in clutch.sc_clutch_groups)
+        # Engine pickles written before the cache existed restore without it.
+        cached = getattr(self, "_scores_cache", None)
+        if cached is not None and cached[0] == raw:
+            # Copy, so callers cannot mutate the cached mapping.
+            return dict(cached[1])
+
+        scores = {
+            BUCKET_NAMES.get(bucket, str(bucket)): score for bucket, score in enumerate(raw)
+        }
+        self._scores_cache = (raw, scores)
+        return dict(scores)
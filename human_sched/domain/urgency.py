@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from enum import Enum
+from functools import lru_cache
 
 from xnu_sched.constants import (
     BASEPRI_CONTROL,
@@ -26,57 +27,67 @@ class UrgencyTier(str, Enum):
     MAINTENANCE = "maintenance"
     SOMEDAY = "someday"
 
-    @property
-    def sched_mode(self) -> int:
-        if self is UrgencyTier.CRITICAL:
-            return TH_MODE_FIXED
-        return TH_MODE_TIMESHARE
-
-    @property
-    def base_priority(self) -> int:
-        if self is UrgencyTier.CRITICAL:
-            return BASEPRI_CONTROL
-        if self is UrgencyTier.ACTIVE_FOCUS:
-            return BASEPRI_FOREGROUND
-        if self is UrgencyTier.IMPORTANT:
-            return BASEPRI_USER_INITIATED
-        if self is UrgencyTier.NORMAL:
-            return BASEPRI_DEFAULT
-        if self is UrgencyTier.MAINTENANCE:
-            return BASEPRI_UTILITY
-        return MAXPRI_THROTTLE
-
-    @property
-    def label(self) -> str:
-        return {
-            UrgencyTier.CRITICAL: "Critical",
-            UrgencyTier.ACTIVE_FOCUS: "Active focus",
-            UrgencyTier.IMPORTANT: "Important",
-            UrgencyTier.NORMAL: "Normal",
-            UrgencyTier.MAINTENANCE: "Maintenance",
-            UrgencyTier.SOMEDAY: "Someday",
-        }[self]
+    # Static per-tier parameters, stored on each member below the class body
+    # so reads are a plain attribute fetch.
+    sched_mode: int
+    base_priority: int
+    label: str
 
     @classmethod
     def from_value(cls, value: "UrgencyTier | str") -> "UrgencyTier":
         if isinstance(value, UrgencyTier):
             return value
+        return _tier_from_string(value)
 
-        normalized = value.strip().lower()
-        aliases = {
-            "fixpri": cls.CRITICAL,
-            "fg": cls.ACTIVE_FOCUS,
-            "foreground": cls.ACTIVE_FOCUS,
-            "in": cls.IMPORTANT,
-            "user_initiated": cls.IMPORTANT,
-            "df": cls.NORMAL,
-            "default": cls.NORMAL,
-            "ut": cls.MAINTENANCE,
-            "utility": cls.MAINTENANCE,
-            "bg": cls.SOMEDAY,
-            "background": cls.SOMEDAY,
-        }
-
-        if normalized in aliases:
-            return aliases[normalized]
-        return cls(normalized)
+
+_SCHED_MODES: dict[UrgencyTier, int] = {
+    UrgencyTier.CRITICAL: TH_MODE_FIXED,
+}
+
+_BASE_PRIORITIES: dict[UrgencyTier, int] = {
+    UrgencyTier.CRITICAL: BASEPRI_CONTROL,
+    UrgencyTier.ACTIVE_FOCUS: BASEPRI_FOREGROUND,
+    UrgencyTier.IMPORTANT: BASEPRI_USER_INITIATED,
+    UrgencyTier.NORMAL: BASEPRI_DEFAULT,
+    UrgencyTier.MAINTENANCE: BASEPRI_UTILITY,
+    UrgencyTier.SOMEDAY: MAXPRI_THROTTLE,
+}
+
+_LABELS: dict[UrgencyTier, str] = {
+    UrgencyTier.CRITICAL: "Critical",
+    UrgencyTier.ACTIVE_FOCUS: "Active focus",
+    UrgencyTier.IMPORTANT: "Important",
+    UrgencyTier.NORMAL: "Normal",
+    UrgencyTier.MAINTENANCE: "Maintenance",
+    UrgencyTier.SOMEDAY: "Someday",
+}
+
+for _tier in UrgencyTier:
+    _tier.sched_mode = _SCHED_MODES.get(_tier, TH_MODE_TIMESHARE)
+    _tier.base_priority = _BASE_PRIORITIES[_tier]
+    _tier.label = _LABELS[_tier]
+del _tier
+
+_ALIASES: dict[str, UrgencyTier] = {
+    "fixpri": UrgencyTier.CRITICAL,
+    "fg": UrgencyTier.ACTIVE_FOCUS,
+    "foreground": UrgencyTier.ACTIVE_FOCUS,
+    "in": UrgencyTier.IMPORTANT,
+    "user_initiated": UrgencyTier.IMPORTANT,
+    "df": UrgencyTier.NORMAL,
+    "default": UrgencyTier.NORMAL,
+    "ut": UrgencyTier.MAINTENANCE,
+    "utility": UrgencyTier.MAINTENANCE,
+    "bg": UrgencyTier.SOMEDAY,
+    "background": UrgencyTier.SOMEDAY,
+}
+
+
+@lru_cache(maxsize=32)
+def _tier_from_string(value: str) -> UrgencyTier:
+    # Invalid strings raise and are therefore never cached.
+    normalized = value.strip().lower()
+    tier = _ALIASES.get(normalized)
+    if tier is not None:
+        return tier
+    return UrgencyTier(normalized)
@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+import socket
 from subprocess import Popen, TimeoutExpired
 import time
-from urllib.request import urlopen
 import webbrowser
 
 from human_sched.gui.contract import GuiAdapterMetadata
@@ -123,8 +123,10 @@ class NextJsGuiAdapter:
             "--port",
             str(self._frontend_port),
         ]
-        env = os.environ.copy()
-        env.setdefault("NEXT_PUBLIC_API_URL", "")
+        # Inherit the environment as-is unless the one default must be added.
+        env = None
+        if "NEXT_PUBLIC_API_URL" not in os.environ:
+            env = {**os.environ, "NEXT_PUBLIC_API_URL": ""}
 
         try:
             self._frontend_process = Popen(
@@ -144,16 +146,19 @@ class NextJsGuiAdapter:
         if process is None:
             return
 
+        # A bare TCP connect is enough to know the dev server is listening,
+        # and it keeps probe requests off the still-compiling server.
+        address = (self._frontend_browser_host, self._frontend_port)
         deadline = time.monotonic() + 25.0
         while time.monotonic() < deadline:
             if process.poll() is not None:
                 code = process.returncode
                 raise RuntimeError(f"Next.js dev server exited with code {code}.")
             try:
-                with urlopen(self._frontend_url, timeout=1.0):
+                with socket.create_connection(address, timeout=0.1):
                     return
-            except Exception:
-                time.sleep(0.25)
+            except OSError:
+                time.sleep(0.05)
 
         print(
             "Next.js dev server is still starting; "
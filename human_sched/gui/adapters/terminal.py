@@ -3,10 +3,38 @@
 from __future__ import annotations
 
 import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
 
 from human_sched.gui.contract import GuiAdapterMetadata
 from human_sched.gui.facade import SchedulerGuiFacade
 
+# Command word -> facade method; task commands take the id after a space.
+_QUERY_COMMANDS = {
+    "areas": "list_life_areas",
+    "tasks": "list_tasks",
+    "what": "what_next",
+}
+_TASK_COMMANDS = {
+    "pause": "pause_task",
+    "resume": "resume_task",
+    "complete": "complete_task",
+}
+
+
+def _format_json(payload: Any) -> str:
+    """Indented JSON for display; orjson when installed, else the stdlib."""
+    if orjson is not None:
+        return orjson.dumps(
+            payload,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode("utf-8")
+    return json.dumps(payload, indent=2)
+
 
 class TerminalGuiAdapter:
     """Minimal terminal adapter used as a second pluggable GUI."""
@@ -48,24 +76,17 @@ class TerminalGuiAdapter:
                 print("areas | tasks | what | pause <id> | resume <id> | complete <id> | quit")
                 continue
 
+            command, _, argument = raw.partition(" ")
             try:
-                if raw == "areas":
-                    print(json.dumps(self._facade.list_life_areas(), indent=2))
-                elif raw == "tasks":
-                    print(json.dumps(self._facade.list_tasks(), indent=2))
-                elif raw == "what":
-                    print(json.dumps(self._facade.what_next(), indent=2))
-                elif raw.startswith("pause "):
-                    task_id = int(raw.split(" ", 1)[1])
-                    print(json.dumps(self._facade.pause_task(task_id=task_id), indent=2))
-                elif raw.startswith("resume "):
-                    task_id = int(raw.split(" ", 1)[1])
-                    print(json.dumps(self._facade.resume_task(task_id=task_id), indent=2))
-                elif raw.startswith("complete "):
-                    task_id = int(raw.split(" ", 1)[1])
-                    print(json.dumps(self._facade.complete_task(task_id=task_id), indent=2))
+                if not argument and command in _QUERY_COMMANDS:
+                    result = getattr(self._facade, _QUERY_COMMANDS[command])()
+                elif argument and command in _TASK_COMMANDS:
+                    method = getattr(self._facade, _TASK_COMMANDS[command])
+                    result = method(task_id=int(argument))
                 else:
                     print("Unknown command. Type 'help'.")
+                    continue
+                print(_format_json(result))
             except Exception as exc:  # pragma: no cover - interactive adapter safety net
                 print(f"Error: {exc}")
 
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from pathlib import Path
+
+# Shared with the time-scale loader, which reads the same file: one regex pass
+# per (mtime, size) change, cached in-process.
+from human_sched.adapters import read_env_file
 
 
 _TRUE_VALUES = {"1", "true", "yes", "on", "y"}
@@ -33,7 +36,7 @@ class GuiConfig:
 def load_gui_config(env_file: str = ".env") -> GuiConfig:
     """Load GUI config from env file with safe parsing defaults."""
 
-    env = _parse_env_file(env_file)
+    env = read_env_file(env_file)
 
     adapter_name = env.get("GUI_ADAPTER", "nextjs").strip() or "nextjs"
     host = env.get("GUI_HOST", "127.0.0.1").strip() or "127.0.0.1"
@@ -59,34 +62,6 @@ def load_gui_config(env_file: str = ".env") -> GuiConfig:
     )
 
 
-def _parse_env_file(path: str) -> dict[str, str]:
-    env_path = Path(path)
-    if not env_path.exists():
-        return {}
-
-    env: dict[str, str] = {}
-    for line in env_path.read_text(encoding="utf-8").splitlines():
-        text = line.strip()
-        if not text or text.startswith("#"):
-            continue
-        if text.startswith("export "):
-            text = text[7:].strip()
-        if "=" not in text:
-            continue
-
-        key, value = text.split("=", 1)
-        key = key.strip()
-        value = value.strip()
-
-        if len(value) >= 2 and value[0] == value[-1] and value[0] in ("'", '"'):
-            value = value[1:-1]
-
-        if key:
-            env[key] = value
-
-    return env
-
-
 def _env_int(env: dict[str, str], key: str, default: int, minimum: int) -> int:
     raw = env.get(key)
     if raw is None or raw == "":
@@ -3,22 +3,221 @@
 from __future__ import annotations
 
 from collections import deque
-from dataclasses import dataclass
-from datetime import datetime, timezone
-from queue import Empty, Full, Queue
-from threading import RLock
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+import json
+import sys
+from threading import Event, RLock
+import time
+from typing import Any, Sequence
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
 
-@dataclass(frozen=True, slots=True)
+
+_POSIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+
+
+@dataclass(frozen=True, slots=True, init=False)
 class SchedulerEvent:
     """Serializable scheduler event emitted to GUI adapters."""
 
     event_id: int
     event_type: str
     message: str
-    timestamp: datetime
-    related_task_id: int | None = None
-    source: str = "scheduler"
+    # POSIX nanoseconds; the datetime and ISO forms are derived on demand.
+    timestamp_ns: int
+    related_task_id: int | None
+    source: str
+    _timestamp_iso: str | None = field(init=False, repr=False, compare=False)
+    _sse_frame: bytes | None = field(init=False, repr=False, compare=False)
+
+    def __init__(
+        self,
+        event_id: int,
+        event_type: str,
+        message: str,
+        timestamp: datetime | None = None,
+        related_task_id: int | None = None,
+        source: str = "scheduler",
+        *,
+        timestamp_ns: int | None = None,
+    ) -> None:
+        # ``timestamp`` keeps the original datetime signature working; the hub
+        # passes ``timestamp_ns`` straight from time.time_ns().
+        if timestamp_ns is None:
+            if timestamp is None:
+                raise TypeError("SchedulerEvent requires timestamp or timestamp_ns")
+            if timestamp.tzinfo is None:
+                timestamp = timestamp.replace(tzinfo=timezone.utc)
+            timestamp_ns = (timestamp - _POSIX_EPOCH) // _ONE_US * 1000
+        setattr_ = object.__setattr__
+        setattr_(self, "event_id", event_id)
+        setattr_(self, "event_type", event_type)
+        setattr_(self, "message", message)
+        setattr_(self, "timestamp_ns", timestamp_ns)
+        setattr_(self, "related_task_id", related_task_id)
+        setattr_(self, "source", source)
+        setattr_(self, "_timestamp_iso", None)
+        setattr_(self, "_sse_frame", None)
+
+    @property
+    def timestamp(self) -> datetime:
+        return _POSIX_EPOCH + timedelta(microseconds=self.timestamp_ns // 1000)
+
+    @property
+    def timestamp_iso(self) -> str:
+        """ISO-8601 form, formatted on first read and shared by every reader."""
+        iso = self._timestamp_iso
+        if iso is None:
+            iso = self.timestamp.isoformat()
+            object.__setattr__(self, "_timestamp_iso", iso)
+        return iso
+
+    def payload(self) -> dict[str, Any]:
+        """JSON-ready form shared by the HTTP API and the event stream."""
+        return {
+            "event_id": self.event_id,
+            "event_type": self.event_type,
+            "message": self.message,
+            "timestamp": self.timestamp_iso,
+            "related_task_id": self.related_task_id,
+            "source": self.source,
+        }
+
+    @property
+    def sse_frame(self) -> bytes:
+        """Complete ``text/event-stream`` frame, encoded once for all subscribers."""
+        frame = self._sse_frame
+        if frame is None:
+            frame = b"id: %d\nevent: %s\ndata: %s\n\n" % (
+                self.event_id,
+                self.event_type.encode("utf-8"),
+                _encode_json(self.payload()),
+            )
+            object.__setattr__(self, "_sse_frame", frame)
+        return frame
+
+
+def _encode_json(payload: Any) -> bytes:
+    """Compact UTF-8 JSON; orjson when installed, else the stdlib."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+class _Mailbox:
+    """Bounded single-producer/single-consumer mailbox for one subscriber.
+
+    Publishers are serialized by the hub lock and only the subscriber's reader
+    consumes. ``deque.append``/``popleft`` are atomic, so the mailbox needs no
+    lock of its own; ``_ready`` wakes a blocked reader. A full mailbox drops
+    the incoming event, as ``Queue.put_nowait`` did.
+    """
+
+    __slots__ = ("_buffer", "_capacity", "_ready")
+
+    def __init__(self, capacity: int) -> None:
+        self._buffer: deque[SchedulerEvent] = deque()
+        self._capacity = capacity
+        self._ready = Event()
+
+    def put_nowait(self, event: SchedulerEvent) -> bool:
+        """Append ``event``; returns False (dropping it) when the mailbox is full."""
+        # Only the reader runs concurrently, and it can only shrink the buffer.
+        if len(self._buffer) >= self._capacity:
+            return False
+        self._buffer.append(event)
+        self._ready.set()
+        return True
+
+    def put_many(self, events: Sequence[SchedulerEvent]) -> int:
+        """Append as many of ``events`` as fit with one wakeup; returns the number dropped."""
+        room = self._capacity - len(self._buffer)
+        accepted = events if len(events) <= room else events[:room]
+        if accepted:
+            self._buffer.extend(accepted)
+            self._ready.set()
+        return len(events) - len(accepted)
+
+    def get(self, timeout: float | None = None) -> SchedulerEvent | None:
+        """Pop the oldest event, waiting up to ``timeout`` seconds for one."""
+        buffer = self._buffer
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return buffer.popleft()
+            except IndexError:
+                pass
+
+            self._ready.clear()
+            # Re-check after clearing: a put may have landed in between.
+            if buffer:
+                continue
+            if deadline is None:
+                self._ready.wait()
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._ready.wait(remaining):
+                return None
+
+
+class _EventHistory:
+    """Fixed-size ring of the newest events; appends overwrite the oldest.
+
+    Reading the last ``n`` events is one or two list slices, never a copy of
+    the whole history.
+    """
+
+    __slots__ = ("_slots", "_capacity", "_head", "_count")
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = max(0, capacity)
+        # Unfilled slots hold None until the ring wraps once.
+        self._slots: list[SchedulerEvent] = [None] * self._capacity  # type: ignore[list-item]
+        self._head = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def append(self, event: SchedulerEvent) -> None:
+        capacity = self._capacity
+        if not capacity:
+            return
+        head = self._head
+        self._slots[head] = event
+        self._head = head + 1 if head + 1 < capacity else 0
+        if self._count < capacity:
+            self._count += 1
+
+    def extend(self, events: Sequence[SchedulerEvent]) -> None:
+        for event in events:
+            self.append(event)
+
+    def last(self) -> SchedulerEvent | None:
+        if not self._count:
+            return None
+        # Index -1 wraps to the final slot when the head sits at 0.
+        return self._slots[self._head - 1]
+
+    def tail(self, limit: int) -> list[SchedulerEvent]:
+        """The newest ``limit`` events, oldest first."""
+        count = min(limit, self._count)
+        if count <= 0:
+            return []
+        head = self._head
+        start = head - count
+        if start >= 0:
+            return self._slots[start:head]
+        return self._slots[start:] + self._slots[:head]
 
 
 class EventHub:
@@ -31,16 +230,33 @@ class EventHub:
         "_next_event_id",
         "_next_subscriber_id",
         "_dropped_event_count",
+        "_coalesced_event_count",
+        "_coalesce_window_ns",
+        "_last_publish_ns",
         "_lock",
     )
 
-    def __init__(self, *, history_limit: int = 512, subscriber_queue_size: int = 256) -> None:
-        self._events: deque[SchedulerEvent] = deque(maxlen=history_limit)
-        self._subscribers: dict[int, Queue[SchedulerEvent]] = {}
-        self._subscriber_queue_size = subscriber_queue_size
+    def __init__(
+        self,
+        *,
+        history_limit: int = 512,
+        subscriber_queue_size: int = 256,
+        coalesce_window_ms: int = 250,
+    ) -> None:
+        self._events = _EventHistory(history_limit)
+        self._subscribers: dict[int, _Mailbox] = {}
+        # Like Queue(maxsize=...), a size <= 0 means unbounded mailboxes.
+        self._subscriber_queue_size = (
+            subscriber_queue_size if subscriber_queue_size > 0 else sys.maxsize
+        )
         self._next_event_id = 1
         self._next_subscriber_id = 1
         self._dropped_event_count = 0
+        # A ``coalesce=True`` publish identical to the newest event within this
+        # window is suppressed; 0 disables coalescing.
+        self._coalesced_event_count = 0
+        self._coalesce_window_ns = max(0, coalesce_window_ms) * 1_000_000
+        self._last_publish_ns = 0
         self._lock = RLock()
 
     def publish(
@@ -48,54 +264,114 @@ class EventHub:
         *,
         event_type: str,
         message: str,
+        message_args: tuple[object, ...] = (),
         related_task_id: int | None = None,
         source: str = "scheduler",
-    ) -> SchedulerEvent:
+        coalesce: bool = False,
+    ) -> SchedulerEvent | None:
+        """Record and fan out one event; returns None if nothing would keep it.
+
+        With ``message_args`` the text is ``message % message_args``, formatted
+        only once the event is known to be retained. With ``coalesce`` a repeat
+        of the newest event inside the coalescing window returns that event
+        instead of publishing again.
+        """
         with self._lock:
+            if not self._subscribers and not self._events.capacity:
+                return None
+            if message_args:
+                message = message % message_args
+            now_ns = time.monotonic_ns()
+            last = self._events.last() if coalesce and self._coalesce_window_ns else None
+            if last is not None:
+                if (
+                    now_ns - self._last_publish_ns < self._coalesce_window_ns
+                    and last.message == message
+                    and last.event_type == event_type
+                    and last.related_task_id == related_task_id
+                    and last.source == source
+                ):
+                    # Subscribers already have this exact event; skip the fan-out.
+                    self._coalesced_event_count += 1
+                    return last
+            self._last_publish_ns = now_ns
+
             event = SchedulerEvent(
                 event_id=self._next_event_id,
                 event_type=event_type,
                 message=message,
-                timestamp=datetime.now(timezone.utc),
+                timestamp_ns=time.time_ns(),
                 related_task_id=related_task_id,
                 source=source,
             )
             self._next_event_id += 1
             self._events.append(event)
 
+            # Mailbox puts take no locks, so the fan-out is one append each.
             for queue in self._subscribers.values():
-                try:
-                    queue.put_nowait(event)
-                except Full:
+                if not queue.put_nowait(event):
                     self._dropped_event_count += 1
 
             return event
 
+    def publish_batch(
+        self,
+        entries: Sequence[tuple[str, str]],
+        *,
+        source: str = "scheduler",
+    ) -> list[SchedulerEvent]:
+        """Publish ``(event_type, message)`` pairs as consecutive events.
+
+        The whole burst shares one lock acquisition and timestamp, and each
+        subscriber gets a single wakeup for it.
+        """
+        if not entries:
+            return []
+        with self._lock:
+            if not self._subscribers and not self._events.capacity:
+                return []
+            timestamp_ns = time.time_ns()
+            first_id = self._next_event_id
+            events = [
+                SchedulerEvent(
+                    event_id=first_id + offset,
+                    event_type=event_type,
+                    message=message,
+                    timestamp_ns=timestamp_ns,
+                    source=source,
+                )
+                for offset, (event_type, message) in enumerate(entries)
+            ]
+            self._next_event_id = first_id + len(events)
+            self._last_publish_ns = time.monotonic_ns()
+            self._events.extend(events)
+
+            for queue in self._subscribers.values():
+                self._dropped_event_count += queue.put_many(events)
+
+            return events
+
     def list_recent(self, *, limit: int = 200) -> list[SchedulerEvent]:
         with self._lock:
             if limit <= 0:
                 return []
-            return list(self._events)[-limit:]
+            return self._events.tail(limit)
 
     def subscribe(self, *, after_event_id: int | None = None) -> int:
         with self._lock:
             subscriber_id = self._next_subscriber_id
             self._next_subscriber_id += 1
-            queue: Queue[SchedulerEvent] = Queue(maxsize=self._subscriber_queue_size)
+            queue = _Mailbox(self._subscriber_queue_size)
 
-            backlog = self._events
+            # History ids are consecutive, so the events after a given id are
+            # exactly the newest (last id - after_event_id) of them.
+            backlog_size = len(self._events)
             if after_event_id is not None:
-                backlog = deque(
-                    (event for event in self._events if event.event_id > after_event_id),
-                    maxlen=len(self._events),
-                )
-
-            for event in backlog:
-                try:
-                    queue.put_nowait(event)
-                except Full:
-                    self._dropped_event_count += 1
-                    break
+                backlog_size = min(backlog_size, self._next_event_id - 1 - after_event_id)
+            # One extend into the fresh mailbox; an overflowing replay still
+            # counts as a single drop, as the per-event loop did.
+            if queue.put_many(self._events.tail(backlog_size)):
+                self._dropped_event_count += 1
 
             self._subscribers[subscriber_id] = queue
             return subscriber_id
@@ -110,29 +386,26 @@ class EventHub:
         *,
         timeout_seconds: float | None = None,
     ) -> SchedulerEvent | None:
-        with self._lock:
-            queue = self._subscribers.get(subscriber_id)
+        # Single dict reads and history peeks see either the old or the new
+        # state, so the queries below skip the lock and never wait behind a
+        # publish.
+        queue = self._subscribers.get(subscriber_id)
         if queue is None:
             return None
-
-        try:
-            return queue.get(timeout=timeout_seconds)
-        except Empty:
-            return None
+        return queue.get(timeout=timeout_seconds)
 
     @property
     def dropped_event_count(self) -> int:
-        with self._lock:
-            return self._dropped_event_count
+        return self._dropped_event_count
+
+    @property
+    def coalesced_event_count(self) -> int:
+        return self._coalesced_event_count
 
     @property
     def subscriber_count(self) -> int:
-        with self._lock:
-            return len(self._subscribers)
+        return len(self._subscribers)
 
     @property
     def last_event(self) -> SchedulerEvent | None:
-        with self._lock:
-            if not self._events:
-                return None
-            return self._events[-1]
+        return self._events.last()
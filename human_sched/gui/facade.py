@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import copy
 import re
+import time
 from datetime import datetime, timezone
 from threading import RLock
 from typing import Any, Callable, TypeVar
 
-from human_sched.application.runtime import Dispatch, HumanTaskScheduler
+from human_sched.application.runtime import Dispatch, DispatchSnapshot, HumanTaskScheduler
 from human_sched.domain.life_area import LifeArea
 from human_sched.domain.task import Task
 from human_sched.domain.urgency import UrgencyTier
@@ -21,6 +22,9 @@ from xnu_sched.thread import Thread, ThreadState
 
 T = TypeVar("T")
 
+# Task state filter values as the API spells them ("runnable", "waiting", ...).
+_THREAD_STATES_BY_FILTER = {state.name.lower(): state for state in ThreadState}
+
 
 class SchedulerGuiFacade:
     """Facade that isolates GUI adapters from scheduler internals."""
@@ -29,24 +33,30 @@ class SchedulerGuiFacade:
         "_scheduler",
         "_event_hub",
         "_lock",
+        "_command_seq",
         "_last_successful_command_at",
         "_last_command_error",
         "_last_dispatch_task_id",
         "_last_dispatch_at",
         "_last_dispatch_reason",
         "_last_dispatch_decision",
+        "_task_dtos",
     )
 
     def __init__(self, scheduler: HumanTaskScheduler, event_hub: EventHub) -> None:
         self._scheduler = scheduler
         self._event_hub = event_hub
         self._lock = RLock()
+        # Seqlock counter: odd while a command holds ``_lock``.
+        self._command_seq = 0
         self._last_successful_command_at: datetime | None = None
         self._last_command_error: str | None = None
         self._last_dispatch_task_id: int | None = None
         self._last_dispatch_at: datetime | None = None
         self._last_dispatch_reason: str | None = None
         self._last_dispatch_decision: str | None = None
+        # id -> (source fields, serialized dict); reused until a field changes.
+        self._task_dtos: dict[int, tuple[tuple[Any, ...], dict[str, Any]]] = {}
 
     # ------------------------------------------------------------------
     # Commands
@@ -56,7 +66,7 @@ class SchedulerGuiFacade:
             if not name.strip():
                 raise ValueError("Life area name is required")
             area = self._scheduler.create_life_area(name=name)
-            self.publish_info(f"Life area '{area.name}' is ready.")
+            self.publish_info("Life area '%s' is ready.", area.name)
             return self._serialize_life_area(area)
 
         return self._run_command(_create)
@@ -64,9 +74,17 @@ class SchedulerGuiFacade:
     def delete_life_area(self, *, life_area_id: int) -> dict[str, Any]:
         def _delete() -> dict[str, Any]:
             area, deleted_task_count = self._scheduler.delete_life_area(life_area_id)
+            tasks_by_id = self._scheduler.tasks_by_id
+            # list() snapshots the keys in one step; lock-free queries may be storing.
+            for task_id in list(self._task_dtos):
+                if task_id not in tasks_by_id:
+                    self._task_dtos.pop(task_id, None)
             task_word = "task" if deleted_task_count == 1 else "tasks"
             self.publish_info(
-                f"Deleted life area '{area.name}' and removed {deleted_task_count} {task_word}.",
+                "Deleted life area '%s' and removed %d %s.",
+                area.name,
+                deleted_task_count,
+                task_word,
             )
             return {
                 "life_area": self._serialize_life_area(area),
@@ -78,7 +96,7 @@ class SchedulerGuiFacade:
     def rename_life_area(self, *, life_area_id: int, name: str) -> dict[str, Any]:
         def _rename() -> dict[str, Any]:
             area = self._scheduler.rename_life_area(life_area_id, name=name)
-            self.publish_info(f"Life area renamed to '{area.name}'.")
+            self.publish_info("Life area renamed to '%s'.", area.name)
             return self._serialize_life_area(area)
 
         return self._run_command(_rename)
@@ -106,7 +124,10 @@ class SchedulerGuiFacade:
                 start_runnable=True,
             )
             self.publish_info(
-                f"Task '{task.title}' created in {task.life_area.name} ({task.urgency_tier.label}).",
+                "Task '%s' created in %s (%s).",
+                task.title,
+                task.life_area.name,
+                task.urgency_tier.label,
                 related_task_id=task.task_id,
             )
             return self._serialize_task(task)
@@ -135,12 +156,15 @@ class SchedulerGuiFacade:
                     f"{self._clock_time(task.active_window_end_minute)}"
                 )
                 self.publish_info(
-                    f"Set active window for '{task.title}' to {window}.",
+                    "Set active window for '%s' to %s.",
+                    task.title,
+                    window,
                     related_task_id=task.task_id,
                 )
             else:
                 self.publish_info(
-                    f"Cleared active window for '{task.title}'.",
+                    "Cleared active window for '%s'.",
+                    task.title,
                     related_task_id=task.task_id,
                 )
             return self._serialize_task(task)
@@ -159,7 +183,9 @@ class SchedulerGuiFacade:
                 urgency_tier=urgency_tier,
             )
             self.publish_info(
-                f"Changed urgency for '{task.title}' to {task.urgency_tier.label}.",
+                "Changed urgency for '%s' to %s.",
+                task.title,
+                task.urgency_tier.label,
                 related_task_id=task.task_id,
             )
             return self._serialize_task(task)
@@ -170,7 +196,8 @@ class SchedulerGuiFacade:
         def _rename() -> dict[str, Any]:
             task = self._scheduler.rename_task(task_id, title=title)
             self.publish_info(
-                f"Task renamed to '{task.title}'.",
+                "Task renamed to '%s'.",
+                task.title,
                 related_task_id=task.task_id,
             )
             return self._serialize_task(task)
@@ -182,7 +209,7 @@ class SchedulerGuiFacade:
             task = self._scheduler.pause_task(task_id)
             if task is None:
                 raise KeyError(f"Unknown task id: {task_id}")
-            self.publish_info(f"Paused '{task.title}'.", related_task_id=task.task_id)
+            self.publish_info("Paused '%s'.", task.title, related_task_id=task.task_id)
             return self._serialize_task(task)
 
         return self._run_command(_pause)
@@ -190,7 +217,7 @@ class SchedulerGuiFacade:
     def resume_task(self, *, task_id: int) -> dict[str, Any]:
         def _resume() -> dict[str, Any]:
             task = self._scheduler.resume_task(task_id)
-            self.publish_info(f"Resumed '{task.title}'.", related_task_id=task.task_id)
+            self.publish_info("Resumed '%s'.", task.title, related_task_id=task.task_id)
             return self._serialize_task(task)
 
         return self._run_command(_resume)
@@ -200,7 +227,7 @@ class SchedulerGuiFacade:
             task = self._scheduler.complete_task(task_id)
             if task is None:
                 raise KeyError(f"Unknown task id: {task_id}")
-            self.publish_info(f"Completed '{task.title}'.", related_task_id=task.task_id)
+            self.publish_info("Completed '%s'.", task.title, related_task_id=task.task_id)
             return self._serialize_task(task)
 
         return self._run_command(_complete)
@@ -213,7 +240,7 @@ class SchedulerGuiFacade:
                 self._last_dispatch_at = None
                 self._last_dispatch_reason = None
                 self._last_dispatch_decision = None
-            self.publish_info(f"Deleted '{task.title}'.", related_task_id=task.task_id)
+            self.publish_info("Deleted '%s'.", task.title, related_task_id=task.task_id)
             return self._serialize_task(task)
 
         return self._run_command(_delete)
@@ -227,7 +254,9 @@ class SchedulerGuiFacade:
             self._last_dispatch_reason = None
             self._last_dispatch_decision = None
             self.publish_info(
-                f"Simulation reset to t=0. Re-queued {reset_task_count} {task_word}.",
+                "Simulation reset to t=0. Re-queued %d %s.",
+                reset_task_count,
+                task_word,
             )
             return {
                 "status": "ok",
@@ -239,7 +268,7 @@ class SchedulerGuiFacade:
     def what_next(self) -> dict[str, Any] | None:
         def _select() -> dict[str, Any] | None:
             before_snapshot = self._scheduler.get_dispatch_snapshot()
-            before_task = before_snapshot["active_task"]
+            before_task = before_snapshot.active_task
             before_tid = before_task.task_id if isinstance(before_task, Task) else None
 
             dispatch = self._scheduler.what_next()
@@ -250,7 +279,9 @@ class SchedulerGuiFacade:
             snapshot = self._scheduler.get_dispatch_snapshot()
             dto = self._serialize_dispatch(dispatch, before_tid=before_tid, snapshot=snapshot)
             self.publish_info(
-                f"What Next: {dto['decision']} -> '{dispatch.task.title}'.",
+                "What Next: %s -> '%s'.",
+                dto["decision"],
+                dispatch.task.title,
                 related_task_id=dispatch.task.task_id,
             )
             return dto
@@ -260,10 +291,11 @@ class SchedulerGuiFacade:
     # ------------------------------------------------------------------
     # Queries
     # ------------------------------------------------------------------
+    # List queries read only scheduler snapshots and the serialization caches
+    # (single dict get/set), so they never wait behind a running command.
     def list_life_areas(self) -> list[dict[str, Any]]:
-        with self._lock:
-            areas = sorted(self._scheduler.list_life_areas(), key=lambda area: area.life_area_id)
-            return [self._serialize_life_area(area) for area in areas]
+        areas = sorted(self._scheduler.list_life_areas(), key=lambda area: area.life_area_id)
+        return [self._serialize_life_area(area) for area in areas]
 
     def list_tasks(
         self,
@@ -272,27 +304,34 @@ class SchedulerGuiFacade:
         urgency_tier: str | None = None,
         state: str | None = None,
     ) -> list[dict[str, Any]]:
-        with self._lock:
-            tasks = list(self._scheduler.list_tasks())
-
-            if life_area_id is not None:
-                tasks = [task for task in tasks if task.life_area.life_area_id == life_area_id]
-
-            if urgency_tier:
-                normalized_urgency = UrgencyTier.from_value(urgency_tier)
-                tasks = [task for task in tasks if task.urgency_tier == normalized_urgency]
-
-            if state:
-                normalized_state = state.strip().upper()
-                tasks = [task for task in tasks if task.state.name == normalized_state]
+        # The area filter is answered from the area's own task ids.
+        candidates = self._scheduler.list_tasks(life_area_id=life_area_id)
+
+        normalized_urgency = UrgencyTier.from_value(urgency_tier) if urgency_tier else None
+        normalized_state = None
+        if state:
+            normalized_state = _THREAD_STATES_BY_FILTER.get(state.strip().lower())
+            if normalized_state is None:
+                # No task can be in an unknown state.
+                return []
+        if normalized_urgency is None and normalized_state is None:
+            tasks = list(candidates)
+        else:
+            # Remaining filters share one pass.
+            tasks = [
+                task
+                for task in candidates
+                if (normalized_urgency is None or task.urgency_tier is normalized_urgency)
+                and (normalized_state is None or task.thread.state is normalized_state)
+            ]
 
-            tasks.sort(key=lambda task: task.created_at, reverse=True)
-            return [self._serialize_task(task) for task in tasks]
+        tasks.sort(key=lambda task: task.created_at, reverse=True)
+        return [self._serialize_task(task) for task in tasks]
 
     def current_dispatch(self) -> dict[str, Any] | None:
         with self._lock:
             snapshot = self._scheduler.get_dispatch_snapshot()
-            task = snapshot["active_task"]
+            task = snapshot.active_task
             if not isinstance(task, Task):
                 self._last_dispatch_task_id = None
                 self._last_dispatch_at = None
@@ -300,12 +339,12 @@ class SchedulerGuiFacade:
                 self._last_dispatch_decision = None
                 return None
 
-            now_us = int(snapshot["now_us"])
-            quantum_end_us = int(snapshot["quantum_end_us"])
+            now_us = int(snapshot.now_us)
+            quantum_end_us = int(snapshot.quantum_end_us)
             remaining_us = max(0, quantum_end_us - now_us)
 
-            switch_reason = snapshot["last_switch_reason"]
-            switch_timestamp_us = snapshot["last_switch_timestamp_us"]
+            switch_reason = snapshot.last_switch_reason
+            switch_timestamp_us = snapshot.last_switch_timestamp_us
 
             if self._last_dispatch_task_id != task.task_id:
                 self._last_dispatch_task_id = task.task_id
@@ -345,6 +384,18 @@ class SchedulerGuiFacade:
             return None
         return self._serialize_event(event)
 
+    def next_event_frame(
+        self,
+        subscriber_id: int,
+        *,
+        timeout_seconds: float | None = None,
+    ) -> bytes | None:
+        """Next event as a ready-to-write SSE frame, encoded once per event."""
+        event = self._event_hub.next_event(subscriber_id, timeout_seconds=timeout_seconds)
+        if event is None:
+            return None
+        return event.sse_frame
+
     def app_settings(self) -> dict[str, Any]:
         return {
             "urgency_tiers": [
@@ -368,185 +419,187 @@ class SchedulerGuiFacade:
         event_stream_retried_writes: int,
         event_stream_dropped_clients: int,
     ) -> dict[str, Any]:
-        with self._lock:
-            last_event = self._event_hub.last_event
-            last_event_timestamp = self._iso(last_event.timestamp) if last_event else None
-            lag_ms = None
-            if last_event is not None:
-                lag_ms = int((self._wall_now() - last_event.timestamp).total_seconds() * 1000)
+        last_successful_command_at, last_command_error = self._command_status()
+        last_event = self._event_hub.last_event
+        last_event_timestamp = None
+        lag_ms = None
+        if last_event is not None:
+            last_event_timestamp = last_event.timestamp_iso
+            lag_ms = (time.time_ns() - last_event.timestamp_ns) // 1_000_000
 
-            return {
-                "adapter_name": adapter_metadata.name,
-                "adapter_version": adapter_metadata.version,
-                "contract_version": CONTRACT_VERSION,
-                "scheduler_connection_status": "connected",
-                "scheduler_base_url": base_url,
-                "event_stream_status": event_stream_status,
-                "event_stream_active_clients": event_stream_active_clients,
-                "last_event_timestamp": last_event_timestamp,
-                "event_lag_ms": lag_ms,
-                "last_successful_command_time": self._iso(self._last_successful_command_at),
-                "last_command_error": self._last_command_error,
-                "dropped_event_count": self._event_hub.dropped_event_count,
-                "event_stream_dropped_clients": event_stream_dropped_clients,
-                "event_stream_retried_writes": event_stream_retried_writes,
-            }
+        return {
+            "adapter_name": adapter_metadata.name,
+            "adapter_version": adapter_metadata.version,
+            "contract_version": CONTRACT_VERSION,
+            "scheduler_connection_status": "connected",
+            "scheduler_base_url": base_url,
+            "event_stream_status": event_stream_status,
+            "event_stream_active_clients": event_stream_active_clients,
+            "last_event_timestamp": last_event_timestamp,
+            "event_lag_ms": lag_ms,
+            "last_successful_command_time": self._iso(last_successful_command_at),
+            "last_command_error": last_command_error,
+            "dropped_event_count": self._event_hub.dropped_event_count,
+            "event_stream_dropped_clients": event_stream_dropped_clients,
+            "event_stream_retried_writes": event_stream_retried_writes,
+        }
 
     def scheduler_state(self) -> dict[str, Any]:
         """Live snapshot of scheduler internals for the dashboard."""
         with self._lock:
-            scheduler = self._scheduler
-            with scheduler._lock:
-                now_us = scheduler._now_us()
-                scheduler._apply_lazy_catchup(now_us)
-
-                processor = scheduler.processor
-                active_thread = processor.active_thread
-                run_queue_rank_by_tid = self._compute_run_queue_rank_by_tid(now_us)
-
-                # Thread (task) list with scheduler metadata
-                threads: list[dict[str, Any]] = []
-                for task in scheduler.tasks_by_id.values():
-                    t = task.thread
-                    quantum_base_us = self._thread_quantum_base_us(t)
-                    quantum_remaining_us = t.quantum_remaining
-                    if active_thread is not None and t.tid == active_thread.tid and processor.quantum_end > 0:
-                        quantum_remaining_us = max(0, processor.quantum_end - now_us)
-                    quantum_base_hours = scheduler.time_scale.us_to_hours(quantum_base_us)
-                    quantum_remaining_hours = scheduler.time_scale.us_to_hours(quantum_remaining_us)
-
-                    threads.append({
-                        "task_id": task.task_id,
-                        "title": task.title,
-                        "life_area": task.life_area.name,
-                        "urgency_tier": task.urgency_tier.value,
-                        "urgency_label": task.urgency_tier.label,
-                        "state": t.state.name.lower(),
-                        "sched_bucket": BUCKET_NAMES.get(t.th_sched_bucket, str(t.th_sched_bucket)),
-                        "base_pri": t.base_pri,
-                        "sched_pri": t.sched_pri,
-                        "cpu_usage": t.cpu_usage,
-                        "cpu_usage_hours": scheduler.time_scale.us_to_hours(t.cpu_usage),
-                        "total_cpu_us": t.total_cpu_us,
-                        "context_switches": t.context_switches,
-                        "quantum_base_us": quantum_base_us,
-                        "quantum_remaining_us": quantum_remaining_us,
-                        "quantum_base_hours": quantum_base_hours,
-                        "quantum_remaining_hours": quantum_remaining_hours,
-                        "is_active": active_thread is not None and t.tid == active_thread.tid,
-                        "run_queue_rank": run_queue_rank_by_tid.get(t.tid),
-                    })
-
-                # Life area interactivity scores
-                life_areas: list[dict[str, Any]] = []
-                for area in scheduler.life_areas_by_id.values():
-                    life_areas.append({
-                        "id": area.life_area_id,
-                        "name": area.name,
-                        "task_count": len(area.task_ids),
-                        "interactivity_scores": area.interactivity_scores(),
-                    })
-
-                # Scheduler-wide state
-                quantum_end_us = processor.quantum_end
-                remaining_us = max(0, quantum_end_us - now_us) if quantum_end_us > 0 else 0
-                total_us = self._thread_quantum_base_us(active_thread) if active_thread is not None else 0
-                remaining_hours = scheduler.time_scale.us_to_hours(remaining_us)
-                total_hours = scheduler.time_scale.us_to_hours(total_us)
-
-                warp_bucket_label: str | None = None
-                warp_remaining_us = 0
-                warp_total_us = 0
-                active_bucket: int | None = None
-                if active_thread is not None:
-                    active_bucket = int(active_thread.th_sched_bucket)
-                    warp_bucket_label = BUCKET_NAMES.get(active_bucket, str(active_bucket))
-                    if 0 <= active_bucket < len(ROOT_BUCKET_WARP_US) and not is_above_timeshare(active_bucket):
-                        root_bucket = scheduler.scheduler.clutch_root.scr_unbound_buckets[active_bucket]
-                        warp_remaining_us = max(0, int(root_bucket.scrb_warp_remaining))
-                        warp_total_us = max(0, int(ROOT_BUCKET_WARP_US[active_bucket]))
-
-                warp_remaining_hours = scheduler.time_scale.us_to_hours(warp_remaining_us)
-                warp_total_hours = scheduler.time_scale.us_to_hours(warp_total_us)
-
-                warp_budgets: list[dict[str, Any]] = []
-                edf_deadlines: list[dict[str, Any]] = []
-                for bucket in range(len(scheduler.scheduler.clutch_root.scr_unbound_buckets)):
-                    root_bucket = scheduler.scheduler.clutch_root.scr_unbound_buckets[bucket]
-                    is_timeshare_bucket = not is_above_timeshare(bucket)
-                    if is_timeshare_bucket:
-                        bucket_total_us = (
-                            max(0, int(ROOT_BUCKET_WARP_US[bucket]))
-                            if 0 <= bucket < len(ROOT_BUCKET_WARP_US)
-                            else 0
-                        )
-                        bucket_remaining_us = min(
-                            bucket_total_us,
-                            max(0, int(root_bucket.scrb_warp_remaining)),
-                        )
-                        warp_budgets.append({
-                            "bucket": BUCKET_NAMES.get(bucket, str(bucket)),
-                            "remaining_us": bucket_remaining_us,
-                            "total_us": bucket_total_us,
-                            "remaining_hours": scheduler.time_scale.us_to_hours(bucket_remaining_us),
-                            "total_hours": scheduler.time_scale.us_to_hours(bucket_total_us),
-                            "is_active": active_bucket == bucket,
-                        })
-
-                    deadline_us = int(root_bucket.scrb_deadline) if is_timeshare_bucket else 0
-                    deadline_remaining_us = max(0, deadline_us - now_us) if deadline_us > 0 else 0
-                    deadline_at = (
-                        self._iso(scheduler.time_scale.scheduler_us_to_wall(deadline_us))
-                        if deadline_us > 0
-                        else None
-                    )
-                    edf_deadlines.append({
-                        "bucket": BUCKET_NAMES.get(bucket, str(bucket)),
-                        "deadline_us": deadline_us,
-                        "deadline_remaining_us": deadline_remaining_us,
-                        "deadline_remaining_hours": scheduler.time_scale.us_to_hours(deadline_remaining_us),
-                        "deadline_at": deadline_at,
-                        "is_active": active_bucket == bucket,
-                    })
-
-                active_edf = next(
-                    (entry for entry in edf_deadlines if entry["is_active"]),
-                    None,
+            return self._scheduler.catch_up_and_snapshot(self._build_scheduler_state)
+
+    def _build_scheduler_state(self, now_us: int) -> dict[str, Any]:
+        # Runs under the scheduler write lock, after lazy catch-up to ``now_us``.
+        scheduler = self._scheduler
+
+        processor = scheduler.processor
+        active_thread = processor.active_thread
+        run_queue_rank_by_tid = self._compute_run_queue_rank_by_tid(now_us)
+
+        # Thread (task) list with scheduler metadata
+        threads: list[dict[str, Any]] = []
+        for task in scheduler.tasks_by_id.values():
+            t = task.thread
+            quantum_base_us = self._thread_quantum_base_us(t)
+            quantum_remaining_us = t.quantum_remaining
+            if active_thread is not None and t.tid == active_thread.tid and processor.quantum_end > 0:
+                quantum_remaining_us = max(0, processor.quantum_end - now_us)
+            quantum_base_hours = scheduler.time_scale.us_to_hours(quantum_base_us)
+            quantum_remaining_hours = scheduler.time_scale.us_to_hours(quantum_remaining_us)
+
+            threads.append({
+                "task_id": task.task_id,
+                "title": task.title,
+                "life_area": task.life_area.name,
+                "urgency_tier": task.urgency_tier.value,
+                "urgency_label": task.urgency_tier.label,
+                "state": t.state.name.lower(),
+                "sched_bucket": BUCKET_NAMES.get(t.th_sched_bucket, str(t.th_sched_bucket)),
+                "base_pri": t.base_pri,
+                "sched_pri": t.sched_pri,
+                "cpu_usage": t.cpu_usage,
+                "cpu_usage_hours": scheduler.time_scale.us_to_hours(t.cpu_usage),
+                "total_cpu_us": t.total_cpu_us,
+                "context_switches": t.context_switches,
+                "quantum_base_us": quantum_base_us,
+                "quantum_remaining_us": quantum_remaining_us,
+                "quantum_base_hours": quantum_base_hours,
+                "quantum_remaining_hours": quantum_remaining_hours,
+                "is_active": active_thread is not None and t.tid == active_thread.tid,
+                "run_queue_rank": run_queue_rank_by_tid.get(t.tid),
+            })
+
+        # Life area interactivity scores
+        life_areas: list[dict[str, Any]] = []
+        for area in scheduler.life_areas_by_id.values():
+            life_areas.append({
+                "id": area.life_area_id,
+                "name": area.name,
+                "task_count": len(area.task_ids),
+                "interactivity_scores": area.interactivity_scores(),
+            })
+
+        # Scheduler-wide state
+        quantum_end_us = processor.quantum_end
+        remaining_us = max(0, quantum_end_us - now_us) if quantum_end_us > 0 else 0
+        total_us = self._thread_quantum_base_us(active_thread) if active_thread is not None else 0
+        remaining_hours = scheduler.time_scale.us_to_hours(remaining_us)
+        total_hours = scheduler.time_scale.us_to_hours(total_us)
+
+        warp_bucket_label: str | None = None
+        warp_remaining_us = 0
+        warp_total_us = 0
+        active_bucket: int | None = None
+        if active_thread is not None:
+            active_bucket = int(active_thread.th_sched_bucket)
+            warp_bucket_label = BUCKET_NAMES.get(active_bucket, str(active_bucket))
+            if 0 <= active_bucket < len(ROOT_BUCKET_WARP_US) and not is_above_timeshare(active_bucket):
+                root_bucket = scheduler.scheduler.clutch_root.scr_unbound_buckets[active_bucket]
+                warp_remaining_us = max(0, int(root_bucket.scrb_warp_remaining))
+                warp_total_us = max(0, int(ROOT_BUCKET_WARP_US[active_bucket]))
+
+        warp_remaining_hours = scheduler.time_scale.us_to_hours(warp_remaining_us)
+        warp_total_hours = scheduler.time_scale.us_to_hours(warp_total_us)
+
+        warp_budgets: list[dict[str, Any]] = []
+        edf_deadlines: list[dict[str, Any]] = []
+        for bucket in range(len(scheduler.scheduler.clutch_root.scr_unbound_buckets)):
+            root_bucket = scheduler.scheduler.clutch_root.scr_unbound_buckets[bucket]
+            is_timeshare_bucket = not is_above_timeshare(bucket)
+            if is_timeshare_bucket:
+                bucket_total_us = (
+                    max(0, int(ROOT_BUCKET_WARP_US[bucket]))
+                    if 0 <= bucket < len(ROOT_BUCKET_WARP_US)
+                    else 0
+                )
+                bucket_remaining_us = min(
+                    bucket_total_us,
+                    max(0, int(root_bucket.scrb_warp_remaining)),
                 )
+                warp_budgets.append({
+                    "bucket": BUCKET_NAMES.get(bucket, str(bucket)),
+                    "remaining_us": bucket_remaining_us,
+                    "total_us": bucket_total_us,
+                    "remaining_hours": scheduler.time_scale.us_to_hours(bucket_remaining_us),
+                    "total_hours": scheduler.time_scale.us_to_hours(bucket_total_us),
+                    "is_active": active_bucket == bucket,
+                })
+
+            deadline_us = int(root_bucket.scrb_deadline) if is_timeshare_bucket else 0
+            deadline_remaining_us = max(0, deadline_us - now_us) if deadline_us > 0 else 0
+            deadline_at = (
+                self._iso(scheduler.time_scale.scheduler_us_to_wall(deadline_us))
+                if deadline_us > 0
+                else None
+            )
+            edf_deadlines.append({
+                "bucket": BUCKET_NAMES.get(bucket, str(bucket)),
+                "deadline_us": deadline_us,
+                "deadline_remaining_us": deadline_remaining_us,
+                "deadline_remaining_hours": scheduler.time_scale.us_to_hours(deadline_remaining_us),
+                "deadline_at": deadline_at,
+                "is_active": active_bucket == bucket,
+            })
+
+        active_edf = next(
+            (entry for entry in edf_deadlines if entry["is_active"]),
+            None,
+        )
 
-                return {
-                    "now_us": now_us,
-                    "now_hours": scheduler.time_scale.us_to_hours(now_us),
-                    "tick": scheduler.scheduler.current_tick,
-                    "active_task_id": active_thread.tid if active_thread else None,
-                    "quantum_remaining_us": remaining_us,
-                    "quantum_total_us": total_us,
-                    "quantum_remaining_hours": remaining_hours,
-                    "quantum_total_hours": total_hours,
-                    "warp_budget_bucket": warp_bucket_label,
-                    "warp_budget_remaining_us": warp_remaining_us,
-                    "warp_budget_total_us": warp_total_us,
-                    "warp_budget_remaining_hours": warp_remaining_hours,
-                    "warp_budget_total_hours": warp_total_hours,
-                    "warp_budgets": warp_budgets,
-                    "edf_deadline_bucket": active_edf["bucket"] if active_edf is not None else None,
-                    "edf_deadline_us": active_edf["deadline_us"] if active_edf is not None else 0,
-                    "edf_deadline_remaining_us": (
-                        active_edf["deadline_remaining_us"] if active_edf is not None else 0
-                    ),
-                    "edf_deadline_remaining_hours": (
-                        active_edf["deadline_remaining_hours"] if active_edf is not None else 0.0
-                    ),
-                    "edf_deadline_at": active_edf["deadline_at"] if active_edf is not None else None,
-                    "edf_deadlines": edf_deadlines,
-                    "threads": threads,
-                    "life_areas": life_areas,
-                    "recent_trace": self._enrich_trace(
-                        scheduler.scheduler.trace_log[-30:],
-                        scheduler.time_scale,
-                    )[::-1],
-                    "recent_switches": scheduler.scheduler.processor_switch_log[-5:],
-                }
+        return {
+            "now_us": now_us,
+            "now_hours": scheduler.time_scale.us_to_hours(now_us),
+            "tick": scheduler.scheduler.current_tick,
+            "active_task_id": active_thread.tid if active_thread else None,
+            "quantum_remaining_us": remaining_us,
+            "quantum_total_us": total_us,
+            "quantum_remaining_hours": remaining_hours,
+            "quantum_total_hours": total_hours,
+            "warp_budget_bucket": warp_bucket_label,
+            "warp_budget_remaining_us": warp_remaining_us,
+            "warp_budget_total_us": warp_total_us,
+            "warp_budget_remaining_hours": warp_remaining_hours,
+            "warp_budget_total_hours": warp_total_hours,
+            "warp_budgets": warp_budgets,
+            "edf_deadline_bucket": active_edf["bucket"] if active_edf is not None else None,
+            "edf_deadline_us": active_edf["deadline_us"] if active_edf is not None else 0,
+            "edf_deadline_remaining_us": (
+                active_edf["deadline_remaining_us"] if active_edf is not None else 0
+            ),
+            "edf_deadline_remaining_hours": (
+                active_edf["deadline_remaining_hours"] if active_edf is not None else 0.0
+            ),
+            "edf_deadline_at": active_edf["deadline_at"] if active_edf is not None else None,
+            "edf_deadlines": edf_deadlines,
+            "threads": threads,
+            "life_areas": life_areas,
+            "recent_trace": self._enrich_trace(
+                scheduler.scheduler.recent_trace(30),
+                scheduler.time_scale,
+            )[::-1],
+            "recent_switches": scheduler.scheduler.recent_switches(5),
+        }
 
     def metadata(self, *, adapter_metadata: GuiAdapterMetadata, base_url: str) -> dict[str, Any]:
         return {
@@ -559,12 +612,24 @@ class SchedulerGuiFacade:
             "base_url": base_url,
         }
 
-    def publish_info(self, message: str, *, related_task_id: int | None = None) -> None:
+    def publish_info(
+        self,
+        message: str,
+        *args: object,
+        related_task_id: int | None = None,
+    ) -> None:
+        """Publish an info event; ``message % args`` is only formatted if retained.
+
+        Identical messages repeated within the hub's coalescing window collapse
+        into one event.
+        """
         self._event_hub.publish(
             event_type="info",
             message=message,
+            message_args=args,
             related_task_id=related_task_id,
             source="facade",
+            coalesce=True,
         )
 
     # ------------------------------------------------------------------
@@ -572,24 +637,63 @@ class SchedulerGuiFacade:
     # ------------------------------------------------------------------
     def _run_command(self, callback: Callable[[], T]) -> T:
         with self._lock:
+            outermost = not self._command_seq & 1
+            if outermost:
+                self._command_seq += 1
             try:
-                result = callback()
-            except Exception as exc:
-                self._last_command_error = str(exc)
-                raise
-            self._last_successful_command_at = self._wall_now()
-            self._last_command_error = None
-            return result
+                try:
+                    result = callback()
+                except Exception as exc:
+                    self._last_command_error = str(exc)
+                    raise
+                self._last_successful_command_at = self._wall_now()
+                self._last_command_error = None
+                return result
+            finally:
+                if outermost:
+                    self._command_seq += 1
+
+    def _command_status(self) -> tuple[datetime | None, str | None]:
+        """Last command time and error, read between two even ``_command_seq`` reads.
+
+        Falls back to the lock only while a command is running or just finished.
+        """
+        seq = self._command_seq
+        if not seq & 1:
+            status = (self._last_successful_command_at, self._last_command_error)
+            if self._command_seq == seq:
+                return status
+        with self._lock:
+            return self._last_successful_command_at, self._last_command_error
 
     def _serialize_task(self, task: Task) -> dict[str, Any]:
-        return {
+        life_area = task.life_area
+        state = task.state
+        key = (
+            task.title,
+            life_area.life_area_id,
+            life_area.name,
+            task.urgency_tier,
+            state,
+            task.active_window_start_minute,
+            task.active_window_end_minute,
+            task.notes,
+            task.created_at,
+        )
+        cached = self._task_dtos.get(task.task_id)
+        # Callers get shallow copies (every value is immutable), so an adapter
+        # editing a payload cannot leak into later responses.
+        if cached is not None and cached[0] == key:
+            return cached[1].copy()
+
+        payload = {
             "id": task.task_id,
             "title": task.title,
-            "life_area_id": task.life_area.life_area_id,
-            "life_area_name": task.life_area.name,
+            "life_area_id": life_area.life_area_id,
+            "life_area_name": life_area.name,
             "urgency_tier": task.urgency_tier.value,
             "urgency_label": task.urgency_tier.label,
-            "state": task.state.name.lower(),
+            "state": state.name.lower(),
             "active_window_start_local": self._clock_time(
                 task.active_window_start_minute,
             ),
@@ -599,6 +703,13 @@ class SchedulerGuiFacade:
             "notes": task.notes,
             "created_at": self._iso(task.created_at),
         }
+        task_dtos = self._task_dtos
+        task_dtos[task.task_id] = (key, payload)
+        # Queries serialize without the facade lock, so a delete may have
+        # pruned this id just before the store; re-check after storing.
+        if self._scheduler.tasks_by_id.get(task.task_id) is not task:
+            task_dtos.pop(task.task_id, None)
+        return payload.copy()
 
     def _serialize_life_area(self, life_area: LifeArea) -> dict[str, Any]:
         return {
@@ -613,10 +724,10 @@ class SchedulerGuiFacade:
         dispatch: Dispatch,
         *,
         before_tid: int | None,
-        snapshot: dict[str, Any],
+        snapshot: DispatchSnapshot,
     ) -> dict[str, Any]:
-        now_us = int(snapshot["now_us"])
-        quantum_end_us = int(snapshot["quantum_end_us"])
+        now_us = int(snapshot.now_us)
+        quantum_end_us = int(snapshot.quantum_end_us)
         remaining_us = max(0, quantum_end_us - now_us)
 
         decision = "start"
@@ -627,7 +738,7 @@ class SchedulerGuiFacade:
         self._last_dispatch_reason = dispatch.reason
         self._last_dispatch_decision = decision
 
-        switch_timestamp_us = snapshot["last_switch_timestamp_us"]
+        switch_timestamp_us = snapshot.last_switch_timestamp_us
         if isinstance(switch_timestamp_us, int):
             self._last_dispatch_at = self._scheduler.time_scale.scheduler_us_to_wall(switch_timestamp_us)
         else:
@@ -646,14 +757,7 @@ class SchedulerGuiFacade:
 
     @staticmethod
     def _serialize_event(event: SchedulerEvent) -> dict[str, Any]:
-        return {
-            "event_id": event.event_id,
-            "event_type": event.event_type,
-            "message": event.message,
-            "timestamp": event.timestamp.isoformat(),
-            "related_task_id": event.related_task_id,
-            "source": event.source,
-        }
+        return event.payload()
 
 
     _TRACE_TS_RE = re.compile(r"^\[\s*(\d+)us\]")
@@ -37,7 +37,7 @@ class GuiHost:
         try:
             has_persisted_state = bool(self.scheduler.list_life_areas() or self.scheduler.list_tasks())
             if has_persisted_state:
-                self.facade.publish_info(f"Loaded persisted scheduler data from '{config.data_dir}'.")
+                self.facade.publish_info("Loaded persisted scheduler data from '%s'.", config.data_dir)
             else:
                 try:
                     apply_seed_scenario(self.facade, config.seed_scenario)
@@ -82,9 +82,7 @@ class SchedulerHttpService:
         with self._lock:
             self._running = True
 
-        self.facade.publish_info(
-            f"Web adapter ready at {self.base_url}",
-        )
+        self.facade.publish_info("Web adapter ready at %s", self.base_url)
 
         try:
             self._httpd.serve_forever(poll_interval=0.5)
@@ -381,30 +379,26 @@ def build_request_handler(service: SchedulerHttpService) -> type[BaseHTTPRequest
             try:
                 self._write_sse_chunk(": connected\n\n")
                 while service.is_running:
-                    payload = service.facade.next_event(
+                    # Frames are encoded once per event and shared by every client.
+                    frame = service.facade.next_event_frame(
                         subscriber_id,
                         timeout_seconds=15.0,
                     )
-                    if payload is None:
+                    if frame is None:
                         if not self._write_sse_chunk(": keep-alive\n\n"):
                             break
                         continue
 
-                    event_lines = [
-                        f"id: {payload['event_id']}",
-                        f"event: {payload['event_type']}",
-                        f"data: {json.dumps(payload, separators=(',', ':'))}",
-                        "",
-                    ]
-                    text = "\n".join(event_lines) + "\n"
-                    if not self._write_sse_chunk(text):
+                    if not self._write_sse_bytes(frame):
                         break
             finally:
                 service.facade.unsubscribe_events(subscriber_id)
                 service.mark_sse_disconnected()
 
         def _write_sse_chunk(self, text: str) -> bool:
-            data = text.encode("utf-8")
+            return self._write_sse_bytes(text.encode("utf-8"))
+
+        def _write_sse_bytes(self, data: bytes) -> bool:
             try:
                 self.wfile.write(data)
                 self.wfile.flush()
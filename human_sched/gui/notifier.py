@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from threading import Lock, Timer
+from threading import Lock, Thread
+from typing import Sequence
 from uuid import uuid4
 
+from human_sched.adapters._timing_wheel import TimingWheel, WheelNode
 from human_sched.gui.events import EventHub
 from human_sched.ports.notifications import NotificationEventType, NotificationPort
 
@@ -13,12 +15,15 @@ from human_sched.ports.notifications import NotificationEventType, NotificationP
 class EventingNotifier(NotificationPort):
     """Bridges scheduler notifications to in-process GUI events."""
 
-    __slots__ = ("_event_hub", "_timers", "_lock")
+    __slots__ = ("_event_hub", "_timers", "_lock", "_wheel", "_wheel_thread")
 
     def __init__(self, event_hub: EventHub) -> None:
         self._event_hub = event_hub
-        self._timers: dict[str, Timer] = {}
+        self._timers: dict[str, WheelNode] = {}
         self._lock = Lock()
+        # One worker thread fires every scheduled notification.
+        self._wheel = TimingWheel()
+        self._wheel_thread: Thread | None = None
 
     def schedule_notification(
         self,
@@ -26,26 +31,53 @@ class EventingNotifier(NotificationPort):
         message: str,
         event_type: NotificationEventType,
     ) -> str:
-        if at.tzinfo is None:
-            at = at.replace(tzinfo=timezone.utc)
-
         notification_id = str(uuid4())
-        delay = max(0.0, (at - datetime.now(timezone.utc)).total_seconds())
-
-        timer = Timer(delay, self._fire_scheduled, args=(notification_id, message, event_type))
-        timer.daemon = True
+        delay_ns = self._delay_ns(at)
 
         with self._lock:
-            self._timers[notification_id] = timer
+            if self._wheel_thread is None:
+                self._wheel_thread = Thread(target=self._wheel.run, daemon=True)
+                self._wheel_thread.start()
+            node = self._wheel.schedule(
+                delay_ns,
+                self._fire_scheduled,
+                notification_id,
+                message,
+                event_type,
+            )
+            self._timers[notification_id] = node
+            if not node.is_linked:
+                # Already fired before the insert landed; don't leave it behind.
+                self._timers.pop(notification_id, None)
 
-        timer.start()
         return notification_id
 
+    def reschedule_notification(
+        self,
+        notification_id: str,
+        at: datetime,
+        message: str,
+        event_type: NotificationEventType,
+    ) -> str:
+        delay_ns = self._delay_ns(at)
+        with self._lock:
+            node = self._timers.get(notification_id)
+            if node is not None and self._wheel.reschedule(
+                node,
+                delay_ns,
+                notification_id,
+                message,
+                event_type,
+            ):
+                return notification_id
+        # Already fired or unknown: fall back to a fresh timer.
+        return self.schedule_notification(at, message, event_type)
+
     def cancel_notification(self, notification_id: str) -> None:
         with self._lock:
-            timer = self._timers.pop(notification_id, None)
-        if timer is not None:
-            timer.cancel()
+            node = self._timers.pop(notification_id, None)
+        if node is not None:
+            self._wheel.cancel(node)
 
     def notify_immediately(self, message: str, event_type: NotificationEventType) -> None:
         self._event_hub.publish(
@@ -54,6 +86,15 @@ class EventingNotifier(NotificationPort):
             source="runtime",
         )
 
+    def notify_batch(
+        self,
+        notifications: Sequence[tuple[str, NotificationEventType]],
+    ) -> None:
+        self._event_hub.publish_batch(
+            [(event_type.value, message) for message, event_type in notifications],
+            source="runtime",
+        )
+
     def _fire_scheduled(
         self,
         notification_id: str,
@@ -63,3 +104,10 @@ class EventingNotifier(NotificationPort):
         with self._lock:
             self._timers.pop(notification_id, None)
         self.notify_immediately(message, event_type)
+
+    @staticmethod
+    def _delay_ns(at: datetime) -> int:
+        if at.tzinfo is None:
+            at = at.replace(tzinfo=timezone.utc)
+        delay = max(0.0, (at - datetime.now(timezone.utc)).total_seconds())
+        return int(delay * 1_000_000_000)
@@ -41,7 +41,12 @@ class ScenarioFacade(Protocol):
     ) -> dict:
         ...
 
-    def publish_info(self, message: str, *, related_task_id: int | None = None) -> None:
+    def publish_info(
+        self,
+        message: str,
+        *args: object,
+        related_task_id: int | None = None,
+    ) -> None:
         ...
 
 
@@ -172,5 +177,5 @@ def apply_seed_scenario(facade: ScenarioFacade, scenario_name: str) -> str:
                 notes=task.notes,
             )
 
-    facade.publish_info(f"Loaded scenario '{scenario.label}'.")
+    facade.publish_info("Loaded scenario '%s'.", scenario.label)
     return key
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Protocol
+from typing import Protocol, Sequence
 
 
 class NotificationEventType(str, Enum):
@@ -30,5 +30,24 @@ class NotificationPort(Protocol):
     def cancel_notification(self, notification_id: str) -> None:
         """Cancel a previously scheduled notification."""
 
+    def reschedule_notification(
+        self,
+        notification_id: str,
+        at: datetime,
+        message: str,
+        event_type: NotificationEventType,
+    ) -> str:
+        """Move a scheduled notification to a new time; returns its (possibly new) id."""
+        self.cancel_notification(notification_id)
+        return self.schedule_notification(at, message, event_type)
+
     def notify_immediately(self, message: str, event_type: NotificationEventType) -> None:
         """Push an immediate notification for a scheduler event."""
+
+    def notify_batch(
+        self,
+        notifications: Sequence[tuple[str, NotificationEventType]],
+    ) -> None:
+        """Push several immediate notifications in one delivery."""
+        for message, event_type in notifications:
+            self.notify_immediately(message, event_type)
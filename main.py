@@ -291,7 +291,7 @@ def main() -> None:
     # Print trace if requested
     if args.trace:
         print("\n--- Event Trace ---")
-        for line in engine.scheduler.trace_log[-200:]:
+        for line in engine.scheduler.recent_trace(200):
             print(line)
         if len(engine.scheduler.trace_log) > 200:
             print(f"... ({len(engine.scheduler.trace_log) - 200} more events)")
@@ -1,18 +1,23 @@
 from __future__ import annotations
 
+import dataclasses
+import json
 import tempfile
 import unittest
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from threading import Event, Thread
 
 from human_sched.application.runtime import HumanTaskScheduler
 from human_sched.gui.adapters import create_adapter
 from human_sched.gui.config import GuiConfig
 from human_sched.gui.contract import GuiAdapterMetadata
-from human_sched.gui.events import EventHub
+from human_sched.gui.events import EventHub, SchedulerEvent
 from human_sched.gui.facade import SchedulerGuiFacade
 from human_sched.gui.host import GuiHost
 from human_sched.gui.http_service import SchedulerHttpService
 from human_sched.gui.notifier import EventingNotifier
+from human_sched.ports.notifications import NotificationEventType
 
 
 class GuiPlatformTests(unittest.TestCase):
@@ -82,6 +87,43 @@ class GuiPlatformTests(unittest.TestCase):
         self.assertEqual(payload["scheduler_base_url"], "http://127.0.0.1:8765")
         self.assertEqual(payload["event_stream_status"], "idle")
 
+    def test_facade_queries_do_not_wait_for_a_running_command(self) -> None:
+        area = self.facade.create_life_area(name="Home")
+        self.facade.create_task(
+            life_area_id=int(area["id"]),
+            title="Run laundry",
+            urgency_tier="normal",
+        )
+        metadata = GuiAdapterMetadata(name="nextjs", version="1.0.0")
+        entered = Event()
+        release = Event()
+
+        def _slow_command() -> None:
+            entered.set()
+            release.wait(5)
+
+        worker = Thread(target=self.facade._run_command, args=(_slow_command,))
+        worker.start()
+        try:
+            self.assertTrue(entered.wait(5))
+            self.assertEqual(len(self.facade.list_life_areas()), 1)
+            self.assertEqual(len(self.facade.list_tasks()), 1)
+        finally:
+            release.set()
+            worker.join()
+
+        payload = self.facade.diagnostics(
+            adapter_metadata=metadata,
+            base_url="http://127.0.0.1:8765",
+            event_stream_status="idle",
+            event_stream_active_clients=0,
+            event_stream_retried_writes=0,
+            event_stream_dropped_clients=0,
+        )
+        self.assertIsNone(payload["last_command_error"])
+        self.assertIsNotNone(payload["last_successful_command_time"])
+        self.assertEqual(self.facade._command_seq % 2, 0)
+
     def test_scheduler_state_includes_quantum_metadata(self) -> None:
         area = self.facade.create_life_area(name="Work")
         created = self.facade.create_task(
@@ -272,6 +314,73 @@ class GuiPlatformTests(unittest.TestCase):
         self.assertEqual(len(all_tasks), 1)
         self.assertEqual(all_tasks[0]["urgency_tier"], "important")
 
+    def test_facade_reuses_serialized_tasks_until_they_change(self) -> None:
+        area = self.facade.create_life_area(name="Admin")
+        created = self.facade.create_task(
+            life_area_id=int(area["id"]),
+            title="Process invoices",
+            urgency_tier="normal",
+        )
+
+        cached = self.facade._task_dtos[int(created["id"])]
+        listed = self.facade.list_tasks()[0]
+        self.assertEqual(listed, created)
+        self.assertIs(self.facade._task_dtos[int(created["id"])], cached)
+
+        # Payloads are copies; editing one does not leak into later responses.
+        listed["title"] = "Edited"
+        listed_area = self.facade.list_life_areas()[0]
+        listed_area["interactivity_scores"].clear()
+        self.assertEqual(self.facade.list_tasks()[0]["title"], "Process invoices")
+        self.assertTrue(self.facade.list_life_areas()[0]["interactivity_scores"])
+
+        paused = self.facade.pause_task(task_id=int(created["id"]))
+        self.assertEqual(paused["state"], "waiting")
+        self.assertEqual(created["state"], "runnable")
+        self.assertEqual(self.facade.list_tasks()[0], paused)
+
+        # A query racing the delete can serialize the task after its entry was
+        # pruned; the entry must not be stored again.
+        task = self.scheduler.get_task(int(created["id"]))
+        assert task is not None
+        self.facade.delete_task(task_id=task.task_id)
+        self.assertNotIn(task.task_id, self.facade._task_dtos)
+        self.facade._serialize_task(task)
+        self.assertNotIn(task.task_id, self.facade._task_dtos)
+
+    def test_facade_list_tasks_filters_by_area_urgency_and_state(self) -> None:
+        admin = self.facade.create_life_area(name="Admin")
+        home = self.facade.create_life_area(name="Home")
+        invoices = self.facade.create_task(
+            life_area_id=int(admin["id"]),
+            title="Process invoices",
+            urgency_tier="important",
+        )
+        self.facade.create_task(
+            life_area_id=int(admin["id"]),
+            title="File receipts",
+            urgency_tier="normal",
+        )
+        laundry = self.facade.create_task(
+            life_area_id=int(home["id"]),
+            title="Laundry",
+            urgency_tier="normal",
+        )
+        self.facade.pause_task(task_id=int(laundry["id"]))
+
+        def titles(**filters: object) -> list[str]:
+            return sorted(task["title"] for task in self.facade.list_tasks(**filters))
+
+        self.assertEqual(titles(life_area_id=int(admin["id"])), ["File receipts", "Process invoices"])
+        self.assertEqual(
+            titles(life_area_id=int(admin["id"]), urgency_tier="important"),
+            [invoices["title"]],
+        )
+        self.assertEqual(titles(state="waiting"), ["Laundry"])
+        self.assertEqual(titles(life_area_id=int(home["id"]), state="runnable"), [])
+        self.assertEqual(titles(state="bogus"), [])
+        self.assertEqual(titles(life_area_id=999), [])
+
     def test_facade_life_area_payload_omits_description(self) -> None:
         area = self.facade.create_life_area(name="Focus")
 
@@ -304,6 +413,173 @@ class GuiPlatformTests(unittest.TestCase):
             finally:
                 host_b.stop()
 
+    def test_eventing_notifier_fires_scheduled_notifications_from_one_wheel(self) -> None:
+        notifier = EventingNotifier(self.event_hub)
+        subscriber_id = self.event_hub.subscribe()
+        now = datetime.now(timezone.utc)
+
+        far_id = notifier.schedule_notification(
+            now + timedelta(hours=1),
+            "Focus block ended",
+            NotificationEventType.QUANTUM_EXPIRE,
+        )
+        moved_id = notifier.reschedule_notification(
+            far_id,
+            now,
+            "Focus block ended early",
+            NotificationEventType.QUANTUM_EXPIRE,
+        )
+        self.assertEqual(moved_id, far_id)
+
+        event = self.event_hub.next_event(subscriber_id, timeout_seconds=5)
+        self.assertIsNotNone(event)
+        assert event is not None
+        self.assertEqual(event.message, "Focus block ended early")
+
+    def test_event_hub_mailboxes_drop_when_full_and_wake_blocked_readers(self) -> None:
+        hub = EventHub(subscriber_queue_size=2)
+        subscriber_id = hub.subscribe()
+        for index in range(3):
+            hub.publish(event_type="info", message=f"event {index}")
+
+        self.assertEqual(hub.dropped_event_count, 1)
+        first = hub.next_event(subscriber_id, timeout_seconds=0)
+        second = hub.next_event(subscriber_id, timeout_seconds=0)
+        assert first is not None and second is not None
+        self.assertEqual([first.message, second.message], ["event 0", "event 1"])
+        self.assertIsNone(hub.next_event(subscriber_id, timeout_seconds=0))
+
+        publisher = Thread(target=hub.publish, kwargs={"event_type": "info", "message": "late"})
+        publisher.start()
+        event = hub.next_event(subscriber_id, timeout_seconds=5)
+        publisher.join()
+        assert event is not None
+        self.assertEqual(event.message, "late")
+        self.assertIs(hub.last_event, event)
+
+    def test_event_hub_publishes_a_batch_with_consecutive_ids(self) -> None:
+        hub = EventHub(subscriber_queue_size=2)
+        subscriber_id = hub.subscribe()
+        notifier = EventingNotifier(hub)
+
+        notifier.notify_batch(
+            [
+                ("Tick", NotificationEventType.SCHED_TICK),
+                ("Preempted", NotificationEventType.PREEMPTION),
+                ("Dropped", NotificationEventType.INFO),
+            ]
+        )
+
+        recent = hub.list_recent()
+        self.assertEqual([event.event_id for event in recent], [1, 2, 3])
+        self.assertEqual(recent[1].event_type, "preemption")
+        self.assertEqual(hub.dropped_event_count, 1)
+        first = hub.next_event(subscriber_id, timeout_seconds=0)
+        second = hub.next_event(subscriber_id, timeout_seconds=0)
+        assert first is not None and second is not None
+        self.assertEqual([first.message, second.message], ["Tick", "Preempted"])
+
+    def test_event_hub_history_keeps_the_newest_events_across_wraps(self) -> None:
+        hub = EventHub(history_limit=3, coalesce_window_ms=0)
+        for index in range(5):
+            hub.publish(event_type="info", message=f"event {index}")
+
+        self.assertEqual([event.event_id for event in hub.list_recent()], [3, 4, 5])
+        self.assertEqual([event.event_id for event in hub.list_recent(limit=2)], [4, 5])
+        self.assertEqual(hub.list_recent(limit=0), [])
+        last = hub.last_event
+        assert last is not None
+        self.assertEqual(last.event_id, 5)
+
+        subscriber_id = hub.subscribe(after_event_id=3)
+        replayed = [hub.next_event(subscriber_id, timeout_seconds=0) for _ in range(3)]
+        self.assertEqual([event.event_id if event else None for event in replayed], [4, 5, None])
+
+    def test_event_hub_backlog_replay_is_bounded_by_the_subscriber_queue(self) -> None:
+        hub = EventHub(subscriber_queue_size=2, coalesce_window_ms=0)
+        for index in range(4):
+            hub.publish(event_type="info", message=f"event {index}")
+
+        subscriber_id = hub.subscribe(after_event_id=0)
+        replayed = [hub.next_event(subscriber_id, timeout_seconds=0) for _ in range(3)]
+        self.assertEqual([event.event_id if event else None for event in replayed], [1, 2, None])
+        self.assertEqual(hub.dropped_event_count, 1)
+
+        caught_up = hub.subscribe(after_event_id=99)
+        self.assertIsNone(hub.next_event(caught_up, timeout_seconds=0))
+
+    def test_event_hub_formats_messages_only_when_the_event_is_kept(self) -> None:
+        formatted: list[str] = []
+
+        class _Title:
+            def __str__(self) -> str:
+                formatted.append("title")
+                return "Plan"
+
+        hub = EventHub(history_limit=0)
+        self.assertIsNone(hub.publish(event_type="info", message="Paused '%s'.", message_args=(_Title(),)))
+        self.assertEqual(formatted, [])
+
+        subscriber_id = hub.subscribe()
+        hub.publish(event_type="info", message="Paused '%s'.", message_args=(_Title(),))
+        event = hub.next_event(subscriber_id, timeout_seconds=0)
+        assert event is not None
+        self.assertEqual(event.message, "Paused 'Plan'.")
+        self.assertEqual(formatted, ["title"])
+        self.assertEqual(hub.publish(event_type="info", message="100%").message, "100%")
+
+    def test_event_hub_coalesces_identical_back_to_back_publishes(self) -> None:
+        hub = EventHub(coalesce_window_ms=60_000)
+        subscriber_id = hub.subscribe()
+
+        first = hub.publish(event_type="info", message="Resumed 'Plan'.", related_task_id=1, coalesce=True)
+        repeat = hub.publish(event_type="info", message="Resumed 'Plan'.", related_task_id=1, coalesce=True)
+        other = hub.publish(event_type="info", message="Resumed 'Plan'.", related_task_id=2, coalesce=True)
+
+        self.assertIs(repeat, first)
+        self.assertEqual(hub.coalesced_event_count, 1)
+        self.assertEqual(hub.list_recent(), [first, other])
+        self.assertIs(hub.next_event(subscriber_id, timeout_seconds=0), first)
+        self.assertIs(hub.next_event(subscriber_id, timeout_seconds=0), other)
+        self.assertIsNone(hub.next_event(subscriber_id, timeout_seconds=0))
+
+        self.assertEqual(first.timestamp_iso, first.timestamp.isoformat())
+
+        # Without opting in, genuine repeats (e.g. back-to-back expiries) are kept.
+        repeated = hub.publish(event_type="quantum_expire", message="Focus block ended.")
+        again = hub.publish(event_type="quantum_expire", message="Focus block ended.")
+        self.assertIsNot(again, repeated)
+        self.assertEqual(hub.coalesced_event_count, 1)
+
+        uncoalesced = EventHub(coalesce_window_ms=0)
+        uncoalesced.publish(event_type="info", message="tick", coalesce=True)
+        uncoalesced.publish(event_type="info", message="tick", coalesce=True)
+        self.assertEqual(len(uncoalesced.list_recent()), 2)
+
+    def test_scheduler_event_still_accepts_a_datetime_timestamp(self) -> None:
+        at = datetime(2026, 3, 1, 9, 30, 15, 123456, tzinfo=timezone.utc)
+        event = SchedulerEvent(7, "info", "Planned.", at, related_task_id=2)
+
+        self.assertEqual(event.timestamp, at)
+        self.assertEqual(event.timestamp_ns, 1_772_357_415_123_456_000)
+        self.assertEqual(SchedulerEvent(7, "info", "Planned.", timestamp=at, related_task_id=2), event)
+        self.assertEqual(dataclasses.replace(event, message="Moved.").timestamp, at)
+        with self.assertRaises(TypeError):
+            SchedulerEvent(8, "info", "No time.")
+
+    def test_event_sse_frame_is_encoded_once_and_matches_the_payload(self) -> None:
+        hub = EventHub()
+        event = hub.publish(event_type="info", message="Créé 'Plan'.", related_task_id=3)
+        assert event is not None
+
+        frame = event.sse_frame
+        self.assertIs(event.sse_frame, frame)
+        header, data = frame.decode("utf-8").rstrip("\n").rsplit("\n", 1)
+        self.assertEqual(header, f"id: {event.event_id}\nevent: info")
+        self.assertTrue(data.startswith("data: "))
+        self.assertEqual(json.loads(data[len("data: "):]), event.payload())
+        self.assertTrue(frame.endswith(b"\n\n"))
+
 
 if __name__ == "__main__":
     unittest.main()
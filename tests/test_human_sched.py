@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import importlib.util
 import json
+import pickle
 import tempfile
+import threading
 import unittest
+from unittest import mock
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from human_sched.adapters import time_scale as time_scale_module
+from human_sched.adapters._timing_wheel import TimingWheel
 from human_sched.adapters.time_scale import TimeScaleAdapter, TimeScaleConfig, load_time_scale_config
+from human_sched.application import runtime as runtime_module
 from human_sched.application.runtime import HumanTaskScheduler
 from human_sched.domain.urgency import UrgencyTier
 from human_sched.ports.notifications import NotificationEventType
@@ -140,6 +147,9 @@ class HumanSchedulerTests(unittest.TestCase):
         self.assertIsNotNone(completed)
         assert completed is not None
         self.assertEqual(completed.thread.state, ThreadState.TERMINATED)
+        self.assertNotIn(completed.thread, self.scheduler.scheduler.all_threads)
+        self.assertIn(completed.task_id, self.scheduler.tasks_by_id)
+        self.assertNotIn(completed.task_id, self.scheduler._live_tasks_by_id)
 
     def test_delete_life_area_removes_its_tasks(self) -> None:
         work = self.scheduler.create_life_area("Work")
@@ -163,6 +173,60 @@ class HumanSchedulerTests(unittest.TestCase):
         self.assertEqual(self.scheduler.list_life_areas()[0].life_area_id, home.life_area_id)
         self.assertEqual(len(self.scheduler.list_tasks()), 1)
         self.assertEqual(self.scheduler.list_tasks()[0].task_id, keep_task.task_id)
+        # The deleted thread was first in all_threads; the tail moved into its slot.
+        self.assertEqual(self.scheduler.scheduler.all_threads, [keep_task.thread])
+        self.assertEqual(self.scheduler._thread_index, {keep_task.task_id: 0})
+
+    def test_list_snapshots_are_reused_until_membership_changes(self) -> None:
+        area = self.scheduler.create_life_area("Work")
+        first = self.scheduler.create_task(
+            life_area=area,
+            title="Prepare launch notes",
+            urgency_tier=UrgencyTier.NORMAL,
+        )
+
+        areas = self.scheduler.list_life_areas()
+        tasks = self.scheduler.list_tasks()
+        cached_tasks = self.scheduler._tasks_snapshot
+        self.assertEqual(self.scheduler.list_life_areas(), areas)
+        self.assertIs(self.scheduler._life_areas_snapshot[0], areas[0])
+        seq_before = self.scheduler._dispatch_seq
+        self.assertEqual(self.scheduler.list_tasks(), tasks)
+        # Served from the cached tuple without entering the writer path.
+        self.assertIs(self.scheduler._tasks_snapshot, cached_tasks)
+        self.assertEqual(self.scheduler._dispatch_seq, seq_before)
+
+        # Callers get their own list; mutating it leaves the snapshot intact.
+        tasks.append(first)
+        self.assertEqual(self.scheduler.list_tasks(), [first])
+
+        second = self.scheduler.create_task(
+            life_area=area,
+            title="Tidy backlog",
+            urgency_tier=UrgencyTier.NORMAL,
+        )
+        self.scheduler.create_life_area("Home")
+
+        self.assertEqual(self.scheduler.list_tasks(), [first, second])
+        self.assertEqual(self.scheduler.list_tasks(life_area_id=area.life_area_id), [first, second])
+        self.assertEqual(len(self.scheduler.list_life_areas()), 2)
+
+    def test_interactivity_scores_are_reused_until_a_score_changes(self) -> None:
+        area = self.scheduler.create_life_area("Work")
+
+        scores = area.interactivity_scores()
+        cached = area._scores_cache
+        scores["FIXPRI"] = -1
+        self.assertNotEqual(area.interactivity_scores()["FIXPRI"], -1)
+        self.assertIs(area._scores_cache, cached)
+        scores = area.interactivity_scores()
+
+        clutch = area.thread_group.sched_clutch
+        assert clutch is not None
+        clutch.sc_clutch_groups[0].scbg_interactivity_score += 1
+        refreshed = area.interactivity_scores()
+        self.assertIsNot(refreshed, scores)
+        self.assertEqual(refreshed["FIXPRI"], scores["FIXPRI"] + 1)
 
     def test_delete_task_removes_it_from_scheduler(self) -> None:
         area = self.scheduler.create_life_area("Work")
@@ -186,6 +250,8 @@ class HumanSchedulerTests(unittest.TestCase):
 
         self.assertEqual(deleted.task_id, first.task_id)
         self.assertNotIn(first.task_id, self.scheduler.tasks_by_id)
+        self.assertIsNone(self.scheduler._task_for_tid(first.task_id))
+        self.assertIs(self.scheduler._task_for_tid(second.task_id), second)
         self.assertNotIn(first.task_id, area.task_ids)
         self.assertEqual(len(self.scheduler.list_tasks()), 1)
         self.assertEqual(self.scheduler.list_tasks()[0].task_id, second.task_id)
@@ -391,6 +457,181 @@ class HumanSchedulerTests(unittest.TestCase):
             finally:
                 scheduler_b.close()
 
+    def test_persistence_writes_files_after_releasing_the_lock(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            scheduler = HumanTaskScheduler(
+                notifier=FakeNotifier(),
+                enable_timers=False,
+                persistence_dir=temp_dir,
+            )
+            lock_held: list[bool] = []
+            write_persisted_state = HumanTaskScheduler._write_persisted_state
+
+            def recording_write(self: HumanTaskScheduler, persisted: object) -> None:
+                lock_held.append(self._lock._is_owned())
+                write_persisted_state(self, persisted)
+
+            try:
+                with mock.patch.object(
+                    HumanTaskScheduler,
+                    "_write_persisted_state",
+                    recording_write,
+                ):
+                    area = scheduler.create_life_area("Work")
+                    scheduler.create_task(life_area=area, title="Draft plan")
+            finally:
+                scheduler.close()
+
+            self.assertTrue(lock_held)
+            self.assertFalse(any(lock_held))
+            _, saved = HumanTaskScheduler._read_persisted_rows(Path(temp_dir))
+            self.assertEqual([row["title"] for row in saved], ["Draft plan"])
+
+    def test_persistence_journals_changed_rows_and_replays_them(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            persistence_dir = Path(temp_dir)
+            scheduler_a = HumanTaskScheduler(
+                notifier=FakeNotifier(),
+                enable_timers=False,
+                persistence_dir=temp_dir,
+            )
+            try:
+                area = scheduler_a.create_life_area("Work")
+                kept = scheduler_a.create_task(life_area=area, title="Draft plan")
+                dropped = scheduler_a.create_task(life_area=area, title="Old plan")
+                scheduler_a.delete_task(dropped.task_id)
+                scheduler_a.rename_task(kept.task_id, title="Final plan")
+            finally:
+                scheduler_a.close()
+
+            self.assertEqual(
+                json.loads((persistence_dir / "tasks.json").read_text(encoding="utf-8")),
+                {"generation": 1, "rows": []},
+            )
+            journal = (persistence_dir / "journal.ndjson").read_text(encoding="utf-8")
+            self.assertEqual(len(journal.splitlines()), 4)
+
+            # Force the JSON fallback so the journal has to be replayed.
+            (persistence_dir / "engine_state.pkl").unlink()
+            scheduler_b = HumanTaskScheduler(
+                notifier=FakeNotifier(),
+                enable_timers=False,
+                persistence_dir=temp_dir,
+            )
+            try:
+                self.assertEqual([task.title for task in scheduler_b.list_tasks()], ["Final plan"])
+                # Reloading compacts the journal back into the tables.
+                self.assertFalse((persistence_dir / "journal.ndjson").exists())
+            finally:
+                scheduler_b.close()
+
+    def test_stale_journal_left_by_a_crashed_compaction_is_not_replayed(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            persistence_dir = Path(temp_dir)
+            journal_path = persistence_dir / "journal.ndjson"
+            scheduler_a = HumanTaskScheduler(
+                notifier=FakeNotifier(),
+                enable_timers=False,
+                persistence_dir=temp_dir,
+            )
+            try:
+                area = scheduler_a.create_life_area("Work")
+                kept = scheduler_a.create_task(life_area=area, title="Draft plan")
+                dropped = scheduler_a.create_task(life_area=area, title="Old plan")
+                stale_journal = journal_path.read_bytes()
+
+                # Force the next two writes to compact instead of appending.
+                scheduler_a._journal_bytes = 1 << 40
+                scheduler_a.delete_task(dropped.task_id)
+                scheduler_a._journal_bytes = 1 << 40
+                scheduler_a.rename_task(kept.task_id, title="Final plan")
+            finally:
+                scheduler_a.close()
+
+            # A crash between the table writes and the unlink leaves this behind.
+            journal_path.write_bytes(stale_journal)
+            (persistence_dir / "engine_state.pkl").unlink()
+            _, tasks = HumanTaskScheduler._read_persisted_rows(persistence_dir)
+            self.assertEqual([row["title"] for row in tasks], ["Final plan"])
+
+    def test_persisted_task_rows_are_reused_until_the_task_changes(self) -> None:
+        area = self.scheduler.create_life_area("Work")
+        kept = self.scheduler.create_task(life_area=area, title="Draft plan")
+        renamed = self.scheduler.create_task(life_area=area, title="Old plan")
+
+        first = self.scheduler._snapshot_persisted_state_unlocked().tasks
+        self.scheduler.rename_task(renamed.task_id, title="New plan")
+        second = self.scheduler._snapshot_persisted_state_unlocked().tasks
+
+        rows_a = {row["id"]: row for row in first}
+        rows_b = {row["id"]: row for row in second}
+        self.assertIs(rows_a[kept.task_id], rows_b[kept.task_id])
+        self.assertIsNot(rows_a[renamed.task_id], rows_b[renamed.task_id])
+        self.assertEqual(rows_b[renamed.task_id]["title"], "New plan")
+
+    def test_what_next_only_persists_when_it_dispatches(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            scheduler = HumanTaskScheduler(
+                notifier=FakeNotifier(),
+                enable_timers=False,
+                persistence_dir=temp_dir,
+            )
+            try:
+                area = scheduler.create_life_area("Work")
+                with mock.patch.object(HumanTaskScheduler, "_write_persisted_state") as write:
+                    self.assertIsNone(scheduler.what_next())
+                    self.assertEqual(write.call_count, 0)
+
+                    scheduler.create_task(life_area=area, title="Draft plan")
+                    write.reset_mock()
+                    self.assertIsNotNone(scheduler.what_next())
+                    self.assertEqual(write.call_count, 1)
+                    self.assertIsNotNone(scheduler.what_next())
+                    self.assertEqual(write.call_count, 1)
+            finally:
+                scheduler.close()
+
+    def test_durable_writes_sync_files_and_directory_unless_disabled(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            scheduler = HumanTaskScheduler(
+                notifier=FakeNotifier(),
+                enable_timers=False,
+                persistence_dir=temp_dir,
+            )
+            try:
+                with mock.patch.object(runtime_module.os, "fsync") as fsync:
+                    scheduler.create_life_area("Work")
+                    # Two JSON tables, the engine pickle, and one directory sync.
+                    self.assertEqual(fsync.call_count, 4)
+
+                    fsync.reset_mock()
+                    with mock.patch.object(HumanTaskScheduler, "_DURABLE_WRITES", False):
+                        scheduler.create_life_area("Home")
+                    self.assertEqual(fsync.call_count, 0)
+            finally:
+                scheduler.close()
+
+    def test_persistence_debounces_writes_until_flushed(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with mock.patch.object(runtime_module, "_PERSIST_DEBOUNCE_US", 60_000_000):
+                scheduler = HumanTaskScheduler(
+                    notifier=FakeNotifier(),
+                    enable_timers=True,
+                    persistence_dir=temp_dir,
+                )
+                try:
+                    tasks_path = Path(temp_dir) / "tasks.json"
+                    area = scheduler.create_life_area("Work")
+                    for title in ("Draft plan", "Review plan", "Ship plan"):
+                        scheduler.create_task(life_area=area, title=title)
+                    self.assertFalse(tasks_path.exists())
+
+                    scheduler.flush_persistence()
+                    saved = json.loads(tasks_path.read_text(encoding="utf-8"))
+                    self.assertEqual(len(saved["rows"]), 3)
+                finally:
+                    scheduler.close()
+
     def test_persistence_loads_legacy_life_area_description_field(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             life_areas_path = Path(temp_dir) / "life_areas.json"
@@ -445,6 +686,172 @@ class HumanSchedulerTests(unittest.TestCase):
             "Expected missed-quantum keep-running notification",
         )
 
+    def test_catch_up_and_snapshot_flushes_what_the_catch_up_queued(self) -> None:
+        area = self.scheduler.create_life_area("Health")
+        self.scheduler.create_task(
+            life_area=area,
+            title="Workout",
+            urgency_tier=UrgencyTier.NORMAL,
+        )
+        self.assertIsNotNone(self.scheduler.what_next())
+        self.notifier.immediate.clear()
+        seq_before = self.scheduler._dispatch_seq
+
+        self.clock.advance_hours(2.0)
+        now_us = self.scheduler.catch_up_and_snapshot(lambda now: now)
+
+        self.assertEqual(now_us, self.time_scale.now_scheduler_us())
+        self.assertEqual(self.scheduler._dispatch_seq, seq_before + 2)
+        self.assertTrue(any("Keep going on" in msg for msg, _ in self.notifier.immediate))
+
+    def test_create_existing_life_area_does_not_wait_for_writers(self) -> None:
+        area = self.scheduler.create_life_area("Work")
+        held = threading.Event()
+        release = threading.Event()
+
+        def hold_lock() -> None:
+            with self.scheduler._lock:
+                held.set()
+                release.wait(5)
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        try:
+            self.assertTrue(held.wait(5))
+            again = self.scheduler.create_life_area("  work ")
+        finally:
+            release.set()
+            holder.join()
+
+        self.assertIs(again, area)
+
+    def test_what_next_for_running_task_does_not_wait_for_writers(self) -> None:
+        area = self.scheduler.create_life_area("Work")
+        self.scheduler.create_task(
+            life_area=area,
+            title="Write report",
+            urgency_tier=UrgencyTier.NORMAL,
+        )
+        first = self.scheduler.what_next()
+        assert first is not None
+
+        held = threading.Event()
+        release = threading.Event()
+
+        def hold_lock() -> None:
+            with self.scheduler._lock:
+                held.set()
+                release.wait(5)
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        try:
+            self.assertTrue(held.wait(5))
+            self.clock.advance_hours(0.1)
+            again = self.scheduler.what_next()
+        finally:
+            release.set()
+            holder.join()
+
+        assert again is not None
+        self.assertIs(again.task, first.task)
+        self.assertEqual(again.reason, "Task already running; focus block still active.")
+        self.assertAlmostEqual(again.focus_block_hours, first.focus_block_hours - 0.1, places=6)
+
+    def test_scheduler_log_bookmarks_backfill_from_legacy_state(self) -> None:
+        area = self.scheduler.create_life_area("Work")
+        self.scheduler.create_task(life_area=area, title="Draft")
+        dispatch = self.scheduler.what_next()
+        assert dispatch is not None
+
+        engine = self.scheduler.scheduler
+        self.assertEqual(dispatch.reason, engine.last_select_trace)
+        self.assertEqual(engine.processor_switch_count, len(engine.processor_switch_log))
+
+        legacy = engine.__getstate__()
+        for key in (
+            "select_trace_count",
+            "last_select_trace",
+            "processor_switch_count",
+            "last_switch_reason",
+            "last_switch_timestamp",
+        ):
+            legacy.pop(key)
+        restored = type(engine).__new__(type(engine))
+        restored.__setstate__(legacy)
+
+        self.assertEqual(restored.select_trace_count, engine.select_trace_count)
+        self.assertEqual(restored.last_select_trace, engine.last_select_trace)
+        self.assertEqual(restored.processor_switch_count, engine.processor_switch_count)
+        self.assertEqual(restored.last_switch_reason, engine.last_switch_reason)
+        self.assertEqual(restored.last_switch_timestamp, engine.last_switch_timestamp)
+
+    def test_scheduler_logs_are_bounded_and_expose_recent_tail(self) -> None:
+        engine = self.scheduler.scheduler
+        engine.set_log_maxlen(3)
+        for timestamp in range(5):
+            engine._trace(timestamp, f"event {timestamp}")
+
+        self.assertEqual(len(engine.trace_log), 3)
+        self.assertEqual(
+            engine.recent_trace(2),
+            [f"[{3:>10}us] event 3", f"[{4:>10}us] event 4"],
+        )
+        self.assertEqual(len(engine.recent_trace(10)), 3)
+        self.assertEqual(engine.recent_switches(5), list(engine.processor_switch_log))
+
+    def test_what_next_into_refills_caller_dispatch(self) -> None:
+        area = self.scheduler.create_life_area("Work")
+        self.scheduler.create_task(life_area=area, title="Draft")
+        first = self.scheduler.what_next()
+        assert first is not None
+
+        out = first.snapshot()
+        self.assertIsNot(out, first)
+        self.clock.advance_hours(0.25)
+        result = self.scheduler.what_next_into(out)
+
+        self.assertIs(result, out)
+        self.assertIs(out.task, first.task)
+        self.assertAlmostEqual(out.focus_block_hours, first.focus_block_hours - 0.25, places=6)
+
+    def test_quantum_timer_ignores_stale_generations(self) -> None:
+        area = self.scheduler.create_life_area("Work")
+        self.scheduler.create_task(life_area=area, title="Draft")
+        self.scheduler.create_task(life_area=area, title="Review")
+        self.assertIsNotNone(self.scheduler.what_next())
+        generation = self.scheduler._quantum_generation
+
+        self.scheduler._on_quantum_timer(generation - 1)
+        self.assertEqual(self.notifier.immediate, [])
+
+        self.scheduler._on_quantum_timer(generation)
+        self.assertEqual(len(self.notifier.immediate), 1)
+        self.assertEqual(self.notifier.immediate[0][1], NotificationEventType.QUANTUM_EXPIRE)
+
+    def test_notifications_are_delivered_in_one_batch_after_the_lock(self) -> None:
+        scheduler = self.scheduler
+        batches: list[tuple[bool, list[str]]] = []
+
+        class BatchingNotifier(FakeNotifier):
+            def notify_batch(self, notifications) -> None:
+                writer_active = bool(scheduler._dispatch_seq & 1)
+                batches.append((writer_active, [message for message, _ in notifications]))
+
+        scheduler.notifier = BatchingNotifier()
+        area = scheduler.create_life_area("Work")
+        scheduler.create_task(life_area=area, title="Draft")
+        scheduler.create_task(life_area=area, title="Review")
+        self.assertIsNotNone(scheduler.what_next())
+
+        self.clock.advance_hours(2.0)
+        self.assertIsNotNone(scheduler.what_next())
+
+        self.assertEqual(len(batches), 1)
+        writer_active, messages = batches[0]
+        self.assertFalse(writer_active)
+        self.assertTrue(messages)
+
     def test_time_scale_config_loading(self) -> None:
         with tempfile.NamedTemporaryFile("w", delete=False) as f:
             f.write("TIME_SCALE_HOURS_PER_US=0.001\n")
@@ -455,6 +862,86 @@ class HumanSchedulerTests(unittest.TestCase):
         self.assertEqual(config.hours_per_us, 0.001)
         self.assertEqual(config.max_catchup_ticks, 7)
 
+    def test_time_scale_config_reparses_only_when_the_env_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            env_path = Path(temp_dir) / ".env"
+            env_path.write_text("MAX_CATCHUP_TICKS=9\n", encoding="utf-8")
+            self.assertEqual(load_time_scale_config(str(env_path)).max_catchup_ticks, 9)
+            cached = time_scale_module._ENV_CACHE[str(env_path)]
+            self.assertEqual(load_time_scale_config(str(env_path)).max_catchup_ticks, 9)
+            self.assertIs(time_scale_module._ENV_CACHE[str(env_path)], cached)
+
+            parsed = time_scale_module.read_env_file(str(env_path))
+            parsed["MAX_CATCHUP_TICKS"] = "1"
+            self.assertEqual(load_time_scale_config(str(env_path)).max_catchup_ticks, 9)
+
+            env_path.write_text("MAX_CATCHUP_TICKS=11\n", encoding="utf-8")
+            self.assertEqual(load_time_scale_config(str(env_path)).max_catchup_ticks, 11)
+            self.assertEqual(list(Path(temp_dir).iterdir()), [env_path])
+
+            env_path.unlink()
+            self.assertEqual(load_time_scale_config(str(env_path)).max_catchup_ticks, 4)
+
+    @unittest.skipIf(importlib.util.find_spec("numpy") is None, "numpy is not installed")
+    def test_time_scale_batch_conversions_match_scalar_paths(self) -> None:
+        import numpy as np
+        scheduler_us = [0, 1, 4000, 123_456]
+        walls = self.time_scale.scheduler_us_to_walls(scheduler_us)
+        for value, wall in zip(scheduler_us, walls.tolist()):
+            self.assertEqual(
+                wall.replace(tzinfo=timezone.utc),
+                self.time_scale.scheduler_us_to_wall(value),
+            )
+        round_trip = self.time_scale.scheduler_us_for_walls(walls)
+        self.assertEqual(round_trip.tolist(), scheduler_us)
+        self.assertEqual(
+            self.time_scale.scheduler_us_for_walls(np.array(["2025-12-31T00:00"], dtype="datetime64[us]")).tolist(),
+            [0],
+        )
+
+    def test_time_scale_adapter_pickle_round_trip(self) -> None:
+        restored = pickle.loads(pickle.dumps(self.time_scale))
+        self.assertEqual(restored.config, self.time_scale.config)
+        self.assertEqual(restored.wall_epoch, self.time_scale.wall_epoch)
+        self.assertEqual(restored.scheduler_us_to_wall(4000), self.time_scale.scheduler_us_to_wall(4000))
+
+        legacy = TimeScaleAdapter.__new__(TimeScaleAdapter)
+        legacy.__setstate__(
+            {"_config": self.time_scale.config, "_wall_epoch": self.time_scale.wall_epoch},
+        )
+        self.assertEqual(legacy.wall_epoch, self.time_scale.wall_epoch)
+
+    def test_time_scale_delay_until_scheduler_us_matches_wall_conversion(self) -> None:
+        self.clock.advance_hours(0.5)
+        target_us = self.time_scale.hours_to_us(2.0)
+        expected = self.time_scale.scheduler_us_to_wall(target_us) - self.clock.now()
+
+        delay_us = self.time_scale.delay_us_from_scheduler_us(target_us)
+
+        self.assertEqual(delay_us, expected // timedelta(microseconds=1))
+        self.assertLess(self.time_scale.delay_us_from_scheduler_us(0), 0)
+
+    def test_system_clock_time_scale_keeps_wall_time_and_monotonic_delays(self) -> None:
+        time_scale = TimeScaleAdapter(TimeScaleConfig(hours_per_us=1 / 3_600_000_000))
+        now_us = time_scale.now_scheduler_us()
+        wall_ns = time_scale_module.time.time_ns()
+        mono_ns = time_scale_module.time.monotonic_ns()
+
+        # A wall-clock step after the reading does not stretch the delay.
+        with mock.patch.object(time_scale_module.time, "time_ns", return_value=wall_ns - 3_600_000_000_000):
+            delay_us = time_scale.delay_us_from_scheduler_us(now_us + 1_000_000)
+        self.assertLessEqual(delay_us, 1_000_000)
+        self.assertGreater(delay_us, 0)
+
+        # Scheduler time follows the wall clock while monotonic time stands still (suspend).
+        with (
+            mock.patch.object(time_scale_module.time, "time_ns", return_value=wall_ns + 3_600_000_000_000),
+            mock.patch.object(time_scale_module.time, "monotonic_ns", return_value=mono_ns),
+        ):
+            resumed_us = time_scale.now_scheduler_us()
+            self.assertEqual(time_scale.delay_us_from_scheduler_us(resumed_us), 0)
+        self.assertGreaterEqual(resumed_us, now_us + 3_600_000_000)
+
     def test_change_urgency_runnable_task_moves_to_higher_bucket(self) -> None:
         area = self.scheduler.create_life_area("Work")
         task = self.scheduler.create_task(
@@ -572,5 +1059,107 @@ class HumanSchedulerTests(unittest.TestCase):
         self.assertEqual(result.thread.base_pri, old_base)
 
 
+class TimingWheelTests(unittest.TestCase):
+    def test_fires_due_timers_across_levels_and_skips_cancelled(self) -> None:
+        wheel = TimingWheel(tick_ms=1, wheel_size=4, levels=3)
+        worker = threading.Thread(target=wheel.run, daemon=True)
+        worker.start()
+        fired: list[str] = []
+        done = threading.Event()
+
+        def _record(label: str) -> None:
+            fired.append(label)
+            if label == "far":
+                done.set()
+
+        try:
+            wheel.schedule(2_000_000, _record, "near")
+            cancelled = wheel.schedule(5_000_000, _record, "cancelled")
+            # 30 ticks on a 4-slot wheel must cascade down from level 2.
+            wheel.schedule(30_000_000, _record, "far")
+            self.assertTrue(wheel.cancel(cancelled))
+            self.assertFalse(wheel.cancel(cancelled))
+
+            self.assertTrue(done.wait(timeout=5.0))
+            self.assertEqual(fired, ["near", "far"])
+            self.assertEqual(wheel.pending_count, 0)
+        finally:
+            wheel.stop()
+            worker.join(timeout=1.0)
+
+    def test_worker_sleeps_until_the_next_occupied_slot_or_wrap(self) -> None:
+        wheel = TimingWheel(tick_ms=60_000, wheel_size=8, levels=2)
+        self.assertEqual(wheel._next_event_tick(), 8)
+
+        # Deadlines round up to whole ticks; stay just under the third.
+        wheel.schedule(3 * 60_000_000_000 - 1_000_000_000, lambda: None)
+        self.assertEqual(wheel._next_event_tick(), 3)
+
+        far = TimingWheel(tick_ms=60_000, wheel_size=8, levels=2)
+        # Parked on level 1; the wrap at tick 8 is the earliest it can cascade.
+        far.schedule(20 * 60_000_000_000, lambda: None)
+        self.assertEqual(far._next_event_tick(), 8)
+
+    def test_reschedule_moves_pending_timer_in_place(self) -> None:
+        wheel = TimingWheel(tick_ms=1, wheel_size=4, levels=3)
+        worker = threading.Thread(target=wheel.run, daemon=True)
+        worker.start()
+        fired: list[str] = []
+        done = threading.Event()
+
+        def _record(label: str) -> None:
+            fired.append(label)
+            done.set()
+
+        try:
+            node = wheel.schedule(60_000_000_000, _record, "stale")
+            self.assertTrue(wheel.reschedule(node, 2_000_000, "moved"))
+            self.assertEqual(wheel.pending_count, 1)
+
+            self.assertTrue(done.wait(timeout=5.0))
+            self.assertEqual(fired, ["moved"])
+            self.assertFalse(wheel.reschedule(node, 2_000_000, "again"))
+        finally:
+            wheel.stop()
+            worker.join(timeout=1.0)
+
+    def test_first_timer_after_a_long_idle_skips_the_idle_ticks(self) -> None:
+        wheel = TimingWheel(tick_ms=50, wheel_size=512, levels=4)
+        idle_ticks = 24 * 3600 * 20
+        # Pretend the wheel was built a day ago and has been empty since.
+        wheel._start_ns -= idle_ticks * 50_000_000
+
+        node = wheel.schedule(100_000_000, lambda: None)
+        self.assertGreaterEqual(wheel._current_tick, idle_ticks)
+        self.assertLessEqual(node.deadline_tick - wheel._current_tick, 3)
+
+        wheel.cancel(node)
+        wheel._start_ns -= idle_ticks * 50_000_000
+        node = wheel.schedule(60_000_000_000, lambda: None)
+        wheel._start_ns -= idle_ticks * 50_000_000
+        self.assertTrue(wheel.reschedule(node, 100_000_000))
+        self.assertGreaterEqual(wheel._current_tick, 3 * idle_ticks)
+        self.assertLessEqual(node.deadline_tick - wheel._current_tick, 3)
+
+    def test_failing_callback_does_not_stop_later_timers(self) -> None:
+        wheel = TimingWheel(tick_ms=1, wheel_size=4, levels=3)
+        worker = threading.Thread(target=wheel.run, daemon=True)
+        worker.start()
+        done = threading.Event()
+
+        def _fail() -> None:
+            raise OSError("disk full")
+
+        try:
+            with self.assertLogs("human_sched.adapters._timing_wheel", level="ERROR"):
+                wheel.schedule(1_000_000, _fail)
+                wheel.schedule(10_000_000, done.set)
+                self.assertTrue(done.wait(timeout=5.0))
+            self.assertTrue(worker.is_alive())
+        finally:
+            wheel.stop()
+            worker.join(timeout=1.0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -12,6 +12,8 @@ This is the central coordinator that the simulation engine calls.
 
 from __future__ import annotations
 
+from collections import deque
+from itertools import islice
 from typing import TYPE_CHECKING
 
 from .constants import (
@@ -59,20 +61,37 @@ class Scheduler:
         "trace_enabled",
         "trace_log",
         "processor_switch_log",
+        # O(1) bookmarks so callers need not rescan the logs
+        "select_trace_count",
+        "last_select_trace",
+        "processor_switch_count",
+        "last_switch_reason",
+        "last_switch_timestamp",
         "_pending_preemption_reason",
         "_bound_runqs",
         # Callbacks for simulation engine
         "_on_preemption",
     )
 
-    def __init__(self, pset: ProcessorSet, trace: bool = False) -> None:
+    def __init__(
+        self,
+        pset: ProcessorSet,
+        trace: bool = False,
+        log_maxlen: int | None = None,
+    ) -> None:
         self.pset = pset
         self.current_tick: int = 0
         self.all_threads: list[Thread] = []
         self.all_thread_groups: list = []
         self.trace_enabled = trace
-        self.trace_log: list[str] = []
-        self.processor_switch_log: list[str] = []
+        # Unbounded by default so simulation runs keep their full history.
+        self.trace_log: deque[str] = deque(maxlen=log_maxlen)
+        self.processor_switch_log: deque[str] = deque(maxlen=log_maxlen)
+        self.select_trace_count: int = 0
+        self.last_select_trace: str | None = None
+        self.processor_switch_count: int = 0
+        self.last_switch_reason: str | None = None
+        self.last_switch_timestamp: int | None = None
         self._pending_preemption_reason: dict[int, str] = {}
         self._bound_runqs: list[StablePriorityQueue[Thread]] = [
             StablePriorityQueue(lambda t: t.sched_pri)
@@ -80,10 +99,31 @@ class Scheduler:
         ]
         self._on_preemption = None
 
+    def set_log_maxlen(self, maxlen: int | None) -> None:
+        """Re-bound trace and switch logs, keeping their most recent entries."""
+        self.trace_log = deque(self.trace_log, maxlen=maxlen)
+        self.processor_switch_log = deque(self.processor_switch_log, maxlen=maxlen)
+
+    def recent_trace(self, count: int) -> list[str]:
+        """Return up to ``count`` most recent trace lines, oldest first."""
+        return _log_tail(self.trace_log, count)
+
+    def recent_switches(self, count: int) -> list[str]:
+        """Return up to ``count`` most recent processor switches, oldest first."""
+        return _log_tail(self.processor_switch_log, count)
+
     def _trace(self, timestamp: int, msg: str) -> None:
         if self.trace_enabled:
             self.trace_log.append(f"[{timestamp:>10}us] {msg}")
 
+    def _trace_select(self, timestamp: int, msg: str) -> None:
+        """Trace a thread_select decision and bookmark it as the latest one."""
+        if self.trace_enabled:
+            line = f"[{timestamp:>10}us] {msg}"
+            self.trace_log.append(line)
+            self.select_trace_count += 1
+            self.last_select_trace = line
+
     def _log_processor_switch(
         self,
         timestamp: int,
@@ -100,6 +140,9 @@ class Scheduler:
         self.processor_switch_log.append(
             f"[{timestamp:>10}us] CPU{processor.processor_id}: {old_name} -> {new_name} | reason: {reason}"
         )
+        self.processor_switch_count += 1
+        self.last_switch_reason = reason
+        self.last_switch_timestamp = timestamp
 
     def _set_preemption_reason(self, processor: Processor, reason: str) -> None:
         self._pending_preemption_reason[processor.processor_id] = reason
@@ -395,20 +438,20 @@ class Scheduler:
         # unless a better RT candidate exists.
         if prev_thread is not None and prev_thread.is_realtime:
             if self._rt_prev_thread_can_continue(processor, prev_thread):
-                self._trace(
+                self._trace_select(
                     timestamp,
                     f"Select prev RT: {prev_thread.name} (deadline={prev_thread.rt_deadline})",
                 )
                 return prev_thread, True
 
             if rt_thread is not None:
-                self._trace(
+                self._trace_select(
                     timestamp,
                     f"Select RT: {rt_thread.name} (deadline={rt_thread.rt_deadline})",
                 )
                 return self.rt_runq.dequeue(), False
 
-            self._trace(
+            self._trace_select(
                 timestamp,
                 f"Select prev RT (fallback): {prev_thread.name} (deadline={prev_thread.rt_deadline})",
             )
@@ -416,7 +459,7 @@ class Scheduler:
 
         # Any enqueued RT thread beats non-RT candidates.
         if rt_thread is not None:
-            self._trace(
+            self._trace_select(
                 timestamp,
                 f"Select RT: {rt_thread.name} (deadline={rt_thread.rt_deadline})",
             )
@@ -441,7 +484,7 @@ class Scheduler:
         if clutch_pri > bound_pri:
             if self.clutch_root.scr_thr_count == 0:
                 if prev_thread is not None:
-                    self._trace(
+                    self._trace_select(
                         timestamp,
                         f"Select prev (clutch-pri): {prev_thread.name} (pri={prev_thread.sched_pri})",
                     )
@@ -459,12 +502,12 @@ class Scheduler:
             )
             if clutch_thread is not None:
                 if chose_prev:
-                    self._trace(
+                    self._trace_select(
                         timestamp,
                         f"Select prev: {clutch_thread.name} (pri={clutch_thread.sched_pri})",
                     )
                     return clutch_thread, True
-                self._trace(
+                self._trace_select(
                     timestamp,
                     f"Select TS: {clutch_thread.name} (pri={clutch_thread.sched_pri})",
                 )
@@ -481,7 +524,7 @@ class Scheduler:
             ):
                 if prev_thread is None:
                     return None, False
-                self._trace(
+                self._trace_select(
                     timestamp,
                     f"Select prev bound: {prev_thread.name} (pri={prev_thread.sched_pri})",
                 )
@@ -489,7 +532,7 @@ class Scheduler:
 
             if bound_thread is not None:
                 selected = bound_runq.pop_max()
-                self._trace(
+                self._trace_select(
                     timestamp,
                     f"Select bound: {selected.name} (pri={selected.sched_pri})",
                 )
@@ -497,7 +540,7 @@ class Scheduler:
 
         # XNU line 3351-3354: If runqueue is empty, prev_thread keeps running
         if prev_thread is not None:
-            self._trace(
+            self._trace_select(
                 timestamp,
                 f"Select prev (fallback): {prev_thread.name} (pri={prev_thread.sched_pri})",
             )
@@ -993,6 +1036,29 @@ class Scheduler:
         if is_above_timeshare(thread.th_sched_bucket) or thread.is_realtime:
             self.clutch_root.scr_urgency = max(0, self.clutch_root.scr_urgency - 1)
 
+    def _backfill_log_bookmarks(self) -> None:
+        """Rebuild log bookmarks for snapshots taken before they existed."""
+        self.select_trace_count = 0
+        self.last_select_trace = None
+        for line in self.trace_log:
+            if "] Select " in line:
+                self.select_trace_count += 1
+                self.last_select_trace = line
+
+        self.processor_switch_count = len(self.processor_switch_log)
+        self.last_switch_reason = None
+        self.last_switch_timestamp = None
+        if self.processor_switch_log:
+            last = self.processor_switch_log[-1]
+            head, marker, reason = last.partition(" | reason: ")
+            if marker:
+                self.last_switch_reason = reason
+            if head.startswith("[") and "us]" in head:
+                try:
+                    self.last_switch_timestamp = int(head[1 : head.index("us]")])
+                except ValueError:
+                    pass
+
     def __getstate__(self) -> dict:
         state = {slot: getattr(self, slot) for slot in self.__slots__}
         state["_on_preemption"] = None
@@ -1001,5 +1067,17 @@ class Scheduler:
     def __setstate__(self, state: dict) -> None:
         for slot in self.__slots__:
             setattr(self, slot, state.get(slot))
+        if not isinstance(self.trace_log, deque):
+            self.trace_log = deque(self.trace_log or ())
+        if not isinstance(self.processor_switch_log, deque):
+            self.processor_switch_log = deque(self.processor_switch_log or ())
+        if self.select_trace_count is None:
+            self._backfill_log_bookmarks()
         for runq in self._bound_runqs:
             runq._pri_fn = lambda t: t.sched_pri
+
+
+def _log_tail(log: deque[str], count: int) -> list[str]:
+    if count <= 0:
+        return []
+    return list(islice(log, max(0, len(log) - count), None))